@@ -0,0 +1,44 @@
+class BracketResult:
+
+    def __init__(self, rounds, level_of_randomness, byes=None):
+        """
+        rounds = list of every round of the tournament (first round first), where each round is a list of
+                 (team1, team2, winner) tuples of Team objects in bracket order
+        level_of_randomness = randomness level (1-4) the tournament was simulated with
+        byes = list of Team objects that went straight to the second round (empty for a power of 2 bracket)
+        """
+        self.rounds = rounds
+        self.level_of_randomness = level_of_randomness
+        if byes is None:
+            self.byes = []
+        else:
+            self.byes = byes
+
+    def get_rounds(self):
+        return self.rounds
+
+    def get_level_of_randomness(self):
+        return self.level_of_randomness
+
+    def get_byes(self):
+        return self.byes
+
+    def get_size(self):
+        return len(self.rounds[0]) * 2 + len(self.byes)
+
+    def get_teams_left(self, round_index):
+        """
+        :param: round_index - which round (starting at 0 for the first round)
+
+        :return: number of bracket slots in the round (a first round with byes counts them as slots)
+        """
+        return (len(self.rounds[0]) + len(self.byes)) * 2 >> round_index
+
+    def get_champion(self):
+        return self.rounds[-1][0][2]
+
+    def get_runner_up(self):
+        team1, team2, winner = self.rounds[-1][0]
+        if winner == team1:
+            return team2
+        return team1
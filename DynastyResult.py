@@ -0,0 +1,99 @@
+class DynastyResult:
+
+    def __init__(self, names, division_sizes):
+        """
+        Running totals of every team over a multi-season dynasty. Only these per-team totals (and the current
+        line-up of each division) are kept, so memory doesn't grow with the number of seasons.
+
+        names = every team name (a team's index is its index in names)
+        division_sizes = number of teams in each division (index 0 is the top division)
+        divisions = current line-up of each division as lists of team indices in seed order
+        num_of_seasons = number of seasons played so far
+        division_seasons = teams x divisions counts of seasons each team spent in each division
+        titles = teams x divisions counts of how often each team won each division
+        promotions/relegations = number of times each team went up/down a division
+        tournament_wins = number of end-of-season tournaments each team won
+        points/games = total league points and games of each team
+        total_finish = sum of each team's finishing position in the whole pyramid (1 is the top division's champion)
+        best_finish = best finishing position of each team in the whole pyramid (None until it has played)
+        """
+        self.names = names
+        self.division_sizes = division_sizes
+        self.divisions = []
+        self.num_of_seasons = 0
+        num_of_teams = len(names)
+        self.division_seasons = [[0] * len(division_sizes) for i in range(num_of_teams)]
+        self.titles = [[0] * len(division_sizes) for i in range(num_of_teams)]
+        self.promotions = [0] * num_of_teams
+        self.relegations = [0] * num_of_teams
+        self.tournament_wins = [0] * num_of_teams
+        self.points = [0] * num_of_teams
+        self.games = [0] * num_of_teams
+        self.total_finish = [0] * num_of_teams
+        self.best_finish = [None] * num_of_teams
+
+    def get_names(self):
+        return self.names
+
+    def get_num_of_seasons(self):
+        return self.num_of_seasons
+
+    def get_division_sizes(self):
+        return self.division_sizes
+
+    def get_divisions(self):
+        """
+        :return: current line-up of each division as lists of team names in seed order
+        """
+        return [[self.names[team] for team in division] for division in self.divisions]
+
+    def get_division_seasons(self, team):
+        return self.division_seasons[team]
+
+    def get_titles(self, team):
+        return self.titles[team]
+
+    def get_promotions(self, team):
+        return self.promotions[team]
+
+    def get_relegations(self, team):
+        return self.relegations[team]
+
+    def get_tournament_wins(self, team):
+        return self.tournament_wins[team]
+
+    def get_points(self, team):
+        return self.points[team]
+
+    def get_games(self, team):
+        return self.games[team]
+
+    def get_best_finish(self, team):
+        return self.best_finish[team]
+
+    def get_average_finish(self, team):
+        """
+        :return: average finishing position of the team in the whole pyramid
+        """
+        if self.num_of_seasons == 0:
+            return None
+        return self.total_finish[team] / self.num_of_seasons
+
+    def get_team_index(self, name):
+        return self.names.index(name)
+
+    def add_finish(self, team, division, position, pyramid_position, points, games):
+        """
+        Adds one team's finish in one season to its totals.
+
+        :param: position - finishing position in its division (starting at 1)
+        :param: pyramid_position - finishing position in the whole pyramid (starting at 1)
+        """
+        self.division_seasons[team][division] += 1
+        if position == 1:
+            self.titles[team][division] += 1
+        self.points[team] += points
+        self.games[team] += games
+        self.total_finish[team] += pyramid_position
+        if self.best_finish[team] is None or pyramid_position < self.best_finish[team]:
+            self.best_finish[team] = pyramid_position
@@ -0,0 +1,57 @@
+import numpy as np
+from MatchModel import MatchModel
+
+
+class EloModel(MatchModel):
+
+    def __init__(self, ratings, home_advantage=60, draw_rate=0.28, k_factor=20):
+        """
+        Results come from Elo ratings. The home team's expected score (a win counting 1 and a draw 1/2) is
+            1 / (1 + 10 ** ((away rating - home rating - home_advantage) / 400))
+        Draws are most likely between evenly matched teams: the draw chance is draw_rate * (1 - |2 * expected - 1|),
+        and the rest of the expected score is split into wins so the expected score is unchanged. Scorelines come
+        from the get_score distribution for each result.
+
+        ratings = array of each team's Elo rating
+        home_advantage = rating points added to the home team
+        draw_rate = chance of a draw between two evenly matched teams
+        k_factor = how far ratings move after each game in update
+        """
+        super().__init__(len(ratings))
+        self.ratings = np.array(ratings, dtype=np.float64)
+        self.home_advantage = home_advantage
+        self.draw_rate = draw_rate
+        self.k_factor = k_factor
+
+    def get_ratings(self):
+        return self.ratings
+
+    def expected_score(self, home, away):
+        return 1 / (1 + 10 ** ((self.ratings[away] - self.ratings[home] - self.home_advantage) / 400))
+
+    def probabilities(self, home, away):
+        expected = self.expected_score(home, away)
+        draw = self.draw_rate * (1 - np.abs(2 * expected - 1))
+        home_win = np.clip(expected - draw / 2, 0, 1)
+        away_win = np.clip(1 - expected - draw / 2, 0, 1)
+        return home_win, draw, away_win
+
+    def sample_scores(self, home, away, num_of_seasons, rng):
+        home_win, draw, away_win = self.probabilities(home, away)
+        result = rng.random((num_of_seasons, home_win.size))
+        home_wins = result < home_win
+        draws = ~home_wins & (result < home_win + draw)
+        return self.scores_from_results(home_wins, draws, ~home_wins & ~draws, rng)
+
+    def update(self, home, away, home_goals, away_goals):
+        """
+        Moves the ratings of every team after a batch of played games (standard Elo: k_factor times actual score
+        minus expected score). Games are applied all at once, with the expected scores from before the batch.
+
+        :param: home/away - arrays of team indices
+        :param: home_goals/away_goals - arrays of goals in each game
+        """
+        home_score = (np.sign(np.asarray(home_goals) - np.asarray(away_goals)) + 1) / 2
+        change = self.k_factor * (home_score - self.expected_score(home, away))
+        np.add.at(self.ratings, home, change)
+        np.add.at(self.ratings, away, -change)
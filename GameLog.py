@@ -0,0 +1,135 @@
+from array import array
+from Game import Game
+from profiler import PROFILER
+
+# Result codes stored in the result column
+DRAW = 0
+TEAM1_WIN = 1
+TEAM2_WIN = 2
+
+
+class GameLog:
+
+    def __init__(self, names):
+        """
+        Stores every game of a simulation as columns (one array per field) instead of a pair of Game objects per
+        game. Row r of every column describes game r.
+
+        names = team names, where a team's index in this list is the number stored in the team columns
+        team1/team2 = team indices of both teams
+        team1_goals/team2_goals = number of goals in the game for each team
+        result = DRAW, TEAM1_WIN, or TEAM2_WIN
+        round = round-robin (league games) or tournament round (playoff games) the game was played in
+        matchday = matchday within the round (0 when games aren't organized into matchdays)
+        playoff = 1 for tournament games, 0 for league games
+        team_games/team_playoff_games = rows each team played in, by team index
+        """
+        self.names = names
+        self.team1 = array('i')
+        self.team2 = array('i')
+        self.team1_goals = array('B')
+        self.team2_goals = array('B')
+        self.result = array('B')
+        self.round = array('H')
+        self.matchday = array('H')
+        self.playoff = array('B')
+        self.team_games = [array('i') for _ in names]
+        self.team_playoff_games = [array('i') for _ in names]
+        self.current_round = 0
+        self.current_matchday = 0
+
+    def __len__(self):
+        return len(self.result)
+
+    def get_names(self):
+        return self.names
+
+    def set_round(self, round_num, matchday=0):
+        """
+        Sets the round (and matchday) recorded for every game added after this call.
+        """
+        self.current_round = round_num
+        self.current_matchday = matchday
+
+    def add_game(self, t1, t1_goals, t2, t2_goals, result, playoff=False):
+        """
+        Appends one game to the log and to both teams' lists of rows.
+
+        :param t1/t2: team indices of both teams
+        :param t1_goals/t2_goals: number of goals in the game for each team
+        :param result: DRAW, TEAM1_WIN, or TEAM2_WIN
+        :param playoff: True if tournament game, False otherwise
+
+        :return: row of the new game
+        """
+        row = len(self.result)
+        self.team1.append(t1)
+        self.team2.append(t2)
+        self.team1_goals.append(t1_goals)
+        self.team2_goals.append(t2_goals)
+        self.result.append(result)
+        self.round.append(self.current_round)
+        self.matchday.append(self.current_matchday)
+        self.playoff.append(playoff)
+        if playoff:
+            self.team_playoff_games[t1].append(row)
+            self.team_playoff_games[t2].append(row)
+        else:
+            self.team_games[t1].append(row)
+            self.team_games[t2].append(row)
+        return row
+
+    def get_game(self, row):
+        """
+        Builds a Game object for one row (only done when a game is actually looked at).
+        """
+        if PROFILER.enabled:
+            PROFILER.count("game_objects")
+        t1 = self.names[self.team1[row]]
+        t2 = self.names[self.team2[row]]
+        result = self.result[row]
+        if result == DRAW:
+            winner = "Draw"
+        elif result == TEAM1_WIN:
+            winner = t1
+        else:
+            winner = t2
+        return Game(t1, self.team1_goals[row], t2, self.team2_goals[row], winner)
+
+    def get_team_games(self, index, playoff=False):
+        """
+        :param index: team index
+        :param playoff: True for tournament games, False for league games
+        :return: GameLogView of every game the team played
+        """
+        if playoff:
+            return GameLogView(self, self.team_playoff_games[index])
+        return GameLogView(self, self.team_games[index])
+
+
+class GameLogView:
+
+    def __init__(self, log, rows):
+        """
+        Read-only list-like view of some rows of a GameLog. Games are built as they are accessed.
+
+        log = GameLog the rows belong to
+        rows = array of rows in the view
+        """
+        self.log = log
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.log.get_game(row) for row in self.rows[i]]
+        return self.log.get_game(self.rows[i])
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.log.get_game(row)
+
+    def get_rows(self):
+        return self.rows
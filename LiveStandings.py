@@ -0,0 +1,128 @@
+from array import array
+from bisect import bisect_left, insort
+
+
+class LiveStandings:
+
+    def __init__(self, teams, load=64):
+        """
+        Keeps the league table sorted while games are played instead of sorting it once at the end. Teams are
+        ordered on points, goal difference, goals scored, and goals against (the same order as rank_table without
+        head-to-head), with the better seed first when teams are level on all four.
+
+        The sorted keys are split into buckets of at most 2 * load keys, so moving a team after a result is a
+        binary search over the buckets plus a small insert into one bucket.
+
+        teams = list of Team objects in seed order (a team's position in this list is its id)
+        keys = current sort key of every team, by id
+        buckets = sorted keys, split into short lists
+        maxes = largest key in each bucket
+        ranks = position (starting at 0) of every team after the last completed matchday, by id
+        history = array of ranks for every completed matchday
+        matchdays = (round, matchday) of every history entry
+        """
+        # Copied since the season's own list is sorted into table order at the end
+        self.teams = list(teams)
+        self.load = load
+        self.keys = [self.team_key(team_id) for team_id in range(len(teams))]
+        ordered = sorted(self.keys)
+        self.buckets = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+        self.ranks = array('I', bytes(4 * len(teams)))
+        for position, key in enumerate(ordered):
+            self.ranks[key[-1]] = position
+        self.history = []
+        self.matchdays = []
+
+    def team_key(self, team_id):
+        team = self.teams[team_id]
+        return -team.get_points(), -team.get_gd(), -team.get_gf(), team.get_ga(), team_id
+
+    def update(self, team_id):
+        """
+        Moves a team to its place in the table after its stats changed.
+        """
+        self.remove_key(self.keys[team_id])
+        key = self.team_key(team_id)
+        self.keys[team_id] = key
+        self.insert_key(key)
+
+    def remove_key(self, key):
+        b = bisect_left(self.maxes, key)
+        bucket = self.buckets[b]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self.maxes[b] = bucket[-1]
+        else:
+            del self.buckets[b]
+            del self.maxes[b]
+
+    def insert_key(self, key):
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            return
+        b = min(bisect_left(self.maxes, key), len(self.maxes) - 1)
+        bucket = self.buckets[b]
+        insort(bucket, key)
+        self.maxes[b] = bucket[-1]
+        # Full buckets are split in half so inserts stay short
+        if len(bucket) > 2 * self.load:
+            self.buckets.insert(b + 1, bucket[self.load:])
+            del bucket[self.load:]
+            self.maxes.insert(b, bucket[-1])
+
+    def get_position(self, team_id):
+        """
+        :return: current position (starting at 1) of the team in the table
+        """
+        key = self.keys[team_id]
+        b = bisect_left(self.maxes, key)
+        return sum(len(bucket) for bucket in self.buckets[:b]) + bisect_left(self.buckets[b], key) + 1
+
+    def get_order(self):
+        """
+        :return: list of team ids in current table order
+        """
+        return [key[-1] for bucket in self.buckets for key in bucket]
+
+    def get_snapshot(self):
+        """
+        :return: list of Team objects in current table order
+        """
+        return [self.teams[key[-1]] for bucket in self.buckets for key in bucket]
+
+    def end_matchday(self, round_num, matchday):
+        """
+        Records every team's position once a matchday is complete.
+
+        :return: list of (Team, old position, new position) for every team that moved (positions start at 1)
+        """
+        changes = []
+        ranks = self.ranks
+        position = 0
+        for bucket in self.buckets:
+            for key in bucket:
+                team_id = key[-1]
+                if ranks[team_id] != position:
+                    changes.append((self.teams[team_id], ranks[team_id] + 1, position + 1))
+                    ranks[team_id] = position
+                position += 1
+        self.history.append(array('I', ranks))
+        self.matchdays.append((round_num, matchday))
+        return changes
+
+    def get_matchdays(self):
+        return self.matchdays
+
+    def get_history(self):
+        """
+        :return: list (one entry per completed matchday) of every team's position, by id (positions start at 0)
+        """
+        return self.history
+
+    def get_position_history(self, team_id):
+        """
+        :return: list of the team's position (starting at 1) after every completed matchday
+        """
+        return [ranks[team_id] + 1 for ranks in self.history]
@@ -0,0 +1,63 @@
+import numpy as np
+
+
+class MatchModel:
+
+    def __init__(self, num_of_teams):
+        """
+        Decides how games between teams turn out. Teams are referred to by index, in seed order (index 0 is the 1
+        seed). Every method works on whole arrays of fixtures, so a matchday, a season, or thousands of seasons are
+        sampled with one call instead of one Python call per game. Subclasses implement probabilities and
+        sample_scores.
+
+        num_of_teams = number of teams the model has ratings (or seeds) for
+        """
+        self.num_of_teams = num_of_teams
+
+    def get_num_of_teams(self):
+        return self.num_of_teams
+
+    def probabilities(self, home, away):
+        """
+        :param: home/away - arrays of team indices, one entry per fixture
+
+        :return: home_win, draw, away_win - arrays of each fixture's result probabilities
+        """
+        raise NotImplementedError
+
+    def sample_scores(self, home, away, num_of_seasons, rng):
+        """
+        :param: home/away - arrays of team indices, one entry per fixture
+        :param: num_of_seasons - number of times every fixture is played
+        :param: rng - numpy random Generator
+
+        :return: home_goals, away_goals - seasons x fixtures arrays (int16)
+        """
+        raise NotImplementedError
+
+    def expected_points(self, home, away):
+        """
+        CALLS: probabilities
+
+        :return: home_points, away_points - arrays of each fixture's expected points (3 for a win, 1 for a draw)
+        """
+        home_win, draw, away_win = self.probabilities(home, away)
+        return 3 * home_win + draw, 3 * away_win + draw
+
+    def scores_from_results(self, home_wins, draw, away_wins, rng):
+        """
+        Picks a scoreline for every game from its result with the same score distribution get_score uses.
+
+        CALLS: monte_carlo.draw_scores
+
+        :param: home_wins/draw/away_wins - seasons x fixtures boolean arrays (exactly one is True for each game)
+
+        :return: home_goals, away_goals - seasons x fixtures arrays (int16)
+        """
+        # Imported here since monte_carlo builds its default model from SeedModel
+        from monte_carlo import draw_scores
+
+        winner_goals, loser_goals, draw_goals = draw_scores(home_wins.shape, rng)
+        home_goals = np.where(draw, draw_goals, np.where(home_wins, winner_goals, loser_goals))
+        away_goals = np.where(draw, draw_goals, np.where(away_wins, winner_goals, loser_goals))
+        return home_goals.astype(np.int16), away_goals.astype(np.int16)
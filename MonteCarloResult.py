@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class MonteCarloResult:
+
+    def __init__(self, names, position_counts, points, goal_difference, finishing_order, total_points=None,
+                 total_goal_difference=None):
+        """
+        names = team names in seed order (index 0 is the 1 seed)
+        position_counts = teams x positions matrix counting how often each team finished in each position
+        points = seasons x teams matrix of final points (columns in seed order), None if the seasons weren't kept
+        goal_difference = seasons x teams matrix of final goal difference (columns in seed order), None if the seasons
+                          weren't kept
+        finishing_order = seasons x positions matrix of team indices (finishing_order[s, 0] won season s), None if the
+                          seasons weren't kept
+        total_points/total_goal_difference = each team's points/goal difference added up over every season (summed
+                                             from points/goal_difference when not given)
+        num_of_seasons = number of seasons that were simulated
+        """
+        self.names = names
+        self.position_counts = position_counts
+        self.points = points
+        self.goal_difference = goal_difference
+        self.finishing_order = finishing_order
+        if total_points is None:
+            total_points = points.sum(axis=0, dtype=np.int64)
+        if total_goal_difference is None:
+            total_goal_difference = goal_difference.sum(axis=0, dtype=np.int64)
+        self.total_points = total_points
+        self.total_goal_difference = total_goal_difference
+        # Every season puts each team in exactly one position
+        self.num_of_seasons = int(position_counts[0].sum())
+
+    def get_names(self):
+        return self.names
+
+    def get_num_of_seasons(self):
+        return self.num_of_seasons
+
+    def get_position_counts(self):
+        return self.position_counts
+
+    def get_position_probabilities(self):
+        return self.position_counts / self.num_of_seasons
+
+    def get_points(self):
+        return self.points
+
+    def get_goal_difference(self):
+        return self.goal_difference
+
+    def get_finishing_order(self):
+        return self.finishing_order
+
+    def get_total_points(self):
+        return self.total_points
+
+    def get_total_goal_difference(self):
+        return self.total_goal_difference
+
+    def get_expected_points(self):
+        return self.total_points / self.num_of_seasons
+
+    def get_expected_gd(self):
+        return self.total_goal_difference / self.num_of_seasons
+
+    def get_title_odds(self):
+        return self.get_top_odds(1)
+
+    def get_top_odds(self, positions):
+        """
+        :param positions: how many places at the top of the table count (ex: 4 for a top-4 finish)
+        :return: array (in seed order) of each team's chance to finish in the top [positions]
+        """
+        return self.position_counts[:, :positions].sum(axis=1) / self.num_of_seasons
+
+    def get_bottom_odds(self, positions):
+        """
+        :param positions: how many places at the bottom of the table count (ex: 3 for relegation)
+        :return: array (in seed order) of each team's chance to finish in the bottom [positions]
+        """
+        return self.position_counts[:, -positions:].sum(axis=1) / self.num_of_seasons
+
+    def get_gd_distribution(self, team):
+        """
+        :param team: name of the team
+        :return: dictionary in the format goal difference : probability
+        """
+        self.check_seasons_kept()
+        values, counts = np.unique(self.goal_difference[:, self.names.index(team)], return_counts=True)
+        return {int(gd): count / self.num_of_seasons for gd, count in zip(values, counts)}
+
+    def get_gd_percentiles(self, percentiles=(5, 25, 50, 75, 95)):
+        """
+        :return: percentiles x teams array of goal difference percentiles
+        """
+        self.check_seasons_kept()
+        return np.percentile(self.goal_difference, percentiles, axis=0)
+
+    def check_seasons_kept(self):
+        if self.goal_difference is None:
+            raise ValueError("every season's results are only kept when simulate_seasons is run with keep_seasons=True")
@@ -0,0 +1,63 @@
+import numpy as np
+from MatchModel import MatchModel
+
+
+class PoissonModel(MatchModel):
+
+    def __init__(self, attack, defence, base_goals=1.35, home_advantage=1.1, max_goals=15):
+        """
+        Each team's goals are an independent Poisson draw. The home team's expected goals are
+            base_goals * attack[home] * defence[away] * home_advantage
+        and the away team's are base_goals * attack[away] * defence[home].
+
+        attack = array of each team's attack rating (1 is average, higher scores more)
+        defence = array of each team's defence rating (1 is average, higher concedes more)
+        base_goals = expected goals of an average team against an average team
+        home_advantage = multiplier on the home team's expected goals (1 for none)
+        max_goals = goals above this are ignored when working out exact probabilities (not when sampling)
+        """
+        super().__init__(len(attack))
+        self.attack = np.asarray(attack, dtype=np.float64)
+        self.defence = np.asarray(defence, dtype=np.float64)
+        self.base_goals = base_goals
+        self.home_advantage = home_advantage
+        self.max_goals = max_goals
+
+    def get_attack(self):
+        return self.attack
+
+    def get_defence(self):
+        return self.defence
+
+    def expected_goals(self, home, away):
+        """
+        :return: home_rate, away_rate - arrays of each fixture's expected goals for the home and away team
+        """
+        home_rate = self.base_goals * self.attack[home] * self.defence[away] * self.home_advantage
+        away_rate = self.base_goals * self.attack[away] * self.defence[home]
+        return home_rate, away_rate
+
+    def goal_probabilities(self, rate):
+        """
+        :return: fixtures x (max_goals + 1) array of the chance of scoring each number of goals
+        """
+        pmf = np.empty((rate.size, self.max_goals + 1))
+        pmf[:, 0] = np.exp(-rate)
+        for goals in range(1, self.max_goals + 1):
+            pmf[:, goals] = pmf[:, goals - 1] * rate / goals
+        return pmf
+
+    def probabilities(self, home, away):
+        home_rate, away_rate = self.expected_goals(home, away)
+        # fixtures x home goals x away goals
+        joint = self.goal_probabilities(home_rate)[:, :, None] * self.goal_probabilities(away_rate)[:, None, :]
+        draw = np.trace(joint, axis1=1, axis2=2)
+        home_win = np.tril(joint, -1).sum(axis=(1, 2))
+        # Anything beyond max_goals is counted as an away win, which is too rare to matter
+        return home_win, draw, 1 - home_win - draw
+
+    def sample_scores(self, home, away, num_of_seasons, rng):
+        home_rate, away_rate = self.expected_goals(home, away)
+        home_goals = rng.poisson(home_rate, size=(num_of_seasons, home_rate.size))
+        away_goals = rng.poisson(away_rate, size=(num_of_seasons, away_rate.size))
+        return home_goals.astype(np.int16), away_goals.astype(np.int16)
@@ -0,0 +1,93 @@
+from array import array
+from GameLog import GameLogView
+
+
+class ResultsIndex:
+
+    def __init__(self, final_obj_list):
+        """
+        Indexes the results of a finished simulation once so the results menu never has to scan every team or game.
+
+        teams = dictionary in the format lower-case team name : Team object
+        positions = dictionary in the format team name : final regular season position
+        game_log = shared GameLog of the simulation (None when the teams keep their own lists of Game objects)
+        league_games/playoff_games = with a game_log, dictionaries in the format team index : {opponent index :
+                                     array of the pair's rows in the log}, filled in for a team the first time it
+                                     is looked up (Game objects are only built for the games being looked at);
+                                     otherwise (team name, team name) : list of Game objects, with the pair of
+                                     names in alphabetical order
+        """
+        self.teams = {}
+        self.positions = {}
+        self.league_games = {}
+        self.playoff_games = {}
+        for position, team in enumerate(final_obj_list, start=1):
+            self.teams[team.get_team().casefold()] = team
+            self.positions[team.get_team()] = position
+
+        self.game_log = final_obj_list[0].get_game_log() if final_obj_list else None
+        if self.game_log is None:
+            # Both teams hold every game, so each one is only indexed from its team1's list
+            for team in final_obj_list:
+                for game in team.get_game_list():
+                    if game.get_team1() == team.get_team():
+                        self.add_game(self.league_games, game)
+                for game in team.get_playoff_game_list():
+                    if game.get_team1() == team.get_team():
+                        self.add_game(self.playoff_games, game)
+
+    @staticmethod
+    def pair_key(team1, team2):
+        return min(team1, team2), max(team1, team2)
+
+    def add_game(self, games, game):
+        games.setdefault(self.pair_key(game.get_team1(), game.get_team2()), []).append(game)
+
+    def find_team(self, name):
+        """
+        :param name: team name (any capitalization)
+        :return: Team object, or None if no team has that name
+        """
+        return self.teams.get(name.strip().casefold())
+
+    def get_position(self, team):
+        return self.positions[team.get_team()]
+
+    def get_num_of_teams(self):
+        return len(self.positions)
+
+    def get_games(self, games, team1, team2, playoff):
+        if self.game_log is None:
+            return games.get(self.pair_key(team1.get_team(), team2.get_team()), [])
+        index = team1.get_index()
+        if index not in games:
+            games[index] = self.index_opponents(index, playoff)
+        return GameLogView(self.game_log, games[index].get(team2.get_index(), array('i')))
+
+    def index_opponents(self, index, playoff):
+        """
+        Groups the rows of one team's games in the log by opponent.
+
+        :return: dictionary in the format opponent index : array of rows
+        """
+        log = self.game_log
+        opponents = {}
+        for row in log.get_team_games(index, playoff).get_rows():
+            opponent = log.team2[row] if log.team1[row] == index else log.team1[row]
+            rows = opponents.get(opponent)
+            if rows is None:
+                rows = opponents[opponent] = array('i')
+            rows.append(row)
+        return opponents
+
+    def get_league_games(self, team1, team2):
+        """
+        :return: list (or GameLogView) of every league Game between the two Team objects
+        """
+        return self.get_games(self.league_games, team1, team2, False)
+
+    def get_playoff_games(self, team1, team2):
+        """
+        :return: list (or GameLogView) of every playoff Game between the two Team objects
+        """
+        return self.get_games(self.playoff_games, team1, team2, True)
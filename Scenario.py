@@ -0,0 +1,187 @@
+import numpy as np
+from monte_carlo import count_positions, team_totals
+from ranking import rank_seasons
+from MonteCarloResult import MonteCarloResult
+from SeedModel import SeedModel
+
+
+class Scenario:
+
+    def __init__(self, teams_dictionary, level_of_randomness, played, remaining, num_of_seasons=10000, seed=None,
+                 match_model=None):
+        """
+        A season in progress: results that already happened plus the fixtures that are still to be played. Only
+        the remaining fixtures are simulated, and each one is simulated num_of_seasons times once and then kept, so
+        changing a result (set_result/clear_result) only updates the two teams involved before the table is
+        re-ranked.
+
+        names = team names in seed order (index 0 is the 1 seed)
+        match_model = MatchModel the remaining fixtures are simulated with (SeedModel at level_of_randomness if None)
+        played = list of [home index, away index, home goals, away goals] for every completed game
+        home/away = arrays of team indices of every remaining fixture
+        fixed = dictionary in the format remaining fixture number : (home goals, away goals) for fixtures whose
+                result was set instead of simulated
+        base_pts/base_gf/base_ga = totals of every team from the played (and fixed) games
+        rem_pts/rem_gf/rem_ga = seasons x teams totals from the simulated remaining fixtures (None until simulated)
+        result = MonteCarloResult of the current scenario (None when it has to be re-ranked)
+        """
+        self.names = sorted(teams_dictionary, key=teams_dictionary.get)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.level_of_randomness = level_of_randomness
+        if match_model is None:
+            match_model = SeedModel(len(self.names), level_of_randomness)
+        self.match_model = match_model
+        self.num_of_seasons = num_of_seasons
+        self.seed = seed
+        num_of_teams = len(self.names)
+        self.played = [[self.index[home], self.index[away], home_goals, away_goals]
+                       for home, away, home_goals, away_goals in played]
+        self.home = np.array([self.index[home] for home, away in remaining], dtype=np.intp)
+        self.away = np.array([self.index[away] for home, away in remaining], dtype=np.intp)
+        self.fixed = {}
+        self.base_pts = np.zeros(num_of_teams, dtype=np.int32)
+        self.base_gf = np.zeros(num_of_teams, dtype=np.int32)
+        self.base_ga = np.zeros(num_of_teams, dtype=np.int32)
+        for home, away, home_goals, away_goals in self.played:
+            self.add_base(home, away, home_goals, away_goals, 1)
+        self.rem_pts = self.rem_gf = self.rem_ga = None
+        self.result = None
+
+    def get_names(self):
+        return self.names
+
+    def get_num_of_seasons(self):
+        return self.num_of_seasons
+
+    def get_remaining(self):
+        """
+        :return: list of (home team, away team) of every remaining fixture that hasn't had its result set
+        """
+        return [(self.names[home], self.names[away]) for f, (home, away) in enumerate(zip(self.home, self.away))
+                if f not in self.fixed]
+
+    def add_base(self, home, away, home_goals, away_goals, sign):
+        """
+        Adds (sign 1) or removes (sign -1) one known result from the base totals.
+        """
+        self.base_gf[home] += sign * home_goals
+        self.base_ga[home] += sign * away_goals
+        self.base_gf[away] += sign * away_goals
+        self.base_ga[away] += sign * home_goals
+        if home_goals > away_goals:
+            self.base_pts[home] += sign * 3
+        elif home_goals < away_goals:
+            self.base_pts[away] += sign * 3
+        else:
+            self.base_pts[home] += sign
+            self.base_pts[away] += sign
+
+    def sample_remaining(self):
+        """
+        Simulates every remaining fixture num_of_seasons times with the match model and totals each team's points
+        and goals. Only done once; later changes adjust these totals.
+
+        CALLS: MatchModel.sample_scores, remaining_totals
+        CALLED BY: get_result
+        """
+        rng = np.random.default_rng(self.seed)
+        self.home_goals, self.away_goals = self.match_model.sample_scores(self.home, self.away, self.num_of_seasons,
+                                                                          rng)
+        draw = self.home_goals == self.away_goals
+        self.home_pts = np.where(self.home_goals > self.away_goals, 3, draw).astype(np.int8)
+        self.away_pts = np.where(self.away_goals > self.home_goals, 3, draw).astype(np.int8)
+        self.rem_pts = self.remaining_totals(self.home_pts, self.away_pts)
+        self.rem_gf = self.remaining_totals(self.home_goals, self.away_goals)
+        self.rem_ga = self.remaining_totals(self.away_goals, self.home_goals)
+
+    def remaining_totals(self, home_values, away_values):
+        """
+        Adds up seasons x fixtures values of the remaining fixtures without a set result into seasons x teams totals
+        with one reduceat (see monte_carlo.team_totals). Teams without such a fixture total 0.
+
+        CALLS: monte_carlo.team_totals
+        CALLED BY: sample_remaining
+        """
+        num_of_teams = len(self.names)
+        totals = np.zeros((self.num_of_seasons, num_of_teams), dtype=np.int32)
+        simulated = np.ones(self.home.size, dtype=bool)
+        simulated[list(self.fixed)] = False
+        team_ids = np.concatenate((self.home[simulated], self.away[simulated]))
+        if team_ids.size == 0:
+            return totals
+        game_order = np.argsort(team_ids, kind="stable")
+        playing = np.bincount(team_ids, minlength=num_of_teams) > 0
+        team_starts = np.searchsorted(team_ids[game_order], np.flatnonzero(playing))
+        totals[:, playing] = team_totals(home_values[:, simulated], away_values[:, simulated], game_order,
+                                         team_starts)
+        return totals
+
+    def move_sampled(self, f, sign):
+        """
+        Adds (sign 1) or removes (sign -1) remaining fixture f's simulated results from the simulated totals.
+        """
+        home, away = self.home[f], self.away[f]
+        self.rem_pts[:, home] += sign * self.home_pts[:, f]
+        self.rem_pts[:, away] += sign * self.away_pts[:, f]
+        self.rem_gf[:, home] += sign * self.home_goals[:, f]
+        self.rem_gf[:, away] += sign * self.away_goals[:, f]
+        self.rem_ga[:, home] += sign * self.away_goals[:, f]
+        self.rem_ga[:, away] += sign * self.home_goals[:, f]
+
+    def set_result(self, home, away, home_goals, away_goals):
+        """
+        Fixes the result of a game. The first remaining fixture between home and away that doesn't have a result yet
+        gets this score in every season; if there isn't one, the latest played game between them is changed.
+
+        :param: home/away - names of the home and away team
+        """
+        home, away = self.index[home], self.index[away]
+        for f in range(self.home.size):
+            if self.home[f] == home and self.away[f] == away and f not in self.fixed:
+                if self.rem_pts is not None:
+                    self.move_sampled(f, -1)
+                self.fixed[f] = (home_goals, away_goals)
+                self.add_base(home, away, home_goals, away_goals, 1)
+                self.result = None
+                return
+        for game in reversed(self.played):
+            if game[0] == home and game[1] == away:
+                self.add_base(home, away, game[2], game[3], -1)
+                game[2], game[3] = home_goals, away_goals
+                self.add_base(home, away, home_goals, away_goals, 1)
+                self.result = None
+                return
+        raise ValueError(f"no game between {self.names[home]} (home) and {self.names[away]} (away)")
+
+    def clear_result(self, home, away):
+        """
+        Goes back to simulating the latest remaining fixture between home and away that had its result set.
+        """
+        home, away = self.index[home], self.index[away]
+        for f in sorted(self.fixed, reverse=True):
+            if self.home[f] == home and self.away[f] == away:
+                home_goals, away_goals = self.fixed.pop(f)
+                self.add_base(home, away, home_goals, away_goals, -1)
+                if self.rem_pts is not None:
+                    self.move_sampled(f, 1)
+                self.result = None
+                return
+        raise ValueError(f"no set result between {self.names[home]} (home) and {self.names[away]} (away)")
+
+    def get_result(self):
+        """
+        Ranks every simulated season of the scenario (only re-ranked after a change).
+
+        CALLS: sample_remaining, ranking.rank_seasons, monte_carlo.count_positions
+
+        :return: MonteCarloResult of the final tables
+        """
+        if self.result is None:
+            if self.rem_pts is None:
+                self.sample_remaining()
+            pts = self.rem_pts + self.base_pts
+            gf = self.rem_gf + self.base_gf
+            ga = self.rem_ga + self.base_ga
+            order = rank_seasons(pts, gf, ga)
+            self.result = MonteCarloResult(self.names, count_positions(order), pts, gf - ga, order)
+        return self.result
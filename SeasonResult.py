@@ -0,0 +1,34 @@
+class SeasonResult:
+
+    def __init__(self, standings, rounds, level_of_randomness, live_standings=None):
+        """
+        standings = list of all Team objects in final table order
+        rounds = number of round-robins played
+        level_of_randomness = randomness level (1-4) the season was simulated with
+        live_standings = LiveStandings holding every team's position after every matchday (None if not tracked)
+        """
+        self.standings = standings
+        self.rounds = rounds
+        self.level_of_randomness = level_of_randomness
+        self.live_standings = live_standings
+
+    def get_standings(self):
+        return self.standings
+
+    def get_rounds(self):
+        return self.rounds
+
+    def get_level_of_randomness(self):
+        return self.level_of_randomness
+
+    def get_num_of_teams(self):
+        return len(self.standings)
+
+    def get_champion(self):
+        return self.standings[0]
+
+    def get_games_played(self):
+        return (len(self.standings) - 1) * self.rounds
+
+    def get_live_standings(self):
+        return self.live_standings
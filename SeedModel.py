@@ -0,0 +1,43 @@
+import numpy as np
+from MatchModel import MatchModel
+from odds_tables import league_thresholds
+
+
+class SeedModel(MatchModel):
+
+    def __init__(self, num_of_teams, level_of_randomness):
+        """
+        The simulator's original model: the better seed's chance of a win or draw comes from get_result (by seed
+        difference and level of randomness) and scorelines from the get_score distribution. Home and away make no
+        difference. Sampling uses the same random numbers, in the same order, as play_game's batch equivalent did
+        before models existed, so seeded batch runs are unchanged.
+
+        level_of_randomness = int suggesting how random the games are to be
+        thresholds = array where [seed difference] = (win ceiling, draw ceiling) for the better seed
+        """
+        super().__init__(num_of_teams)
+        self.level_of_randomness = level_of_randomness
+        self.thresholds = np.array(league_thresholds(num_of_teams, level_of_randomness), dtype=np.int16)
+
+    def get_level_of_randomness(self):
+        return self.level_of_randomness
+
+    def probabilities(self, home, away):
+        diffs = np.abs(np.asarray(home) - np.asarray(away))
+        better_win = self.thresholds[diffs, 0] / 100
+        draw = (self.thresholds[diffs, 1] - self.thresholds[diffs, 0]) / 100
+        worse_win = 1 - better_win - draw
+        # The better seed is whichever team has the lower index
+        home_better = np.asarray(home) < np.asarray(away)
+        return np.where(home_better, better_win, worse_win), draw, np.where(home_better, worse_win, better_win)
+
+    def sample_scores(self, home, away, num_of_seasons, rng):
+        diffs = np.abs(np.asarray(home) - np.asarray(away))
+        result = rng.integers(1, 101, size=(num_of_seasons, diffs.size), dtype=np.int16)
+        better_wins = result <= self.thresholds[diffs, 0]
+        draw = ~better_wins & (result <= self.thresholds[diffs, 1])
+        worse_wins = ~better_wins & ~draw
+        home_better = np.asarray(home) < np.asarray(away)
+        home_wins = np.where(home_better, better_wins, worse_wins)
+        away_wins = np.where(home_better, worse_wins, better_wins)
+        return self.scores_from_results(home_wins, draw, away_wins, rng)
@@ -0,0 +1,101 @@
+import hashlib
+import random
+
+
+class SimulationRNG:
+
+    def __init__(self, seed=None, backend="random", spawn_key=(), buffer_size=4096):
+        """
+        Source of random numbers for one simulation. Uniforms are drawn in batches of buffer_size and handed out one
+        at a time, so randint (the call play_game, get_score, and game_simulator make for every random decision) is
+        a list lookup instead of a trip through random.randint. Streams are not shared between threads; use spawn
+        to give each thread (or each part of a simulation) its own.
+
+        seed = master seed (an int); every child stream is derived from it, so the same seed always gives the same
+               numbers
+        backend = "random" (Python's random.Random) or "numpy" (numpy.random.Generator, requires NumPy)
+        spawn_key = tuple of ints naming this stream among the master seed's children (() for the master stream)
+        buffer_size = number of uniforms drawn at a time
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.backend = backend
+        self.spawn_key = tuple(spawn_key)
+        self.buffer_size = buffer_size
+        self.children = 0
+        if backend == "numpy":
+            import numpy as np
+            self.generator = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=self.spawn_key))
+        elif backend == "random":
+            self.generator = random.Random(self.stream_seed())
+        else:
+            raise ValueError(f"unknown random number backend {backend!r} (use 'random' or 'numpy')")
+        self.next_uniform = iter(()).__next__
+
+    def stream_seed(self):
+        """
+        :return: int seed for this stream's random.Random, derived from the master seed and spawn key
+        """
+        if not self.spawn_key:
+            return self.seed
+        digest = hashlib.sha256(repr((self.seed, self.spawn_key)).encode()).digest()
+        return int.from_bytes(digest[:16], "little")
+
+    def get_seed(self):
+        return self.seed
+
+    def get_spawn_key(self):
+        return self.spawn_key
+
+    def refill(self):
+        if self.backend == "numpy":
+            uniforms = self.generator.random(self.buffer_size).tolist()
+        else:
+            draw = self.generator.random
+            uniforms = [draw() for i in range(self.buffer_size)]
+        self.next_uniform = iter(uniforms).__next__
+
+    def random(self):
+        """
+        :return: float in [0, 1) from the buffer
+        """
+        try:
+            return self.next_uniform()
+        except StopIteration:
+            self.refill()
+            return self.next_uniform()
+
+    def randint(self, a, b):
+        """
+        Same interface as random.randint so a SimulationRNG can be passed anywhere an rng is taken.
+
+        :return: int between a and b (inclusive)
+        """
+        try:
+            uniform = self.next_uniform()
+        except StopIteration:
+            self.refill()
+            uniform = self.next_uniform()
+        return a + int(uniform * (b - a + 1))
+
+    def spawn(self, key=None):
+        """
+        Creates an independent child stream. Children are numbered in the order they are spawned unless a key is
+        given, so the same calls on the same seed always give the same streams.
+
+        :param: key - int naming the child (ex: a season number), None for the next unused number
+
+        :return: SimulationRNG with the same master seed and backend
+        """
+        if key is None:
+            key = self.children
+            self.children += 1
+        return SimulationRNG(self.seed, self.backend, self.spawn_key + (key,), self.buffer_size)
+
+    def numpy_generator(self):
+        """
+        :return: numpy.random.Generator for this stream (for the batch simulators, ex: monte_carlo.simulate_seasons)
+        """
+        import numpy as np
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=self.spawn_key))
@@ -0,0 +1,55 @@
+class SimulationTotals:
+
+    def __init__(self, names, seed, num_of_seasons, position_counts, points_sum, champion_counts):
+        """
+        names = team names in seed order (index 0 is the 1 seed)
+        seed = master seed every simulation's random numbers were derived from
+        num_of_seasons = number of seasons that were simulated
+        position_counts = teams x positions matrix counting how often each team finished in each position
+        points_sum = total points of each team over every season (in seed order)
+        champion_counts = number of tournaments each team won (in seed order, all zeros if none were played)
+        """
+        self.names = names
+        self.seed = seed
+        self.num_of_seasons = num_of_seasons
+        self.position_counts = position_counts
+        self.points_sum = points_sum
+        self.champion_counts = champion_counts
+
+    def get_names(self):
+        return self.names
+
+    def get_seed(self):
+        return self.seed
+
+    def get_num_of_seasons(self):
+        return self.num_of_seasons
+
+    def get_position_counts(self):
+        return self.position_counts
+
+    def get_position_probabilities(self):
+        return self.position_counts / self.num_of_seasons
+
+    def get_points_sum(self):
+        return self.points_sum
+
+    def get_expected_points(self):
+        return self.points_sum / self.num_of_seasons
+
+    def get_champion_counts(self):
+        return self.champion_counts
+
+    def get_champion_odds(self):
+        return self.champion_counts / self.num_of_seasons
+
+    def get_title_odds(self):
+        return self.position_counts[:, 0] / self.num_of_seasons
+
+    def __add__(self, other):
+        """
+        Combines the totals of two runs of the same league (ex: shards from different machines).
+        """
+        return SimulationTotals(self.names, self.seed, self.num_of_seasons + other.num_of_seasons,
+                                self.position_counts + other.position_counts, self.points_sum + other.points_sum,
+                                self.champion_counts + other.champion_counts)
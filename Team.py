@@ -8,6 +8,8 @@ class Team:
         ga = goals against
         opponent_list =  list of all teams excluding self/teams seeded higher than self
         game_obj_list = list of all games played
+        game_log = GameLog holding the team's games instead of game_obj_list/playoff_game_list (None if not used)
+        index = the team's index in game_log
         """
         self.team = t
         self.seed = s
@@ -27,6 +29,8 @@ class Team:
         self.playoff_losses = 0
         self.playoff_gf = 0
         self.playoff_ga = 0
+        self.game_log = None
+        self.index = None
 
     def incr_playoff_wins(self):
         self.playoff_wins += 1
@@ -62,6 +66,8 @@ class Team:
         self.playoff_seed = seed
 
     def get_playoff_game_list(self):
+        if self.game_log is not None:
+            return self.game_log.get_team_games(self.index, True)
         return self.playoff_game_list
 
     def add_playoff_game(self, game):
@@ -120,7 +126,19 @@ class Team:
         return self.get_wins()*3 + self.get_draws()*1
 
     def get_game_list(self):
+        if self.game_log is not None:
+            return self.game_log.get_team_games(self.index)
         return self.game_obj_list
 
     def add_game(self, game):
         self.game_obj_list.append(game)
+
+    def get_game_log(self):
+        return self.game_log
+
+    def get_index(self):
+        return self.index
+
+    def set_game_log(self, log, index):
+        self.game_log = log
+        self.index = index
@@ -0,0 +1,277 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from GameLog import GameLog
+from Team import Team
+import main
+from ranking import rank_table
+from team_file import load_teams
+try:
+    # Only on POSIX systems; on Windows the process's peak RSS is left out of the report
+    import resource
+except ImportError:
+    resource = None
+
+# Default parameter grid (see --quick for a smaller one)
+TEAM_COUNTS = [20, 200, 2000, 10000]
+ROUNDS = [1, 5]
+LEVELS = [1, 4]
+
+
+def make_teams_dictionary(num_of_teams):
+    """
+    :return: dictionary in the format team name : seed with num_of_teams teams
+    """
+    return {f"Team {seed}": seed for seed in range(1, num_of_teams + 1)}
+
+
+def make_league(num_of_teams):
+    """
+    Builds Team objects the way simulate_season does (shared GameLog, in seed order).
+
+    :return: list of Team objects in seed order
+    """
+    teams_dictionary = make_teams_dictionary(num_of_teams)
+    game_log = GameLog(list(teams_dictionary))
+    teams = [Team(name, seed) for name, seed in teams_dictionary.items()]
+    for index, team in enumerate(teams):
+        team.set_game_log(game_log, index)
+    return teams
+
+
+def make_played_league(num_of_teams, rounds, level_of_randomness, rng):
+    """
+    :return: list of Team objects that have played a full season (unsorted)
+    """
+    teams = make_league(num_of_teams)
+    for i in range(rounds):
+        main.play_round(teams, level_of_randomness, num_of_teams, rng, i + 1)
+    return teams
+
+
+def measure(benchmark, repeat, memory):
+    """
+    Runs a benchmark repeat times untraced for its timing (the fastest run is reported as seconds) and, if memory is
+    True, once more under tracemalloc for its peak Python allocations (tracing slows code down, so it is never
+    timed). A benchmark with a setup function gets a fresh result of setup before every run, built outside the
+    timing and tracing.
+
+    :param benchmark: function taking no arguments that runs the benchmark and returns how many items it
+                      processed, or a (setup, function) pair where function takes what setup returns
+    :return: dictionary of measurements
+    """
+    if callable(benchmark):
+        setup, function = tuple, benchmark
+    else:
+        setup, function = benchmark
+    times = []
+    cpu_times = []
+    for i in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        items = function(*state)
+        times.append(time.perf_counter() - start)
+        cpu_times.append(time.process_time() - cpu_start)
+    seconds = min(times)
+    record = {"seconds": seconds, "median_seconds": sorted(times)[len(times) // 2], "cpu_seconds": min(cpu_times),
+              "repeat": repeat, "items": items, "items_per_second": items / seconds if seconds > 0 else None}
+    if memory:
+        state = setup()
+        tracemalloc.start()
+        function(*state)
+        record["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    # ru_maxrss is the peak resident set size of the whole benchmark process so far (KB on Linux, bytes on macOS),
+    # not of this benchmark; peak_traced_bytes is the per-benchmark figure
+    if resource is not None:
+        record["process_peak_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return record
+
+
+def league_benchmarks(num_of_teams, rounds, level_of_randomness, seed):
+    """
+    :return: dictionary in the format benchmark name : benchmark to measure (see measure) for one league configuration
+    """
+    games = num_of_teams * (num_of_teams - 1) // 2 * rounds
+
+    def setup_league():
+        return random.Random(seed), make_league(num_of_teams)
+
+    def bench_play_round(rng, teams):
+        for i in range(rounds):
+            main.play_round(teams, level_of_randomness, num_of_teams, rng, i + 1)
+        return games
+
+    def setup_game():
+        return random.Random(seed), make_league(2)
+
+    def bench_get_score(rng, teams):
+        for i in range(games):
+            main.get_score(teams[0], teams[1], False, teams[0], teams[1], rng)
+        return games
+
+    def bench_get_score_draw(rng, teams):
+        for i in range(games):
+            main.get_score(None, None, False, teams[0], teams[1], rng)
+        return games
+
+    played = make_played_league(num_of_teams, rounds, level_of_randomness, random.Random(seed))
+
+    def bench_rank_table():
+        rank_table(played[::-1])
+        return num_of_teams
+
+    def bench_print_table():
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            main.print_table(played, rounds)
+        return num_of_teams
+
+    return {"play_round": (setup_league, bench_play_round), "get_score": (setup_game, bench_get_score),
+            "get_score_draw": (setup_game, bench_get_score_draw), "rank_table": bench_rank_table,
+            "print_table": bench_print_table}
+
+
+def bracket_benchmarks(num_of_teams, bracket_size, level_of_randomness, seed):
+    """
+    :return: dictionary in the format benchmark name : benchmark to measure (see measure) for one bracket configuration
+    """
+    standings = make_league(num_of_teams)
+
+    def bench_generate_bracket():
+        main.generate_bracket(standings, bracket_size)
+        return bracket_size
+
+    def setup_bracket():
+        # Every run needs teams that haven't played the tournament yet
+        return random.Random(seed), main.generate_bracket(make_league(bracket_size), bracket_size)
+
+    def bench_bracket_simulator(rng, bracket):
+        main.bracket_simulator(bracket, level_of_randomness, bracket_size, rng)
+        return bracket_size - 1
+
+    return {"generate_bracket": bench_generate_bracket, "bracket_simulator": (setup_bracket, bench_bracket_simulator)}
+
+
+def file_benchmarks(num_of_teams, directory):
+    """
+    :return: dictionary in the format benchmark name : function to measure for loading a teams file
+    """
+    path = os.path.join(directory, f"teams_{num_of_teams}.txt")
+    with open(path, "w") as file:
+        file.write("\n".join(f"{seed}: {name}" for name, seed in make_teams_dictionary(num_of_teams).items()))
+
+    def bench_load_teams():
+        load_teams(path, num_of_teams)
+        return num_of_teams
+
+    return {"load_teams": bench_load_teams}
+
+
+def run_benchmarks(team_counts, rounds_list, levels, seed, max_games, max_bracket, repeat, memory, log):
+    """
+    Runs every benchmark over the parameter grid. Configurations with more than max_games league games are recorded
+    as skipped instead of run.
+
+    :param log: file to write progress lines to
+    :return: list of result dictionaries
+    """
+    results = []
+
+    def record(name, params, benchmark):
+        log.write(f"{name} {params}\n")
+        log.flush()
+        results.append(dict({"benchmark": name}, **params, **measure(benchmark, repeat, memory)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for num_of_teams in team_counts:
+            for name, benchmark in file_benchmarks(num_of_teams, directory).items():
+                record(name, {"teams": num_of_teams}, benchmark)
+            # Any size works, so the whole league goes into the bracket (byes included) up to max_bracket
+            bracket_size = min(num_of_teams, max_bracket)
+            for level_of_randomness in levels:
+                for name, benchmark in bracket_benchmarks(num_of_teams, bracket_size, level_of_randomness,
+                                                         seed).items():
+                    record(name, {"teams": num_of_teams, "bracket_size": bracket_size,
+                                  "level_of_randomness": level_of_randomness}, benchmark)
+            for rounds in rounds_list:
+                games = num_of_teams * (num_of_teams - 1) // 2 * rounds
+                for level_of_randomness in levels:
+                    params = {"teams": num_of_teams, "rounds": rounds, "level_of_randomness": level_of_randomness}
+                    if games > max_games:
+                        results.append(dict({"benchmark": "league", "skipped": f"{games} games > {max_games}"},
+                                            **params))
+                        continue
+                    for name, benchmark in league_benchmarks(num_of_teams, rounds, level_of_randomness,
+                                                            seed).items():
+                        record(name, params, benchmark)
+    return results
+
+
+def compare(old_results, new_results, threshold):
+    """
+    Prints every benchmark that got slower by more than threshold (ex: 0.1 for 10%) between two JSON reports.
+
+    :return: number of regressions found
+    """
+    def key(result):
+        return tuple(sorted((k, v) for k, v in result.items() if k in ("benchmark", "teams", "rounds",
+                                                                         "level_of_randomness", "bracket_size")))
+
+    old = {key(result): result for result in old_results if "seconds" in result}
+    regressions = 0
+    for result in new_results:
+        if "seconds" in result and key(result) in old:
+            ratio = result["seconds"] / old[key(result)]["seconds"]
+            if ratio > 1 + threshold:
+                regressions += 1
+                print(f"REGRESSION {dict(key(result))}: {ratio:.2f}x slower")
+    return regressions
+
+
+def main_benchmarks(args):
+    parser = argparse.ArgumentParser(description="Time (and measure memory of) every simulation hot path.")
+    parser.add_argument("--teams", type=int, nargs="+", default=TEAM_COUNTS, help="team counts to run")
+    parser.add_argument("--rounds", type=int, nargs="+", default=ROUNDS, help="round-robin counts to run")
+    parser.add_argument("--levels", type=int, nargs="+", default=LEVELS, help="levels of randomness to run")
+    parser.add_argument("--seed", type=int, default=12345, help="seed used by every benchmark")
+    parser.add_argument("--max-games", type=int, default=2_000_000,
+                        help="skip league configurations with more games than this")
+    parser.add_argument("--max-bracket", type=int, default=2048, help="largest bracket size to run")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs of each benchmark (fastest is reported)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--quick", action="store_true", help="small grid (20 and 200 teams, 1 round, level 2)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="JSON report of an earlier run to check for regressions against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown reported as a regression")
+    options = parser.parse_args(args)
+    if options.quick:
+        options.teams, options.rounds, options.levels = [20, 200], [1], [2]
+
+    results = run_benchmarks(options.teams, options.rounds, options.levels, options.seed, options.max_games,
+                             options.max_bracket, options.repeat, not options.no_memory, sys.stderr)
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(), "seed": options.seed,
+                       "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z")},
+              "results": results}
+    if resource is not None:
+        report["meta"]["process_peak_rss_units"] = "bytes" if sys.platform == "darwin" else "KB"
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if options.compare:
+        with open(options.compare) as file:
+            if compare(json.load(file)["results"], results, options.threshold) != 0:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main_benchmarks(sys.argv[1:])
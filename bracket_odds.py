@@ -0,0 +1,91 @@
+from main import bracket_layout, bracket_slots
+from odds_tables import knockout_chances
+
+
+def exact_bracket_odds(bracket_size, level_of_randomness):
+    """
+    Computes every seed's exact chance of reaching each round of the bracket (no sampling). game_simulator's odds
+    only depend on the two playoff seeds, the bracket size, and the level of randomness, so the chance of a seed
+    winning a round is its chance of getting there times the chance it beats each possible opponent from the other
+    half of its block (weighted by that opponent's chance of getting there). Each round compares every seed with
+    the seeds in the block next to it, so the whole table takes O(n^2) work. Empty slots (byes) are never alive, so
+    a team drawn against one always goes through.
+
+    CALLS: bracket_slots, bracket_layout, knockout_chances
+    CALLED BY: run_headless
+
+    :param: bracket_size - number of teams in the bracket (top seeds get byes when it isn't a power of 2)
+    :param: level_of_randomness - int suggesting how random the tournament is to be
+
+    :return: odds - list where odds[seed - 1][r] is the chance that seed reaches round r + 1 (odds[seed - 1][0] is
+             always 1) and odds[seed - 1][-1] is its chance of winning the tournament
+    """
+    chances = [sf / 100 for sf in knockout_chances(bracket_size, level_of_randomness)]
+    slots = bracket_slots(bracket_size)
+    layout = bracket_layout(slots)
+    # reach[i] = chance the seed in bracket slot i is still alive in the current round (0 for an empty slot)
+    reach = [1.0 if seed <= bracket_size else 0.0 for seed in layout]
+    odds = [[1.0] for _ in range(bracket_size)]
+    block = 1
+    while block < slots:
+        next_reach = [0.0] * slots
+        for i in range(slots):
+            seed = layout[i]
+            if seed > bracket_size:
+                continue
+            # Slots of the block this slot's opponent comes from
+            start = (i // block ^ 1) * block
+            # Chance that nobody comes out of the opponent's block (a bye)
+            win_chance = 1.0
+            for j in range(start, start + block):
+                opponent = layout[j]
+                if opponent > bracket_size:
+                    continue
+                win_chance -= reach[j]
+                if seed < opponent:
+                    win_chance += reach[j] * chances[opponent - seed]
+                else:
+                    win_chance += reach[j] * (1 - chances[seed - opponent])
+            next_reach[i] = reach[i] * win_chance
+            odds[seed - 1].append(next_reach[i])
+        reach = next_reach
+        block *= 2
+    return odds
+
+
+def round_names(bracket_size):
+    """
+    :return: list of the names of each column of exact_bracket_odds (ex: ["Semifinals", "Championship", "Champion"])
+    """
+    names = []
+    teams_left = bracket_slots(bracket_size)
+    while teams_left >= 2:
+        if teams_left >= 16:
+            names.append(f"Round of {teams_left}")
+        elif teams_left == 8:
+            names.append("Quarterfinals")
+        elif teams_left == 4:
+            names.append("Semifinals")
+        else:
+            names.append("Championship")
+        teams_left //= 2
+    names.append("Champion")
+    return names
+
+
+def print_bracket_odds(odds, standings):
+    """
+    Prints each bracket team's chance (in %) of reaching every round.
+
+    CALLS: round_names
+    CALLED BY: run_headless
+
+    :param: odds - table returned by exact_bracket_odds
+    :param: standings - final list of all Team objects in descending order of points
+    """
+    names = round_names(len(odds))
+    print("\n       TEAM" + " " * 46 + "".join("{:>16}".format(name) for name in names))
+    print("-" * (57 + 16 * len(names)))
+    for seed, seed_odds in enumerate(odds, start=1):
+        print("{:>3}. {:<50}".format(seed, standings[seed - 1].get_team())
+              + "".join("{:>15.2f}%".format(chance * 100) for chance in seed_odds))
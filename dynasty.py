@@ -0,0 +1,221 @@
+import argparse
+import json
+import sys
+from main import simulate_season, simulate_bracket
+from DynastyResult import DynastyResult
+from SimulationRNG import SimulationRNG
+from team_file import load_teams, TeamFileError
+from render import write_lines
+
+
+def run_dynasty(divisions, num_of_seasons, rounds=2, level_of_randomness=2, promoted=3, bracket_size=0,
+                bracket_randomness=None, rng=None, on_season=None):
+    """
+    Simulates many seasons of a pyramid of divisions. Each season every division plays its league, the top
+    division can play an end-of-season tournament, and then the bottom [promoted] teams of each division swap places
+    with the top [promoted] teams of the division below.
+
+    A team's seed is its strength, and it carries over from season to season: next season's seeds follow this
+    season's finishing order, with teams relegated from above seeded at the top of their new division and teams
+    promoted from below at the bottom. Each season's Team and Game objects are thrown away once its results are
+    added to the DynastyResult totals, so memory doesn't grow with the number of seasons.
+
+    CALLS: main.simulate_season, main.simulate_bracket, play_dynasty_season
+    CALLED BY: run_dynasty_cli
+
+    :param: divisions - list of teams dictionaries ([str(team name) : int(seed)]), top division first
+    :param: num_of_seasons - int
+    :param: rounds - int representing how many round-robins each league season has
+    :param: level_of_randomness - int suggesting how random the leagues are to be
+    :param: promoted - number of teams going up (and down) between each pair of divisions
+    :param: bracket_size - number of top division teams in the end-of-season tournament (0 for no tournament)
+    :param: bracket_randomness - level of randomness for the tournament (defaults to level_of_randomness)
+    :param: rng - source of random numbers (ex: SimulationRNG(seed)), None for a new randomly seeded SimulationRNG
+    :param: on_season - function called with a summary dictionary after every season (None to skip), ex: to log
+            each season's champions without keeping them all in memory
+
+    :return: DynastyResult with every team's totals and the final line-up of each division
+    """
+    names = []
+    seen = set()
+    for teams_dictionary in divisions:
+        for name in sorted(teams_dictionary, key=teams_dictionary.get):
+            if name.casefold() in seen:
+                raise ValueError(f"'{name}' is in more than one division")
+            seen.add(name.casefold())
+            names.append(name)
+    sizes = [len(teams_dictionary) for teams_dictionary in divisions]
+    if min(sizes) < 2:
+        raise ValueError("every division needs at least 2 teams")
+    if promoted < 0:
+        raise ValueError("the number of promoted teams can't be negative")
+    # Middle divisions lose [promoted] teams at both ends, so they need at least twice that many
+    for d, size in enumerate(sizes):
+        ends = (d > 0) + (d < len(sizes) - 1)
+        if promoted * ends > size:
+            raise ValueError(f"division {d + 1} has too few teams to promote and relegate {promoted}")
+    if bracket_size != 0 and not 2 <= bracket_size <= sizes[0]:
+        raise ValueError("bracket size must be between 2 and the number of teams in the top division")
+    if rng is None:
+        rng = SimulationRNG()
+    if bracket_randomness is None:
+        bracket_randomness = level_of_randomness
+
+    result = DynastyResult(names, sizes)
+    start = 0
+    for size in sizes:
+        result.divisions.append(list(range(start, start + size)))
+        start += size
+    for season in range(1, num_of_seasons + 1):
+        summary = play_dynasty_season(result, rounds, level_of_randomness, promoted, bracket_size,
+                                      bracket_randomness, rng)
+        if on_season is not None:
+            summary["season"] = season
+            on_season(summary)
+    return result
+
+
+def play_dynasty_season(result, rounds, level_of_randomness, promoted, bracket_size, bracket_randomness, rng):
+    """
+    Plays one season of every division, adds it to the totals in result, and moves teams between divisions.
+
+    CALLS: main.simulate_season, main.simulate_bracket, DynastyResult.add_finish
+    CALLED BY: run_dynasty
+
+    :return: dictionary summarising the season (champion of each division, tournament champion, and who went up and
+             down)
+    """
+    names = result.get_names()
+    index = {name: team for team, name in enumerate(names)}
+    finishing_orders = []
+    summary = {"champions": [], "tournament_champion": None, "promoted": [], "relegated": []}
+    pyramid_offset = 0
+    for d, division in enumerate(result.divisions):
+        teams_dictionary = {names[team]: seed for seed, team in enumerate(division, start=1)}
+        season = simulate_season(teams_dictionary, rounds, level_of_randomness, rng.spawn())
+        standings = season.get_standings()
+        games = (len(division) - 1) * rounds
+        order = []
+        for position, team in enumerate(standings, start=1):
+            order.append(index[team.get_team()])
+            result.add_finish(order[-1], d, position, pyramid_offset + position, team.get_points(), games)
+        finishing_orders.append(order)
+        summary["champions"].append(standings[0].get_team())
+        if d == 0 and bracket_size != 0:
+            champion = simulate_bracket(standings, bracket_size, bracket_randomness, rng.spawn()).get_champion()
+            result.tournament_wins[index[champion.get_team()]] += 1
+            summary["tournament_champion"] = champion.get_team()
+        pyramid_offset += len(division)
+
+    # Relegated teams are seeded at the top of their new division and promoted teams at the bottom
+    last = len(finishing_orders) - 1
+    new_divisions = []
+    for d, order in enumerate(finishing_orders):
+        top = promoted if d > 0 else 0
+        bottom = len(order) - promoted if d < last else len(order)
+        down_from_above = finishing_orders[d - 1][len(finishing_orders[d - 1]) - promoted:] if d > 0 else []
+        up_from_below = finishing_orders[d + 1][:promoted] if d < last else []
+        new_divisions.append(down_from_above + order[top:bottom] + up_from_below)
+        for team in up_from_below:
+            result.promotions[team] += 1
+        for team in down_from_above:
+            result.relegations[team] += 1
+        summary["promoted"].append([names[team] for team in up_from_below])
+        summary["relegated"].append([names[team] for team in order[bottom:]])
+    result.divisions = new_divisions
+    result.num_of_seasons += 1
+    # The last division has nobody to promote to it
+    summary["promoted"].pop()
+    summary["relegated"].pop()
+    return summary
+
+
+def dynasty_lines(result):
+    """
+    Builds a table of every team's dynasty totals one line at a time, best average pyramid finish first.
+
+    CALLED BY: run_dynasty_cli
+
+    :return: generator of lines (without line breaks)
+    """
+    yield ""
+    yield (f"       {'TEAM':<40} {'SEASONS BY DIVISION':>24} {'TITLES':>8} {'UP':>5} {'DOWN':>5} {'CUPS':>5} "
+           f"{'PPG':>6} {'AVG':>7} {'BEST':>5}")
+    yield "-" * 116
+    teams = sorted(range(len(result.get_names())), key=result.get_average_finish)
+    for rank, team in enumerate(teams, start=1):
+        division_seasons = "/".join(str(seasons) for seasons in result.get_division_seasons(team))
+        points_per_game = result.get_points(team) / max(result.get_games(team), 1)
+        yield (f"{rank:>5}. {result.get_names()[team]:<40} {division_seasons:>24} {result.get_titles(team)[0]:>8} "
+               f"{result.get_promotions(team):>5} {result.get_relegations(team):>5} "
+               f"{result.get_tournament_wins(team):>5} {points_per_game:>6.2f} {result.get_average_finish(team):>7.2f} "
+               f"{result.get_best_finish(team):>5}")
+    yield ""
+    for d, division in enumerate(result.get_divisions(), start=1):
+        yield f"DIVISION {d} NEXT SEASON: " + ", ".join(division)
+
+
+def run_dynasty_cli(args):
+    """
+    Runs a dynasty from command line flags, ex:
+        python dynasty.py --divisions teams championship league_one --seasons 100 --bracket-size 8 --seed 1
+
+    CALLS: team_file.load_teams, run_dynasty, dynasty_lines, render.write_lines
+    CALLED BY: __main__
+
+    :param: args - list of command line arguments (without the program name)
+    """
+    parser = argparse.ArgumentParser(description="Simulate many seasons of a pyramid with promotion and relegation.")
+    parser.add_argument("--divisions", nargs="+", required=True,
+                        help="paths to files of seeded teams, top division first")
+    parser.add_argument("--seasons", type=int, default=100, help="number of seasons")
+    parser.add_argument("--rounds", type=int, default=2, help="number of round-robins each season")
+    parser.add_argument("--randomness", type=int, choices=[1, 2, 3, 4], default=2,
+                        help="level of randomness for the leagues")
+    parser.add_argument("--promoted", type=int, default=3, help="teams promoted/relegated between each division")
+    parser.add_argument("--bracket-size", type=int, default=0,
+                        help="number of top division teams in an end-of-season tournament (0 for none)")
+    parser.add_argument("--bracket-randomness", type=int, choices=[1, 2, 3, 4],
+                        help="level of randomness for the tournament (defaults to --randomness)")
+    parser.add_argument("--seed", type=int, help="master seed for the random number generator")
+    parser.add_argument("--seasons-log", metavar="PATH",
+                        help="write a JSON line summarising every season (champions, promotions, relegations)")
+    parser.add_argument("--output", choices=["table", "json", "none"], default="table",
+                        help="print the totals table, a JSON summary, or nothing")
+    options = parser.parse_args(args)
+    if options.seasons < 1 or options.rounds < 1:
+        parser.error("--seasons and --rounds must be at least 1")
+    if options.seed is not None and options.seed < 0:
+        parser.error("--seed must not be negative")
+    try:
+        divisions = [load_teams(path) for path in options.divisions]
+    except TeamFileError as error:
+        parser.error(str(error))
+
+    rng = SimulationRNG(options.seed)
+    log = open(options.seasons_log, "w", encoding="utf-8") if options.seasons_log else None
+    try:
+        on_season = None if log is None else lambda summary: log.write(json.dumps(summary) + "\n")
+        result = run_dynasty(divisions, options.seasons, options.rounds, options.randomness, options.promoted,
+                             options.bracket_size, options.bracket_randomness, rng, on_season)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        if log is not None:
+            log.close()
+
+    if options.output == "table":
+        write_lines(dynasty_lines(result))
+    elif options.output == "json":
+        teams = [{"team": name, "division_seasons": result.get_division_seasons(team),
+                  "titles": result.get_titles(team), "promotions": result.get_promotions(team),
+                  "relegations": result.get_relegations(team), "tournament_wins": result.get_tournament_wins(team),
+                  "points": result.get_points(team), "games": result.get_games(team),
+                  "average_finish": result.get_average_finish(team), "best_finish": result.get_best_finish(team)}
+                 for team, name in enumerate(result.get_names())]
+        print(json.dumps({"seasons": result.get_num_of_seasons(), "rng_seed": rng.get_seed(), "teams": teams,
+                          "divisions": result.get_divisions()}))
+
+
+if __name__ == '__main__':
+    run_dynasty_cli(sys.argv[1:])
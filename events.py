@@ -0,0 +1,237 @@
+import csv
+import gzip
+import io
+import json
+from GameLog import GameLog, DRAW, TEAM1_WIN
+from SimulationRNG import SimulationRNG
+from main import season_steps, bracket_steps
+from schedule import bye_team
+
+
+class EventBuffer(GameLog):
+
+    def __init__(self, names, keep_games=False):
+        """
+        GameLog for the Team objects of a streamed season. Besides (optionally) storing it, each game becomes an event
+        that is handed out (and forgotten) once its matchday or tournament round is over, so without keep_games the
+        Team objects in a stream only keep their aggregate stats.
+
+        names = team names, where a team's index in this list is its index on its Team object
+        keep_games = True to also store every game in the log (needed to split ties on head-to-head games)
+        pending = events that haven't been handed out yet
+        """
+        super().__init__(names)
+        self.keep_games = keep_games
+        self.pending = []
+
+    def add_game(self, t1, t1_goals, t2, t2_goals, result, playoff=False):
+        if result == DRAW:
+            winner = "Draw"
+        elif result == TEAM1_WIN:
+            winner = self.names[t1]
+        else:
+            winner = self.names[t2]
+        self.pending.append({"event": "game", "round": self.current_round, "matchday": self.current_matchday,
+                             "playoff": bool(playoff), "team1": self.names[t1], "team1_goals": t1_goals,
+                             "team2": self.names[t2], "team2_goals": t2_goals, "winner": winner})
+        if self.keep_games:
+            return super().add_game(t1, t1_goals, t2, t2_goals, result, playoff)
+        return None
+
+    def drain(self):
+        events = self.pending
+        self.pending = []
+        return events
+
+
+def season_events(teams_dictionary, rounds, level_of_randomness, rng=None, bracket_size=0,
+                  bracket_randomness=None, head_to_head=False, match_model=None):
+    """
+    Simulates a season (and optional tournament) as a stream of events, yielding the games of each matchday and
+    tournament round as soon as they are played. The games are played by main.season_steps and main.bracket_steps,
+    so a seeded stream holds the same games as simulate_season and simulate_bracket with the same rng. Only the
+    Team objects' aggregate stats are kept (unless head_to_head needs the games), so memory stays the same no matter
+    how many games are played.
+
+    Events (all dictionaries with an "event" key):
+        game - one game (see EventBuffer.add_game)
+        matchday_completed - every game of a matchday has been played (bye is the team that sat out, or None)
+        round_completed - every game of a round-robin has been played
+        season_completed - final standings (list of dictionaries, in table order)
+        playoff_round_completed - every game of a tournament round has been played
+        tournament_completed - champion and runner-up
+
+    CALLS: main.season_steps, main.bracket_steps, schedule.bye_team
+    CALLED BY: none
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins are to be played
+    :param: level_of_randomness - int suggesting how random the simulation is to be
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed)), None for a new
+            randomly seeded SimulationRNG
+    :param: bracket_size - number of teams in the end-of-season tournament (0 for no tournament)
+    :param: bracket_randomness - level of randomness for the tournament (defaults to level_of_randomness)
+    :param: head_to_head - True to split teams level on points, GD, GF, and GA by their head-to-head games (every
+            league game is then kept in the buffer's GameLog columns until the season is ranked)
+    :param: match_model - MatchModel deciding the league games (None for play_game, see main.simulate_season)
+    """
+    num_of_teams = len(teams_dictionary)
+    if rng is None:
+        rng = SimulationRNG()
+    buffer = EventBuffer(list(teams_dictionary), keep_games=head_to_head)
+    steps = season_steps(teams_dictionary, rounds, level_of_randomness, rng, head_to_head, match_model=match_model,
+                         game_log=buffer)
+    last_round = None
+    while True:
+        try:
+            round_num, matchday = next(steps)
+        except StopIteration as finished:
+            season = finished.value
+            break
+        if last_round is not None and round_num != last_round:
+            yield {"event": "round_completed", "round": last_round}
+        last_round = round_num
+        yield from buffer.drain()
+        bye = bye_team(num_of_teams, matchday - 1)
+        yield {"event": "matchday_completed", "round": round_num, "matchday": matchday,
+               "bye": None if bye is None else buffer.get_names()[bye]}
+    if last_round is not None:
+        yield {"event": "round_completed", "round": last_round}
+
+    standings = season.get_standings()
+    yield {"event": "season_completed",
+           "standings": [{"position": position, "team": team.get_team(), "seed": team.get_seed(),
+                          "wins": team.get_wins(), "draws": team.get_draws(), "losses": team.get_losses(),
+                          "gf": team.get_gf(), "ga": team.get_ga(), "gd": team.get_gd(), "points": team.get_points()}
+                         for position, team in enumerate(standings, start=1)]}
+
+    if bracket_size != 0:
+        if bracket_randomness is None:
+            bracket_randomness = level_of_randomness
+        steps = bracket_steps(standings, bracket_size, bracket_randomness, rng)
+        teams_left = bracket_size
+        round_num = 0
+        while True:
+            try:
+                games = next(steps)
+            except StopIteration as finished:
+                bracket = finished.value
+                break
+            round_num += 1
+            # Teams with a bye go through without a game
+            teams_left -= len(games)
+            yield from buffer.drain()
+            yield {"event": "playoff_round_completed", "round": round_num, "teams_left": teams_left}
+        yield {"event": "tournament_completed", "champion": bracket.get_champion().get_team(),
+               "runner_up": bracket.get_runner_up().get_team()}
+
+
+def open_output(path, compress=None):
+    """
+    Opens a text file for writing, compressed with gzip if asked to or if the path ends in .gz.
+
+    CALLED BY: JsonlSink, CsvSink
+    """
+    if compress or (compress is None and str(path).endswith(".gz")):
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+class JsonlSink:
+
+    def __init__(self, path, compress=None, buffer_size=1 << 16):
+        """
+        Writes events as JSON lines, collecting them in memory and writing them out in large chunks.
+
+        path = file to write to (a .gz path is compressed unless compress is False)
+        buffer_size = number of characters collected before they are written out
+        """
+        self.file = open_output(path, compress)
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.buffered = 0
+
+    def write(self, event):
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        self.chunks.append(line)
+        self.buffered += len(line)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write("".join(self.chunks))
+        self.chunks = []
+        self.buffered = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvSink:
+
+    # Columns of every row. Events without a column leave it blank; standings are written one row per team.
+    COLUMNS = ["event", "round", "matchday", "playoff", "team1", "team1_goals", "team2", "team2_goals", "winner",
+               "position", "team", "seed", "wins", "draws", "losses", "gf", "ga", "gd", "points", "teams_left",
+               "champion", "runner_up", "bye"]
+
+    def __init__(self, path, compress=None, buffer_size=1 << 16):
+        """
+        Writes events as CSV rows, collecting them in memory and writing them out in large chunks.
+
+        path = file to write to (a .gz path is compressed unless compress is False)
+        buffer_size = number of characters collected before they are written out
+        """
+        self.file = open_output(path, compress)
+        self.buffer_size = buffer_size
+        self.chunk = io.StringIO()
+        self.writer = csv.DictWriter(self.chunk, self.COLUMNS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, event):
+        if event["event"] == "season_completed":
+            for row in event["standings"]:
+                self.writer.writerow(dict(row, event="standing"))
+        else:
+            self.writer.writerow(event)
+        if self.chunk.tell() >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.chunk.getvalue())
+        self.chunk.seek(0)
+        self.chunk.truncate()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def stream_to(events, *sinks):
+    """
+    Sends every event to every sink without keeping any of them.
+
+    :param: events - iterable of events (ex: season_events(...))
+    :param: sinks - JsonlSink/CsvSink objects (or anything with a write(event) method)
+
+    :return: the season_completed event (or None if the stream didn't have one)
+    """
+    season = None
+    for event in events:
+        for sink in sinks:
+            sink.write(event)
+        if event["event"] == "season_completed":
+            season = event
+    return season
@@ -1,7 +1,22 @@
+import argparse
+import json
 import random
 import sys
 from Team import Team
 from Game import Game
+from GameLog import GameLog, DRAW, TEAM1_WIN
+from SeasonResult import SeasonResult
+from LiveStandings import LiveStandings
+from SimulationRNG import SimulationRNG
+from BracketResult import BracketResult
+from odds_tables import league_thresholds, knockout_chances
+from score_sampler import sample_draw_goals, sample_win_score
+from ranking import rank_table
+from ResultsIndex import ResultsIndex
+from profiler import PROFILER
+from team_file import load_teams, TeamFileError
+from schedule import round_fixtures
+from render import write_table, write_bracket, page_range
 
 
 def main():
@@ -10,7 +25,7 @@ def main():
     and ensures the file contains unique teams sorted from 1 through num_of_teams. It then prompts for the number of
     round-robins and the level of randomness. The league simulation is initiated with start_season.
 
-    CALLS: team_dictionary_generator, file_validity_checker, start_season
+    CALLS: team_file.load_teams, start_season
     """
     print("\nWELCOME TO THE LEAGUE SIMULATOR!!\n\n")
     num_of_teams = input("Please enter how many teams are in your league (must be greater than 1): ")
@@ -24,26 +39,27 @@ def main():
     file_path = input(f"\nPlease enter an absolute file path to a list of {num_of_teams} seeded teams in order "
                       f"(no quotation marks): ")
     # Ensures that the file exists, has proper seeding, and zero duplicate teams
-    file_valid = file_validity_checker(file_path, num_of_teams)
-    while file_valid is False:
-        print("\nEnter 0 to quit.")
-        file_path = input(f"\nERROR: Please enter a file that has all unique teams sorted 1 through {num_of_teams}. "
-                          f"In the format:"
-                          f"\n1: Team 1"
-                          f"\n2: Team 2\n\n")
-        if file_path == "0":
-            sys.exit(0)
-        file_valid = file_validity_checker(file_path, num_of_teams)
+    # Teams are stored to a dictionary in form team : seed
+    teams_dictionary = None
+    while teams_dictionary is None:
+        try:
+            teams_dictionary = load_teams(file_path, num_of_teams)
+        except TeamFileError as error:
+            print(f"\n{error}")
+            print("\nEnter 0 to quit.")
+            file_path = input(f"\nERROR: Please enter a file that has all unique teams sorted 1 through "
+                              f"{num_of_teams}. In the format:"
+                              f"\n1: Team 1"
+                              f"\n2: Team 2\n\n")
+            if file_path == "0":
+                sys.exit(0)
     print("\n\nRound-Robin: A setup in which each team plays in turn against every other.")
-    rounds = input("\n\nPlease enter how many round-robins you would like to play with these teams (between 1 and 5): ")
+    rounds = input("\n\nPlease enter how many round-robins you would like to play with these teams (at least 1): ")
     # Ensures that an appropriate amount of rounds is entered.
-    while rounds not in ["1", "2", "3", "4", "5"]:
-        rounds = input("\nERROR: Please enter an integer between 1 and 5 (inclusive): ")
+    while not rounds.isdigit() or int(rounds) < 1:
+        rounds = input("\nERROR: Please enter an integer of at least 1: ")
     rounds = int(rounds)
 
-    # Teams initially stored to dictionary in form team : seed
-    teams_dictionary = team_dictionary_generator(file_path)
-
     print("\n- 1: The better seeded teams are heavily favored\n- 2: The better seeded teams are moderately favored\n"
           "- 3: The better seeded teams are slightly favored\n"
           "- 4: Every game is a toss up")
@@ -56,11 +72,10 @@ def main():
 
 def start_season(teams_dictionary, level_of_randomness, num_of_teams, rounds):
     """
-    Initiates the league season simulation. Creates Team objects from the provided dictionary, sets opponents,
-    and plays rounds for the specified number of round-robins. The final standings are then sorted, ties are decided,
-    and the league table is printed.
+    Initiates the league season simulation via simulate_season and prints the league table. The user is then asked
+    about an end-of-season tournament, which is simulated via simulate_bracket and printed.
 
-    CALLS: play_round, sort_final_table, decide_ties, print_table
+    CALLS: simulate_season, print_table, get_teams, simulate_bracket, print_bracket, end_of_sim_menu
     CALLED BY: main
 
     :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
@@ -68,29 +83,7 @@ def start_season(teams_dictionary, level_of_randomness, num_of_teams, rounds):
     :param: num_of_teams - int
     :param: rounds - int representing how many round-robins are to be played
     """
-    # temp_obj_list will hold all team objects without their opponent list filled in
-    temp_obj_list = []
-    for team in teams_dictionary:
-        temp_obj_list.append(Team(team, teams_dictionary[team]))
-
-    # temp_obj_list will hold all team objects WITH their opponent list filled in
-    # NOTE: opponent lists are linear: team 1 holds all other 19 teams, team 2 holds 18 (all but self and team 1)...
-    # To ensure that there are no duplicate matchups
-    final_obj_list = []
-    for i in range(len(temp_obj_list)):
-        team = temp_obj_list[0]
-        temp_obj_list.remove(team)
-        team.set_opponent_list(temp_obj_list.copy())
-        final_obj_list.append(team)
-    temp_obj_list.clear()
-
-    for i in range(rounds):
-        play_round(final_obj_list, level_of_randomness, num_of_teams)
-
-    # Final table is sorted in descending order of final points
-    sort_final_table(final_obj_list, 0, len(final_obj_list) - 1)
-    # Tiebreakers for if teams above are tied on GD
-    decide_ties(final_obj_list)
+    final_obj_list = simulate_season(teams_dictionary, rounds, level_of_randomness).get_standings()
     print_table(final_obj_list, rounds)
     num_of_teams_in_tourney = 0
     tournament = input("\nWould you like to play an end-of-season tournament? Enter 'y' for yes or 'n' for no: ")
@@ -99,7 +92,6 @@ def start_season(teams_dictionary, level_of_randomness, num_of_teams, rounds):
     # Start of end-of-szn tournament
     if tournament.lower() == 'y':
         num_of_teams_in_tourney = get_teams(num_of_teams)
-        bracket = generate_bracket(final_obj_list, num_of_teams_in_tourney)
         print(
             "\n- 1: The better seeded teams are heavily favored\n- 2: The better seeded teams are moderately favored\n"
             "- 3: The better seeded teams are slightly favored\n"
@@ -109,64 +101,206 @@ def start_season(teams_dictionary, level_of_randomness, num_of_teams, rounds):
         while level_of_randomness not in ["1", "2", "3", "4"]:
             level_of_randomness = input("\nERROR. Please enter a number 1 through 4: ")
         # Tournament simulation begins
-        bracket_simulator(bracket, int(level_of_randomness), num_of_teams_in_tourney)
+        print_bracket(simulate_bracket(final_obj_list, num_of_teams_in_tourney, int(level_of_randomness)))
     end_of_sim_menu(final_obj_list, rounds, tournament.lower())
 
 
+def simulate_season(teams_dictionary, rounds, level_of_randomness, rng=None, head_to_head=False,
+                    track_history=False, match_model=None):
+    """
+    Simulates a full league season without any terminal input or output. Creates Team objects from the provided
+    dictionary and plays rounds for the specified number of round-robins, one matchday at a time. The final
+    standings are then ranked with ties decided on GD, GF, and GA.
+
+    CALLS: season_steps, run_steps
+    CALLED BY: start_season, run_headless
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins are to be played
+    :param: level_of_randomness - int suggesting how random the simulation is to be
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed)), None for a new
+            randomly seeded SimulationRNG
+    :param: head_to_head - True to split teams level on points, GD, GF, and GA by their head-to-head games
+    :param: track_history - True to keep a LiveStandings table re-sorted and record every team's position after
+            every matchday
+    :param: match_model - MatchModel (ex: PoissonModel, EloModel) that samples each matchday's games in one batch
+            instead of play_game deciding them one at a time (requires NumPy; None for play_game)
+
+    :return: SeasonResult holding the final standings (and LiveStandings with the position history if tracked)
+    """
+    return run_steps(season_steps(teams_dictionary, rounds, level_of_randomness, rng, head_to_head, track_history,
+                                  match_model))
+
+
+def season_steps(teams_dictionary, rounds, level_of_randomness, rng=None, head_to_head=False, track_history=False,
+                 match_model=None, game_log=None):
+    """
+    Generator version of simulate_season that pauses after every matchday, so the games can be handed out (ex: by
+    events.season_events) while the season is still being played. The parameters are the same as simulate_season.
+
+    CALLS: round_steps, match_generator, rank_table
+    CALLED BY: simulate_season, events.season_events
+
+    :param: game_log - GameLog (or a subclass, ex: events.EventBuffer) every game of the season is stored in (None
+            for a new GameLog)
+
+    :return: generator of (round_num, matchday) after every matchday, returning the SeasonResult once the season is
+             over
+    """
+    num_of_teams = len(teams_dictionary)
+    if rng is None:
+        rng = SimulationRNG()
+    generator = None
+    if match_model is not None:
+        generator = match_generator(rng)
+    with PROFILER.phase("setup"):
+        # Every game of the season (and tournament) is stored in one shared log
+        if game_log is None:
+            game_log = GameLog(list(teams_dictionary))
+        # final_obj_list holds all team objects in seed order (a team's index is its index in the schedule)
+        final_obj_list = []
+        for team in teams_dictionary:
+            final_obj_list.append(Team(team, teams_dictionary[team]))
+            final_obj_list[-1].set_game_log(game_log, len(final_obj_list) - 1)
+        live_standings = LiveStandings(final_obj_list) if track_history else None
+
+    with PROFILER.phase("league_games"):
+        for i in range(rounds):
+            for matchday in round_steps(final_obj_list, level_of_randomness, num_of_teams, rng, i + 1, live_standings,
+                                        match_model, generator):
+                yield i + 1, matchday
+
+    # Final table is sorted in descending order of final points, with tiebreakers for teams level on points
+    with PROFILER.phase("ranking"):
+        rank_table(final_obj_list, head_to_head)
+    return SeasonResult(final_obj_list, rounds, level_of_randomness, live_standings)
+
+
+def match_generator(rng):
+    """
+    Draws the seed of a numpy random Generator from rng, so a seeded rng gives the same match model results and
+    every season simulated with the same rng gets different ones.
+
+    CALLED BY: simulate_season
+
+    :param: rng - SimulationRNG (or anything with randint)
+
+    :return: numpy.random.Generator
+    """
+    import numpy as np
+    return np.random.default_rng([rng.randint(0, 2 ** 32 - 1) for i in range(4)])
+
+
+def run_steps(steps):
+    """
+    Runs a simulation generator (ex: season_steps, bracket_steps) to the end without looking at its steps.
+
+    CALLED BY: simulate_season, simulate_bracket
+
+    :return: the generator's return value
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+
+def simulate_bracket(standings, size, level_of_randomness, rng=None):
+    """
+    Simulates an end-of-season tournament for the top [size] teams of the standings without any terminal input or
+    output.
+
+    CALLS: bracket_steps, run_steps
+    CALLED BY: start_season, run_headless
+
+    :param: standings - final list of all Team objects in descending order of points
+    :param: size - number of teams in the bracket (at least 2 and no bigger than the number of teams; when it
+            isn't a power of 2 the top seeds get first round byes)
+    :param: level_of_randomness - int suggesting how random the tournament is to be
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed)), None for a new
+            randomly seeded SimulationRNG
+
+    :return: BracketResult holding every game of the tournament
+    """
+    return run_steps(bracket_steps(standings, size, level_of_randomness, rng))
+
+
+def bracket_steps(standings, size, level_of_randomness, rng=None):
+    """
+    Generator version of simulate_bracket that pauses after every round of the tournament. The parameters are the
+    same as simulate_bracket.
+
+    CALLS: generate_bracket, bracket_rounds
+    CALLED BY: simulate_bracket, events.season_events
+
+    :return: generator of every round's list of (team1, team2, winner) tuples as soon as it is played, returning the
+             BracketResult once the tournament is over
+    """
+    if rng is None:
+        rng = SimulationRNG()
+    with PROFILER.phase("bracket_generation"):
+        bracket = generate_bracket(standings, size)
+    # Teams drawn against an empty slot (None) go straight through to the second round
+    byes = [bracket[i] or bracket[i + 1] for i in range(0, len(bracket), 2)
+            if bracket[i] is None or bracket[i + 1] is None]
+    rounds = []
+    with PROFILER.phase("playoff_games"):
+        for games in bracket_rounds(bracket, level_of_randomness, size, rng):
+            rounds.append(games)
+            yield games
+    return BracketResult(rounds, level_of_randomness, byes)
+
+
 def end_of_sim_menu(final_obj_list, rounds, tournament):
     """
-    Menu for viewing results of the simulation. Called after the simulation is over.
+    Menu for viewing results of the simulation. Called after the simulation is over. The results are indexed once
+    up front so every menu query is a dictionary lookup.
 
-    CALLED BY: play_season
-    CALLS: search_team_results, head_to_head_results, print_table
+    CALLED BY: start_season
+    CALLS: search_team_results, head_to_head_results, print_table, show_team_stats
 
     :param final_obj_list: list of all Team objects
     :param rounds: number of round-robins played in the league regular season
     :param tournament - 'y' if one was played, 'n' if not
 
     """
+    results_index = ResultsIndex(final_obj_list)
     option = "1"
     while option != "0":
         print_menu()
         option = input("\nEnter 'A', 'B', 'C', 'D', OR '0' from the menu above: ")
         if option == 'A':
-            search_team_results(final_obj_list)
+            search_team_results(results_index)
         elif option == 'B':
-            head_to_head_results(final_obj_list)
+            head_to_head_results(results_index)
         elif option == 'C':
             print_table(final_obj_list, rounds)
         elif option == 'D':
-            show_team_stats(final_obj_list, rounds, tournament)
+            show_team_stats(results_index, rounds, tournament)
         elif option != "0":
             print("\nPlease enter a valid selection.")
 
 
-def show_team_stats(obj_list, rounds, tournament_played):
+def show_team_stats(results_index, rounds, tournament_played):
     """
         Shows in-depth statistics for each team's reg. season/playoff records
 
         CALLED BY: end_of_sim_menu
         CALLS: None
 
-        :param obj_list: list of all Team objects
+        :param results_index: ResultsIndex of the finished simulation
         :param rounds: number of round-robins played in the league regular season
         :param tournament_played - 'y' if one was played, 'n' if not
     """
-    team = input("\nEnter a team name to view all of their statistics: ")
-    # Ensures that entered teams is valid
-    valid_team = False
-    for obj in obj_list:
-        if obj.get_team() == team:
-            team = obj
-            valid_team = True
-            break
+    team = results_index.find_team(input("\nEnter a team name to view all of their statistics: "))
     # If the team is valid...
-    if valid_team is True:
+    if team is not None:
         print(f"\n{team.get_team()}:")
         print("---------------------")
-        print(f"Regular Season Finish: {obj_list.index(team) + 1}")
+        print(f"Regular Season Finish: {results_index.get_position(team)}")
         print(f"Regular Season Record (W-D-L): {team.get_wins()}-{team.get_draws()}-{team.get_losses()} "
-              f"({(len(obj_list) - 1) * rounds} games)")
+              f"({(results_index.get_num_of_teams() - 1) * rounds} games)")
         print(f"Regular Season Goals: GF: {team.get_gf()}, GA: {team.get_ga()}, GD: {team.get_gd()}")
         # Prints tournament stats if a tournament was actually played
         if tournament_played == 'y':
@@ -181,24 +315,17 @@ def show_team_stats(obj_list, rounds, tournament_played):
         print("\nERROR: Invalid Team.")
 
 
-def search_team_results(obj_list):
+def search_team_results(results_index):
     """
     Prints the results of all of the entered team's games from the season/playoffs
 
     CALLED BY: end_of_sim_menu
 
-    :param: final_obj_list - list of all team objects
+    :param: results_index - ResultsIndex of the finished simulation
     """
-    team = input("\nEnter a team name to view all of their results: ")
-    # Ensures that entered teams is valid
-    valid_team = False
-    for obj in obj_list:
-        if obj.get_team() == team:
-            team = obj
-            valid_team = True
-            break
+    team = results_index.find_team(input("\nEnter a team name to view all of their results: "))
     # If the team is valid...
-    if valid_team is True:
+    if team is not None:
         print("\nREGULAR SEASON:")
         print("-------------------")
         # Prints all regular season results via team1.get_game_list()
@@ -226,50 +353,39 @@ def search_team_results(obj_list):
         print("\nERROR: Invalid Team.")
 
 
-def head_to_head_results(obj_list):
+def head_to_head_results(results_index):
     """
     Prints the results of all head-to-head matchups between two given teams.
 
     CALLED BY: end_of_sim_menu
 
-    :param: final_obj_list - list of all team objects
-    """
-    team1 = input("\nEnter the first team name: ")
-    team2 = input("\nEnter the second team name: ")
-    # Ensures that both team names entered are valid
-    valid_team_count = 0
-    for obj in obj_list:
-        if obj.get_team() == team1:
-            team1 = obj
-            valid_team_count += 1
-        elif obj.get_team() == team2:
-            team2 = obj
-            valid_team_count += 1
+    :param: results_index - ResultsIndex of the finished simulation
+    """
+    team1 = results_index.find_team(input("\nEnter the first team name: "))
+    team2 = results_index.find_team(input("\nEnter the second team name: "))
     # If both names are valid...
-    if valid_team_count == 2:
+    if team1 is not None and team2 is not None and team1 != team2:
         print("\nREGULAR SEASON:")
         print("-------------------")
-        # Prints all regular season match-up results via team1.get_game_list()
-        for game in team1.get_game_list():
+        # Prints all regular season match-up results from the pairwise index
+        for game in results_index.get_league_games(team1, team2):
             if team2.get_team() == game.get_team1():
                 print(game.get_team1(), " ", game.get_team1_goals(), " - ", game.get_team2_goals(), " ",
                       game.get_team2())
-            elif team2.get_team() == game.get_team2():
+            else:
                 print(game.get_team2(), " ", game.get_team2_goals(), " - ", game.get_team1_goals(), " ",
                       game.get_team1())
-          # Checks to make sure both teams made playoffs
+        # Checks to make sure both teams made playoffs
         if len(team1.get_playoff_game_list()) != 0 and len(team2.get_playoff_game_list()) != 0:
-            # Prints all playoff match-up results via team1.get_playoff_game_list()
+            # Prints all playoff match-up results from the pairwise index
             print("\nPLAYOFFS:")
             print("-------------------")
-            # playoff_mtg represents if the 2 teams met in the playoffs or not
-            playoff_mtg = False
-            for game in team1.get_playoff_game_list():
-                if team2.get_team() in [game.get_team1(), game.get_team2()]:
-                    playoff_mtg = True
-                    print(game.get_team1(), " ", game.get_team1_goals(), " - ", game.get_team2_goals(), " ",
-                          game.get_team2())
-            if playoff_mtg is False:
+            playoff_games = results_index.get_playoff_games(team1, team2)
+            for game in playoff_games:
+                print(game.get_team1(), " ", game.get_team1_goals(), " - ", game.get_team2_goals(), " ",
+                      game.get_team2())
+            # If the 2 teams didn't meet in the playoffs
+            if len(playoff_games) == 0:
                 print("These two teams did not meet in the playoffs.")
     else:
         print("\nERROR: Invalid Team.")
@@ -287,218 +403,167 @@ def print_menu():
     print("\t0. Exit Menu")
 
 
-def bracket_simulator(bracket, level_of_randomness, num_of_teams):
+def bracket_simulator(bracket, level_of_randomness, num_of_teams, rng=random):
     """
     Simulates the bracket by putting teams from bracket against each other in select matchups and
-    subsequently re-adding the winner to the next round. This is done until one team remains.
+    subsequently re-adding the winner to the next round. This is done round by round until one team remains.
 
-    CALLS: game_simulator, bracket_shell_printer, bracket_simulator (recursive)
-    CALLED BY: start_season
+    CALLS: bracket_rounds
+    CALLED BY: benchmarks
 
-    :param: bracket - list of all team objects in the order they'll play the first round of the tournament
+    :param: bracket - list of all team objects in the order they'll play the first round of the tournament (None
+            for an empty slot, whose opponent has a bye)
     :param: level_of_randomness: The option (1, 2, 3, or 4) picked by the user.
     :param: num_of_teams: The number of teams in the bracket
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
+
+    :return: rounds - list of every round, each a list of (team1, team2, winner) tuples (byes aren't games, so
+             they aren't included)
+    """
+    return list(bracket_rounds(bracket, level_of_randomness, num_of_teams, rng))
+
+
+def bracket_rounds(bracket, level_of_randomness, num_of_teams, rng=random):
+    """
+    Generator version of bracket_simulator that hands out each round as soon as it is played. The parameters are
+    the same as bracket_simulator.
+
+    CALLS: game_simulator, get_score
+    CALLED BY: bracket_simulator, bracket_steps
+
+    :return: generator of every round's list of (team1, team2, winner) tuples
+    """
+    round_num = 0
+    game_log = next(team for team in bracket if team is not None).get_game_log()
+    while len(bracket) > 1:
+        round_num += 1
+        if game_log is not None:
+            game_log.set_round(round_num)
+        # Simulates each individual game for the round.
+        new_bracket = []
+        games = []
+        for i in range(0, len(bracket), 2):
+            team1 = bracket[i]
+            team2 = bracket[i + 1]
+            # A team without an opponent goes through without playing
+            if team1 is None or team2 is None:
+                new_bracket.append(team1 or team2)
+                continue
+            # Decides which team lost the individual game being simulated via the game_simulator function.
+            knocked_out = game_simulator(team1, team2, level_of_randomness, num_of_teams, rng)
+            # Declares winner of the individual game being simulated as the team not stored in knocked_out.
+            if team1 == knocked_out:
+                winner = team2
+            else:
+                winner = team1
+            # Updates Team objects
+            get_score(winner, knocked_out, True, rng=rng)
+            games.append((team1, team2, winner))
+            # Adds the winner to the bracket for the next round
+            new_bracket.append(winner)
+        bracket = new_bracket
+        yield games
+
+
+def print_bracket(bracket_result, compact=False):
     """
-    # Prints which round of the tournament is being played.
-    if len(bracket) >= 16:
-        print(f"\n\nROUND OF {len(bracket)}: ")
-    elif len(bracket) == 8:
-        print("\n\nQUARTERFINALS: ")
-    elif len(bracket) == 4:
-        print("\n\nSEMIFINALS: ")
-    elif len(bracket) == 2:
-        print("\n\nCHAMPIONSHIP: ")
-    # Simulates each individual game for the round.
-    new_bracket = []
-    for i in range(0, len(bracket), 2):
-        # Decides which team lost the individual game being simulated via the game_simulator function.
-        knocked_out = game_simulator(bracket[i], bracket[i + 1], level_of_randomness, num_of_teams)
-        # Declares winner of the individual game being simulated as the team not stored in knocked_out.
-        if bracket[i] == knocked_out:
-            winner = bracket[i + 1]
-        else:
-            winner = bracket[i]
-        # Updates Team objects
-        get_score(winner, knocked_out, True)
-        # Prints both teams from the game in a bracket shell with the winner included in the next round.
-        print(f"\n\n{bracket[i].get_playoff_seed()}: {bracket[i].get_team()}")
-        bracket_shell_printer(winner)
-        print(f"{bracket[i + 1].get_playoff_seed()}: {bracket[i + 1].get_team()}")
-        # Prints the champion and runner-up after the final game.
-        if len(bracket) == 2:
-            print(f"\n\nCHAMPION: {winner.get_playoff_seed()}: {winner.get_team()}")
-            print(f"RUNNER-UP: {knocked_out.get_playoff_seed()}: {knocked_out.get_team()}")
-        # Adds the winner to the bracket for the next round
-        new_bracket.append(winner)
-
-    bracket = new_bracket.copy()
-    # Recursively calls bracket_simulator with the updated dictionary until only one team still stands in the
-    # tournament.
-    if len(bracket) != 1:
-        bracket_simulator(bracket, level_of_randomness, num_of_teams)
-
-
-def bracket_shell_printer(winner):
-    """
-    Prints the rectangular bracket shell for each individual game with the winner and their seed printed
-    on a line to the right of the shell.
+    Prints every round of a simulated tournament, with each game in a bracket shell and the champion and runner-up
+    after the final game. The whole bracket is built first and written out in large chunks.
 
-    CALLS: none
-    CALLED BY: bracket_simulator
+    CALLS: render.write_bracket
+    CALLED BY: start_season, render_headless
 
-    :param: winner: The winner of the individual game.
-    :param: seed: The seed of the winner of the individual game.
+    :param: bracket_result - BracketResult returned by simulate_bracket
+    :param: compact - True to print one line per game instead of bracket shells
     """
-    print(f"--------------------|\n\t\t\t\t\t|\n\t\t\t\t\t|\t{winner.get_playoff_seed()}: {winner.get_team()}\n\t\t\t"
-          f"\t\t|--------------------"
-          f"\n\t\t\t\t\t|\n--------------------|")
+    write_bracket(bracket_result, compact=compact)
 
 
-def game_simulator(team1, team2, level_of_randomness, num_of_teams):
+def game_simulator(team1, team2, level_of_randomness, num_of_teams, rng=random):
     """
-    Simulates each individual game in the tournament using weighted seeding differences and a generated scale
-    factor.
+    Simulates each individual game in the tournament using the better seed's chance of winning, looked up by seed
+    difference from knockout_chances.
 
-    CALLS: scale_factor
-    CALLED BY: bracket_simulator
+    CALLS: knockout_chances
+    CALLED BY: bracket_rounds
 
     :param: team1/team2 - Team objects of the two teams playing
     :param: level_of_randomness - user selected option 1-4 (passed as int)
     :param: num_of_teams
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
 
     :return: knocked_out - Team object of the team that lost the game.
     """
-    # Calculates the percent difference in seeds of the two teams playing (used for generating scale factor).
-    weighted_seed_diff = abs(team2.get_playoff_seed() - team1.get_playoff_seed()) / num_of_teams
     # Figures out which of the two seeds is better (closer to 1).
-    better_seed = min(team1.get_playoff_seed(), team2.get_playoff_seed())
-    # If option 1, 2, or 3 was chosen by the user, a scale factor is generated alongside a random number
-    # used for picking a winner based on weighted_seed_diff.
-    if level_of_randomness in [1, 2, 3]:
-        sf = scale_factor(weighted_seed_diff, level_of_randomness, num_of_teams)
-        rand_num = random.randint(1, 100)
-        # If the random number (between 1 and 100 inclusive) is less than the scale factor, the team that
-        # has the worse seed of the two teams is returned.
-        if rand_num <= sf:
-            if better_seed == team1.get_playoff_seed():
-                return team2
-            else:
-                return team1
-        # If the random number (between 1 and 100 inclusive) is more than the scale factor, the team that
-        # has the better seed of the two teams is returned. This is considered an "upset".
-        else:
-            if better_seed == team1.get_playoff_seed():
-                return team1
-            else:
-                return team2
-    # If the user picked option 4 (every game is a 50/50 shot) then either int 1 or 2 is randomly generated and
-    # the team (team1 or team2) with that number is returned.
-    elif level_of_randomness == 4:
-        if random.randint(1, 2) == 1:
-            return team1
-        else:
-            return team2
+    if team1.get_playoff_seed() < team2.get_playoff_seed():
+        better_team, worse_team = team1, team2
+    else:
+        better_team, worse_team = team2, team1
+    # This can be thought of as the better seed's % chance of winning the individual match-up.
+    sf = knockout_chances(num_of_teams, level_of_randomness)[worse_team.get_playoff_seed()
+                                                             - better_team.get_playoff_seed()]
+    if PROFILER.enabled:
+        PROFILER.count("playoff_games")
+        PROFILER.count("rng_draws")
+    # If the random number (between 1 and 100 inclusive) is less than the scale factor, the team that
+    # has the worse seed of the two teams is returned. Otherwise the better seed is knocked out ("upset").
+    if rng.randint(1, 100) <= sf:
+        return worse_team
+    return better_team
 
 
-def scale_factor(difference, option, lowest_seed):
+def generate_bracket(final_obj_list, final_size):
     """
-    Determines a scale factor used for deciding which team will win the game being simulated. If the randomly
-    generated number (1-100) in game_simulator is below sf, the favorite (better seed) will win but if it is above sf,
-    the underdog (lower seed) will win.
-
-    CALLS: none
-    CALLED BY: game_simulator
+    Generates the seed structure for the bracket based on its proposed size
+    and then associates the proper team object with each seed. Brackets that aren't a power of 2 are filled out
+    to the next power of 2 with empty slots (None), which are always drawn against the top seeds, giving them byes.
 
-    :param: difference: The percent difference in seeds of the two teams playing.
-            - Equation = (worse seed - better seed) / lowest seed
-    :param: option: The option the user picked in the previous menu.
-    :param: lowest_seed: The seed of the worst team(s) in the bracket.
+    CALLS: bracket_slots, bracket_layout
+    CALLED BY: bracket_steps
+    :param: final_obj_list - final list of all Team objects in descending order of points
+    :param: final_size - the number of teams in the bracket (the top final_size teams of final_obj_list)
 
-    :return: sf: Scale factor used for deciding who will win the game in game_simulator.
-    :rtype: int
+    :return: bracket list (see above description)
     """
-    # Determines scale factor based on option and weighted difference. This can be thought of as assigning the
-    # better seed a [sf] % chance of winning the individual match-up.
-    if option == 1:
-        if difference >= .75:
-            sf = 99
-        elif 0.5 <= difference < 0.75:
-            sf = 90
-        elif 0.25 <= difference < 0.5:
-            sf = 82
-        else:
-            sf = 75
-    elif option == 2:
-        if difference >= .75:
-            sf = 88
-        elif 0.5 <= difference < 0.75:
-            sf = 80
-        elif 0.25 <= difference < 0.5:
-            sf = 72
-        else:
-            sf = 68
-    else:
-        if difference >= .75:
-            sf = 80
-        elif 0.5 <= difference < 0.75:
-            sf = 70
-        elif 0.25 <= difference < 0.5:
-            sf = 55
-        else:
-            sf = 50
-    # Adds 10 to the scale factor if the lowest seed is a 32 or higher. This is to ensure that with a higher variability
-    # of teams, the top teams still have a distinct advantage.
-    if lowest_seed >= 32:
-        sf += 10
-    # Subtracts 5 from the scale factor if the option is 1 or 2 and the lowest seed is 8 or smaller. This is to
-    # ensure that top teams aren't given a vastly disproportionate advantage.
-    elif lowest_seed <= 8:
-        if option in [1, 2]:
-            sf -= 5
-    return sf
+    for seed in range(1, final_size + 1):
+        final_obj_list[seed - 1].set_playoff_seed(seed)
+    # Each seed maps straight to its position in the table
+    return [final_obj_list[seed - 1] if seed <= final_size else None
+            for seed in bracket_layout(bracket_slots(final_size))]
 
 
-def generate_bracket(final_obj_list, final_size):
+def bracket_slots(num_of_teams):
     """
-    Generates the seed structure for the bracket based on its proposed size
-    and then associates the proper team object with each seed.
+    :return: number of first round slots in a bracket of num_of_teams teams (the next power of 2)
+    """
+    slots = 2
+    while slots < num_of_teams:
+        slots *= 2
+    return slots
 
-    CALLS: none
-    CALLED BY: main
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: final_size - the proposed length of the final bracket
 
-    :return: bracket list (see above description)
+def bracket_layout(final_size):
     """
-    bracket = [1, 2]
+    Generates the order seeds play in for the first round of a bracket of the proposed size.
 
-    # Expands the bracket outwards (ex: [1,2] -> [1,4,2,3])
-    while len(bracket) < final_size:
-        new_bracket = [0] * len(bracket) * 2
-        # Initializes even indices as already present seeds
-        for i in range(len(bracket)):
-            new_bracket[i * 2] = bracket[i]
-        # Initializes odd indices as new seed to play against
-        for i in range(len(bracket)):
-            new_bracket[i * 2 + 1] = (len(new_bracket) + 1) - bracket[i]
-        # Restores list to main location
-        bracket = new_bracket.copy()
-
-    # Changes the bracket list so that team objects are stored where there seeds were placed from above
-    for i in range(len(bracket)):
-        seed = bracket[i]
-        for j in final_obj_list:
-            if final_obj_list.index(j) + 1 == bracket[i]:
-                bracket[i] = j
-                j.set_playoff_seed(seed)
+    CALLED BY: generate_bracket, monte_carlo.simulate_playoffs, bracket_odds.exact_bracket_odds
+
+    :param: final_size - the proposed length of the final bracket (a power of 2)
 
+    :return: list of seeds in first round order (ex: [1, 4, 2, 3] for a size of 4)
+    """
+    bracket = [1]
+    # Expands the bracket outwards (ex: [1,2] -> [1,4,2,3]), with every seed followed by the new seed it plays
+    while len(bracket) < final_size:
+        total = len(bracket) * 2 + 1
+        bracket = [new_seed for seed in bracket for new_seed in (seed, total - seed)]
     return bracket
 
 
 def get_teams(table_length):
     """
     Asks user for number of teams to be put into bracket and verifies that the number
-    is valid (number must be in total_teams_list) via input validation.
+    is valid (between 2 and the number of teams in the table) via input validation.
 
     CALLS: none
     CALLED BY: main
@@ -508,244 +573,128 @@ def get_teams(table_length):
     :return: num_of_teams: Total number of teams to be put into the bracket.
     :rtype: int
     """
-    num_of_teams = 0
-    total_teams_list = (2, 4, 8, 16, 32, 64, 128, 256)
-    # Will ask user to re-enter value until a number from total_teams_list is entered.
-    while num_of_teams not in total_teams_list:
-        print("\nOPTIONS: 2, 4, 8, 16, 32, 64, 128, 256")
-        num_of_teams = input("\nHow many teams total in the bracket? (Pick a number from above that is less than"
-                             f" or equal to {table_length}): ")
-        if not num_of_teams.isdigit():
-            print(f"\nERROR. Please give a number from the options list less than {num_of_teams}.")
-        elif int(num_of_teams) not in total_teams_list or int(num_of_teams) > table_length:
-            print(f"\nERROR. Please give a number from the options list less than {num_of_teams}.")
-        else:
-            num_of_teams = int(num_of_teams)
-    return num_of_teams
-
-
-def team_dictionary_generator(file):
-    """
-    The teams and seeds are read into dict_teams for storage and correlation in the format team_name: seed.
-
-    CALLS: team_dictionary_generator, file_validity_checker, start_season
-    CALLED BY: main
-
-    :param: file - the absolute path to the verified file containing all teams and seeds
-
-    :return: dict_teams (see first note)
-    """
-    file = open(file, "r")
-    dict_teams = {}
-    for line in file:
-        line_list = line.split(":")
-        dict_teams[line_list[1].strip()] = int(line_list[0].strip())
-    file.close()
-    return dict_teams
+    num_of_teams = input(f"\nHow many teams total in the bracket? (2 through {table_length}, top seeds get byes if it "
+                         f"isn't a power of 2): ")
+    # Will ask user to re-enter value until a number from 2 through table_length is entered.
+    while not num_of_teams.isdigit() or not 2 <= int(num_of_teams) <= table_length:
+        num_of_teams = input(f"\nERROR. Please give a number from 2 through {table_length}: ")
+    return int(num_of_teams)
 
 
-def print_table(final_obj_list, rounds):
+def print_table(final_obj_list, rounds, first=1, last=None):
     """
     Prints the league table with detailed statistics for each team including games played, wins, draws, losses,
-    goals for, goals against, goal difference, and points.
+    goals for, goals against, goal difference, and points. The table is built first and written out in large
+    chunks.
 
-    CALLED BY: start_season
+    CALLS: render.write_table
+    CALLED BY: start_season, end_of_sim_menu, render_headless
 
     :param: final_obj_list - final list of all Team objects in descending order of points
     :param: rounds - int representing how many round-robins have been played
+    :param: first/last - first and last positions to print (starting at 1, last=None for the bottom of the table)
     """
-    print("\n       TEAM                                                     "
-          "GP       W         D        L       GF       GA       GD      PTS")
-    print("---------------------------------------------------------------------------"
-          "--------------------------------------------------------")
-    count = 0
-    for team in final_obj_list:
-        count += 1
-        print("{:>3}. {:<50} {:>10} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8}".format(count, team.get_team(),
-                                                                                      str((len(final_obj_list) - 1)
-                                                                                          * rounds),
-                                                                                      str(team.get_wins()),
-                                                                                      str(team.get_draws()),
-                                                                                      str(team.get_losses()),
-                                                                                      str(team.get_gf()),
-                                                                                      str(team.get_ga()),
-                                                                                      str(team.get_gd()),
-                                                                                      str(team.get_points())
-                                                                                      ))
-
-
-def decide_ties(final_obj_list):
-    """
-    Decides which teams are level on points, sending them to check_criteria to figure out proper order.
-
-    CALLS: check_criteria, swap
-    CALLED BY: decide_ties
-
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    """
-    team_pts = {}
-    for i in final_obj_list:
-        if i.get_points() not in team_pts.keys():
-            team_pts[i.get_points()] = i
-        else:
-            check_criteria(final_obj_list, i)
-
-
-def check_criteria(final_obj_list, tied_team):
-    """
-    Check tiebreaker criteria for teams with the same number of points. The criteria include highest goal difference
-    (gd), most goals scored (gf), and least goals against (ga) (in that order). Teams are sorted accordingly.
+    write_table(final_obj_list, rounds, first=first, last=last)
 
-    * Selection sort algorithm x 3 - picked because of small lists being passed
 
-    CALLS: swap
-    CALLED BY: decide_ties
-
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: tied_team - Team object of team that is tied on points with a team above it
-    """
-    same_pts = []
-    for j in final_obj_list:
-        if j.get_points() == tied_team.get_points():
-            same_pts.append(j)
-
-    # Check for GD - sorted accordingly
-    still_tied_list = []
-    decided = 0
-    for i in range(len(same_pts)):
-        j = i + 1
-        while j < len(same_pts):
-            if same_pts[i].get_gd() < same_pts[j].get_gd():
-                swap(final_obj_list, final_obj_list.index(same_pts[i]), final_obj_list.index(same_pts[j]))
-            elif same_pts[i].get_gd() == same_pts[j].get_gd():
-                decided = 1
-                still_tied_list.append(same_pts[i])
-                still_tied_list.append(same_pts[j])
-            j += 1
-
-    # Check for GF if above is tied - sorted accordingly
-    gf_still_tied_list = []
-    if decided == 1:
-        for i in range(len(still_tied_list)):
-            j = i + 1
-            while j < len(still_tied_list):
-                if still_tied_list[i].get_gf() < still_tied_list[j].get_gf():
-                    swap(final_obj_list, final_obj_list.index(still_tied_list[i]),
-                         final_obj_list.index(still_tied_list[j]))
-                elif still_tied_list[i].get_gf() == still_tied_list[j].get_gf():
-                    decided = 2
-                    gf_still_tied_list.append(still_tied_list[i])
-                    gf_still_tied_list.append(still_tied_list[j])
-                j += 1
-
-    # Check for ga if above is still tied - sorted accordingly
-    if decided == 2:
-        for i in range(len(gf_still_tied_list)):
-            j = i + 1
-            while j < len(gf_still_tied_list):
-                if gf_still_tied_list[i].get_ga() < gf_still_tied_list[j].get_ga():
-                    swap(final_obj_list, final_obj_list.index(gf_still_tied_list[i]),
-                         final_obj_list.index(gf_still_tied_list[j]))
-                j += 1
-
-
-def sort_final_table(final_obj_list, left, right):
-    """
-    Sorts the final list of teams based on their points in descending order using the quicksort algorithm.
-    Teams with more points are placed higher in the list.
-
-    CALLS: swap
-    CALLED BY: start_season
-
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: rounds - int left/right - location of left/right (i and j respectively) incremental bounds in quicksort
+def play_round(final_obj_list, level_of_randomness, num_of_teams, rng=random, round_num=1, live_standings=None,
+               match_model=None, generator=None):
     """
-    if left < right:
-        pivot_index = partition(final_obj_list, left, right)
-        sort_final_table(final_obj_list, left, pivot_index - 1)
-        sort_final_table(final_obj_list, pivot_index + 1, right)
+    Calls play_game for each combination of teams, one matchday at a time (see schedule.round_fixtures).
+    Every team plays every team once per round.
 
+    CALLS: round_steps
+    CALLED BY: benchmarks
 
-def partition(final_obj_list, left, right):
+    :param: final_obj_list - list of all Team objects in seed order
+    :param: level_of_randomness - int suggesting how random the simulation is to be
+    :param: num_of_teams - int
+    :param: rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
+    :param: round_num - which round-robin this is (starting at 1), even rounds swap home and away
+    :param: live_standings - LiveStandings to update with both teams of every game once each matchday is played
+            (None to skip)
+    :param: match_model - MatchModel that decides a whole matchday at once (None for play_game)
+    :param: generator - numpy random Generator used by match_model
     """
-    Partitions the list for the quicksort algorithm. It selects a pivot value, rearranges the list
-    so that elements less than the pivot are on the left, and elements greater than the pivot are on the right.
+    for matchday in round_steps(final_obj_list, level_of_randomness, num_of_teams, rng, round_num, live_standings,
+                                match_model, generator):
+        pass
 
-    CALLED BY: sort_final_table
 
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: rounds - int left/right - location of left/right (i and j respectively) incremental bounds in quicksort
-
-    :return: i + 1 - int representing the next pivot value
+def round_steps(final_obj_list, level_of_randomness, num_of_teams, rng=random, round_num=1, live_standings=None,
+                match_model=None, generator=None):
     """
-    pivot_value = final_obj_list[right].get_points()
-    i = left - 1
-    for j in range(left, right):
-        if final_obj_list[j].get_points() >= pivot_value:
-            i += 1
-            swap(final_obj_list, i, j)
-    swap(final_obj_list, i + 1, right)
-    return i + 1
+    Generator version of play_round that pauses after every matchday. The parameters are the same as play_round.
 
+    CALLS: schedule.round_fixtures, play_game, play_matchday
+    CALLED BY: play_round, season_steps
 
-def swap(final_obj_list, i, j):
+    :return: generator of the number of every matchday (starting at 1) once it is played
     """
-    Swaps two elements in the team object list.
+    game_log = final_obj_list[0].get_game_log()
+    for matchday, fixtures in round_fixtures(num_of_teams, round_num):
+        if game_log is not None:
+            game_log.set_round(round_num, matchday)
+        if match_model is not None:
+            play_matchday(final_obj_list, fixtures, match_model, generator)
+        else:
+            for home, away in fixtures:
+                play_game(final_obj_list[home], final_obj_list[away], level_of_randomness, num_of_teams, rng)
+        if live_standings is not None:
+            for home, away in fixtures:
+                live_standings.update(home)
+                live_standings.update(away)
+            live_standings.end_matchday(round_num, matchday)
+        yield matchday
 
-    CALLED BY: sort_final_table, check_criteria
 
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: rounds - int i/j - location of left/right (i and j respectively) incremental bounds in quicksort to be
-    swapped
+def play_matchday(final_obj_list, fixtures, match_model, generator):
     """
-    temp = final_obj_list[i]
-    final_obj_list[i] = final_obj_list[j]
-    final_obj_list[j] = temp
+    Samples the scores of every game of a matchday with one call to the match model, then records them.
 
+    CALLS: MatchModel.sample_scores, record_result
+    CALLED BY: round_steps
 
-def play_round(final_obj_list, level_of_randomness, num_of_teams):
+    :param: final_obj_list - list of all Team objects in seed order
+    :param: fixtures - list of (home team index, away team index)
+    :param: match_model - MatchModel deciding the games
+    :param: generator - numpy random Generator
     """
-    Calls play_game for each combination of teams.
-    Every team plays every team once per round.
-
-    CALLS: play_game
-    CALLED BY: start_season
+    import numpy as np
 
-    :param: final_obj_list - final list of all Team objects in descending order of points
-    :param: level_of_randomness - int suggesting how random the simulation is to be
-    :param: num_of_teams - int
-    """
-    for team in final_obj_list:
-        for opponent in team.get_opponent_list():
-            play_game(team, opponent, level_of_randomness, num_of_teams)
+    home, away = np.array(fixtures, dtype=np.intp).reshape(-1, 2).T
+    home_goals, away_goals = match_model.sample_scores(home, away, 1, generator)
+    for (home, away), team1_goals, team2_goals in zip(fixtures, home_goals[0].tolist(), away_goals[0].tolist()):
+        record_result(final_obj_list[home], team1_goals, final_obj_list[away], team2_goals)
 
 
-def play_game(team1, team2, level_of_randomness, num_of_teams):
+def play_game(team1, team2, level_of_randomness, num_of_teams, rng=random):
     """
     Simulates individual games, generating wins, draws, and losses based on random number generation.
 
-    CALLS: play_game
-    CALLED BY: start_season
+    CALLS: league_thresholds, get_score
+    CALLED BY: round_steps
 
     :param team1 - the first team playing the game.
     :param team2 - the second team playing the game.
     :param level_of_randomness - an integer representing the level of randomness in the game (1 to 4).
     :param num_of_teams - the total number of teams in the tournament.
+    :param rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
     """
-    weighted_seed_diff = float(abs(team1.get_seed() - team2.get_seed()) / num_of_teams)
-    better_team = min(team1.get_seed(), team2.get_seed())
-    if better_team == team1.get_seed():
+    if team1.get_seed() < team2.get_seed():
         better_team = team1
         worse_team = team2
     else:
         better_team = team2
         worse_team = team1
 
-    # Gets the chances for a win, loss, or tie from get_result
-    odds_boundaries = get_result(weighted_seed_diff, level_of_randomness)
-    win_ceiling = odds_boundaries[0]
-    draw_ceiling = odds_boundaries[1]
-    result = random.randint(1, 100)
+    # Gets the chances for a win, loss, or tie (precomputed from get_result for every seed difference)
+    win_ceiling, draw_ceiling = league_thresholds(num_of_teams, level_of_randomness)[worse_team.get_seed()
+                                                                                     - better_team.get_seed()]
+    result = rng.randint(1, 100)
+    if PROFILER.enabled:
+        PROFILER.count("league_games")
+        PROFILER.count("rng_draws")
     # If the random number is under odds_boundary[0], the better team wins
     if result <= win_ceiling:
         winning_team = better_team
@@ -764,139 +713,260 @@ def play_game(team1, team2, level_of_randomness, num_of_teams):
         winning_team.incr_wins()
         losing_team = better_team
         losing_team.incr_losses()
-    get_score(winning_team, losing_team, False, team1, team2)
+    get_score(winning_team, losing_team, False, team1, team2, rng)
 
 
-def get_score(winning_team, losing_team, playoffs, team1=None, team2=None):
+def get_score(winning_team, losing_team, playoffs, team1=None, team2=None, rng=random):
     """
     Determines the score of a game based on the result (W, D, L).
     In the case of a draw, scores are randomly generated.
     Otherwise, goals are determined using a directed strategy of determining possible outcomes.
 
-    CALLED BY: play_game
+    CALLS: sample_draw_goals, sample_win_score, record_game
+    CALLED BY: play_game, bracket_rounds
 
     :param winning_team - the team that wins the game (or None in the case of a draw).
     :param losing_team - the team that loses the game (or None in the case of a draw).
     :param team1 - the first team playing the game.
     :param team2 - the second team playing the game
     :param playoffs - True if playoff game, False otherwise
+    :param rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
     """
-    # Tuple is where score values are randomly picked from
-    score_tuple = [0] * 19 + [1] * 22 + [2] * 11 + [3] * 7 + [4] * 2 + [5]
-
     # For if a tie has occurred
     if winning_team is None:
-        # Random number chosen from score_tuple
-        tie_goals = score_tuple[random.randint(0, len(score_tuple) - 1)]
+        # Random number of goals for both teams
+        tie_goals = sample_draw_goals(rng)
+        if PROFILER.enabled:
+            PROFILER.count("rng_draws")
         # Team objects updated accordingly
-        team1.add_game(Game(team1.get_team(), tie_goals, team2.get_team(), tie_goals, "Draw"))
-        team2.add_game(Game(team1.get_team(), tie_goals, team2.get_team(), tie_goals, "Draw"))
+        record_game(team1, tie_goals, team2, tie_goals, DRAW, playoffs)
         team1.incr_gf(tie_goals)
         team1.incr_ga(tie_goals)
         team2.incr_gf(tie_goals)
         team2.incr_ga(tie_goals)
     else:
-        # Random number chosen from score_tuple (can't be 5)
-        losing_team_goals = score_tuple[random.randint(0, len(score_tuple) - 2)]
-        # Random number chosen from score_tuple (can't be 0)
-        winning_team_goals = score_tuple[random.randint(19, len(score_tuple) - 1)]
-        # winning_team_goals regenerated until it is greater than losing_team_goals
-        while winning_team_goals <= losing_team_goals:
-            winning_team_goals = score_tuple[random.randint(20, len(score_tuple) - 1)]
+        # Winning team always scores more than the losing team (see score_sampler)
+        winning_team_goals, losing_team_goals = sample_win_score(rng)
+        if PROFILER.enabled:
+            PROFILER.count("rng_draws", 2)
         # Team objects updated accordingly
+        record_game(winning_team, winning_team_goals, losing_team, losing_team_goals, TEAM1_WIN, playoffs)
         if playoffs is False:
-            team1.add_game(Game(winning_team.get_team(), winning_team_goals, losing_team.get_team(), losing_team_goals,
-                                winning_team.get_team()))
-            team2.add_game(Game(winning_team.get_team(), winning_team_goals, losing_team.get_team(), losing_team_goals,
-                                winning_team.get_team()))
             winning_team.incr_gf(winning_team_goals)
             winning_team.incr_ga(losing_team_goals)
             losing_team.incr_gf(losing_team_goals)
             losing_team.incr_ga(winning_team_goals)
         else:
-            winning_team.add_playoff_game(
-                Game(winning_team.get_team(), winning_team_goals, losing_team.get_team(), losing_team_goals,
-                     winning_team.get_team()))
             winning_team.incr_playoff_wins()
             winning_team.incr_playoff_gf(winning_team_goals)
             winning_team.incr_playoff_ga(losing_team_goals)
-            losing_team.add_playoff_game(
-                Game(winning_team.get_team(), winning_team_goals, losing_team.get_team(), losing_team_goals,
-                     winning_team.get_team()))
             losing_team.incr_playoff_losses()
             losing_team.incr_playoff_gf(losing_team_goals)
             losing_team.incr_playoff_ga(winning_team_goals)
 
 
-def get_result(weighted_seed_diff, level_of_randomness):
+def record_result(team1, team1_goals, team2, team2_goals):
     """
-    Determines the win, draw, and loss probabilities based on the level of randomness.
+    Updates both teams' league stats for a game whose score was decided elsewhere (ex: by a MatchModel).
 
-    win_probability = [(chance for better seed to win), (stacked chance for draw)] - anything beyond [1] means loss
+    CALLS: record_game
+    CALLED BY: play_matchday
 
-    CALLED BY: play_game
+    :param team1/team2 - Team objects of the two teams
+    :param team1_goals/team2_goals - goals scored by each team
+    """
+    if PROFILER.enabled:
+        PROFILER.count("league_games")
+    if team1_goals == team2_goals:
+        team1.incr_draws()
+        team2.incr_draws()
+        record_game(team1, team1_goals, team2, team2_goals, DRAW, False)
+    elif team1_goals > team2_goals:
+        team1.incr_wins()
+        team2.incr_losses()
+        record_game(team1, team1_goals, team2, team2_goals, TEAM1_WIN, False)
+    else:
+        team2.incr_wins()
+        team1.incr_losses()
+        record_game(team2, team2_goals, team1, team1_goals, TEAM1_WIN, False)
+    team1.incr_gf(team1_goals)
+    team1.incr_ga(team2_goals)
+    team2.incr_gf(team2_goals)
+    team2.incr_ga(team1_goals)
 
-    :param weighted_seed_diff - the weighted difference in seeds between two teams.
-    :param level_of_randomness - an integer representing the level of randomness in the game (1 to 4).
 
-    :return: a list of two numbers (see win_probability above)
+def record_game(team1, team1_goals, team2, team2_goals, result, playoffs):
     """
-    if level_of_randomness == 1:
-        if weighted_seed_diff >= 0.6:
-            win_probability = [80, 90]
-        elif weighted_seed_diff >= 0.2:
-            win_probability = [70, 85]
-        else:
-            win_probability = [60, 75]
-    elif level_of_randomness == 2:
-        if weighted_seed_diff >= 0.6:
-            win_probability = [70, 85]
-        elif weighted_seed_diff >= 0.2:
-            win_probability = [55, 75]
-        else:
-            win_probability = [45, 75]
-    elif level_of_randomness == 3:
-        if weighted_seed_diff >= 0.6:
-            win_probability = [60, 75]
-        elif weighted_seed_diff >= 0.2:
-            win_probability = [45, 70]
-        else:
-            win_probability = [38, 70]
-    else:
-        win_probability = [33, 67]
-    return win_probability
+    Stores a game for both teams. Teams that share a GameLog get one row in it; otherwise a single Game object is
+    added to both teams' lists.
 
+    CALLED BY: get_score, record_result
 
-def file_validity_checker(file_path, num_of_teams):
+    :param team1/team2 - Team objects of the two teams (team1 is the winner of a game that isn't a draw)
+    :param team1_goals/team2_goals - goals scored by each team
+    :param result - DRAW or TEAM1_WIN (from GameLog)
+    :param playoffs - True if playoff game, False otherwise
     """
-    Checks the validity of the provided file path and the format of the seeded teams.
-    Verifies that the file contains unique teams sorted from 1 through num_of_teams.
+    game_log = team1.get_game_log()
+    if game_log is not None:
+        game_log.add_game(team1.get_index(), team1_goals, team2.get_index(), team2_goals, result, playoffs)
+        return
+    if result == DRAW:
+        winner = "Draw"
+    else:
+        winner = team1.get_team()
+    game = Game(team1.get_team(), team1_goals, team2.get_team(), team2_goals, winner)
+    if PROFILER.enabled:
+        PROFILER.count("game_objects")
+    if playoffs:
+        team1.add_playoff_game(game)
+        team2.add_playoff_game(game)
+    else:
+        team1.add_game(game)
+        team2.add_game(game)
+
+
+def run_headless(args):
+    """
+    Runs a full simulation from command line flags instead of input() prompts. Rendering the table and bracket is
+    optional so the simulation itself can be run (and timed) on its own.
+
+    CALLS: team_file.load_teams, simulate_season, simulate_bracket, render_headless,
+           bracket_odds.exact_bracket_odds
+    CALLED BY: __main__
+
+    :param: args - list of command line arguments (without the program name)
+    """
+    parser = argparse.ArgumentParser(description="Simulate a league season (and optional tournament) without prompts.")
+    parser.add_argument("--teams", required=True, help="path to a file of seeded teams (1: Team 1, 2: Team 2, ...)")
+    parser.add_argument("--rounds", type=int, default=1, help="number of round-robins")
+    parser.add_argument("--randomness", type=int, choices=[1, 2, 3, 4], default=2,
+                        help="level of randomness for the season")
+    parser.add_argument("--bracket-size", type=int, default=0,
+                        help="number of teams in the end-of-season tournament (0 for no tournament); top seeds get "
+                             "byes when it isn't a power of 2")
+    parser.add_argument("--bracket-randomness", type=int, choices=[1, 2, 3, 4],
+                        help="level of randomness for the tournament (defaults to --randomness)")
+    parser.add_argument("--exact-odds", action="store_true",
+                        help="instead of simulating the tournament, compute every team's exact chance of reaching "
+                             "each round")
+    parser.add_argument("--seed", type=int,
+                        help="master seed for the random number generator (a random one is picked and shown in JSON "
+                             "output if not given)")
+    parser.add_argument("--rng", choices=["random", "numpy"], default="random",
+                        help="random number backend (numpy requires NumPy)")
+    parser.add_argument("--head-to-head", action="store_true",
+                        help="split teams level on points, GD, GF, and GA by their head-to-head games")
+    parser.add_argument("--output", choices=["table", "json", "none"], default="table",
+                        help="print the table/bracket, a JSON summary, or nothing")
+    parser.add_argument("--top", type=int, help="only print the top [TOP] teams of the table")
+    parser.add_argument("--page", type=int, help="only print this page of the table (see --page-size)")
+    parser.add_argument("--page-size", type=int, default=50, help="teams on each page of the table")
+    parser.add_argument("--bracket-view", choices=["full", "compact"], default="full",
+                        help="print each tournament game in a bracket shell or on one line")
+    parser.add_argument("--profile", nargs="?", const="-", metavar="PATH",
+                        help="time every phase and count hot-path work, writing a JSON report to PATH (or stderr)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="with --profile, also record each phase's peak allocations (slower)")
+    options = parser.parse_args(args)
+    if options.profile is not None:
+        PROFILER.reset()
+        PROFILER.enable(options.profile_memory)
 
-    CALLED BY: main
+    try:
+        with PROFILER.phase("load_teams"):
+            teams_dictionary = load_teams(options.teams)
+    except TeamFileError as error:
+        parser.error(str(error))
+    if options.rounds < 1:
+        parser.error("--rounds must be at least 1")
+    if (options.top is not None and options.top < 1) or (options.page is not None and options.page < 1) \
+            or options.page_size < 1:
+        parser.error("--top, --page, and --page-size must be at least 1")
+    bracket_size = options.bracket_size
+    if bracket_size != 0 and not 2 <= bracket_size <= len(teams_dictionary):
+        parser.error("--bracket-size must be between 2 and the number of teams")
+    bracket_randomness = options.bracket_randomness or options.randomness
+
+    if options.seed is not None and options.seed < 0:
+        parser.error("--seed must not be negative")
+    rng = SimulationRNG(options.seed, options.rng)
+    # The season and tournament each get their own stream, so the same seed gives the same bracket no matter how
+    # many numbers the season used
+    season = simulate_season(teams_dictionary, options.rounds, options.randomness, rng.spawn(0),
+                             options.head_to_head)
+    bracket = None
+    bracket_odds = None
+    if bracket_size != 0 and options.exact_odds:
+        # Imported here so bracket_odds can import from main
+        from bracket_odds import exact_bracket_odds
+        bracket_odds = exact_bracket_odds(bracket_size, bracket_randomness)
+    elif bracket_size != 0:
+        bracket = simulate_bracket(season.get_standings(), bracket_size, bracket_randomness, rng.spawn(1))
+
+    with PROFILER.phase("render"):
+        render_headless(options, season, bracket, bracket_odds, rng.get_seed())
+
+    if options.profile is not None:
+        PROFILER.disable()
+        report = json.dumps(PROFILER.report(), indent=2)
+        if options.profile == "-":
+            print(report, file=sys.stderr)
+        else:
+            with open(options.profile, "w") as file:
+                file.write(report)
 
-    :param file_path - the absolute file path to the list of seeded teams.
-    :param num_of_teams - the total number of teams in the tournament.
 
-    :return: boolean value representing if the file is valid or not
+def render_headless(options, season, bracket, bracket_odds, seed):
     """
-    valid = True
-    count = 0
-    team_repetition_checker = []
-    try:
-        file = open(file_path, 'r')
-        for line in file:
-            count += 1
-            line_list = line.split(":")
-            # Invalid if there isn't exactly 1 team for every seed 1-num_of_teams or duplicate team is found
-            if line_list[0] != str(count) or line_list[1] in team_repetition_checker:
-                valid = False
-                break
-            team_repetition_checker.append(line_list[1])
-        file.close()
-    except Exception:
-        valid = False
-    return valid and count == num_of_teams
+    Prints the results of run_headless in the format picked with --output.
+
+    CALLS: print_table, print_bracket, season_summary, render.page_range, bracket_odds.print_bracket_odds
+    CALLED BY: run_headless
+    """
+    if options.output == "table":
+        if options.page is not None:
+            first, last = page_range(options.page, options.page_size)
+        else:
+            first, last = 1, options.top
+        print_table(season.get_standings(), options.rounds, first, last)
+        if bracket is not None:
+            print_bracket(bracket, options.bracket_view == "compact")
+        if bracket_odds is not None:
+            from bracket_odds import print_bracket_odds
+            print_bracket_odds(bracket_odds, season.get_standings())
+    elif options.output == "json":
+        print(json.dumps(season_summary(season, bracket, bracket_odds, seed)))
+
+
+def season_summary(season, bracket=None, bracket_odds=None, seed=None):
+    """
+    CALLED BY: render_headless, service.simulate_batch
+
+    :param: season - SeasonResult
+    :param: bracket - BracketResult of the tournament (None if there wasn't one)
+    :param: bracket_odds - exact odds from bracket_odds.exact_bracket_odds (None if they weren't computed)
+    :param: seed - master seed the simulation used
+
+    :return: dictionary of the final standings (and tournament results) ready to be written as JSON
+    """
+    summary = {"standings": [{"team": team.get_team(), "seed": team.get_seed(), "wins": team.get_wins(),
+                              "draws": team.get_draws(), "losses": team.get_losses(), "gf": team.get_gf(),
+                              "ga": team.get_ga(), "points": team.get_points()}
+                             for team in season.get_standings()],
+               "rng_seed": seed}
+    if bracket is not None:
+        summary["champion"] = bracket.get_champion().get_team()
+        summary["runner_up"] = bracket.get_runner_up().get_team()
+    if bracket_odds is not None:
+        summary["bracket_odds"] = {season.get_standings()[playoff_seed - 1].get_team(): seed_odds
+                                   for playoff_seed, seed_odds in enumerate(bracket_odds, start=1)}
+    return summary
 
 
 if __name__ == '__main__':
-    main()
+    # Any command line arguments switch the simulator to its non-interactive mode
+    if len(sys.argv) > 1:
+        run_headless(sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,176 @@
+import numpy as np
+from main import bracket_layout, bracket_slots
+from odds_tables import knockout_chances
+from score_sampler import sample_draw_goals_batch, sample_win_scores_batch
+from ranking import rank_seasons
+from MonteCarloResult import MonteCarloResult
+from SeedModel import SeedModel
+
+
+def simulate_seasons(teams_dictionary, rounds, level_of_randomness, num_of_seasons, seed=None, chunk_size=10000,
+                     chunk_callback=None, match_model=None, keep_seasons=True):
+    """
+    Simulates num_of_seasons league seasons at once as NumPy arrays. By default every game is drawn from the same
+    get_result thresholds play_game uses and every scoreline from the same score distribution get_score uses (see
+    SeedModel); any other MatchModel can be used instead. Final tables are ranked on points, GD, GF, and GA (in that
+    order) with the better seed winning any remaining tie.
+
+    Seasons are simulated in chunks of chunk_size, so the working arrays of each chunk (every game's scoreline) stay
+    the same size no matter how many seasons are requested. The seasons x teams results kept for every season still
+    grow with num_of_seasons unless keep_seasons is False.
+
+    CALLS: SeedModel, simulate_chunk, ranking.rank_seasons, count_positions
+    CALLED BY: none
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins are to be played
+    :param: level_of_randomness - int suggesting how random the simulation is to be
+    :param: num_of_seasons - int representing how many seasons are simulated
+    :param: seed - seed for numpy's random generator (an int, SeedSequence, Generator, or None for a random seed)
+    :param: chunk_size - max number of seasons simulated at the same time
+    :param: chunk_callback - function called after every chunk as chunk_callback(finishing_order, home_goals,
+            away_goals) with that chunk's seasons x positions and seasons x games arrays (games are every pair of
+            team indices i < j, in order, repeated once per round-robin), ex: to save scorelines to disk
+    :param: match_model - MatchModel deciding every game (None for SeedModel at level_of_randomness)
+    :param: keep_seasons - False to only keep the position counts and each team's point and goal difference totals
+            (ex: when chunk_callback saves every season to disk), so memory doesn't grow with num_of_seasons
+
+    :return: MonteCarloResult holding the finishing order, points, and goal difference of every season (only the
+             totals when keep_seasons is False)
+    """
+    names = sorted(teams_dictionary, key=teams_dictionary.get)
+    num_of_teams = len(names)
+    rng = np.random.default_rng(seed)
+    if match_model is None:
+        match_model = SeedModel(num_of_teams, level_of_randomness)
+
+    # Every pairing (i < j) of team indices, repeated once for each round-robin
+    home, away = np.triu_indices(num_of_teams, k=1)
+    home = np.tile(home, rounds)
+    away = np.tile(away, rounds)
+    # Groups every game entry by team so per-team totals are a single reduceat (every team plays at least once)
+    team_ids = np.concatenate((home, away))
+    game_order = np.argsort(team_ids, kind="stable")
+    team_starts = np.searchsorted(team_ids[game_order], np.arange(num_of_teams))
+
+    position_counts = np.zeros((num_of_teams, num_of_teams), dtype=np.int64)
+    total_points = np.zeros(num_of_teams, dtype=np.int64)
+    total_goal_difference = np.zeros(num_of_teams, dtype=np.int64)
+    points = goal_difference = finishing_order = None
+    if keep_seasons:
+        points = np.empty((num_of_seasons, num_of_teams), dtype=np.int32)
+        goal_difference = np.empty((num_of_seasons, num_of_teams), dtype=np.int32)
+        finishing_order = np.empty((num_of_seasons, num_of_teams), dtype=np.int32)
+    for start in range(0, num_of_seasons, chunk_size):
+        stop = min(start + chunk_size, num_of_seasons)
+        pts, gf, ga, home_goals, away_goals = simulate_chunk(stop - start, match_model, home, away, game_order,
+                                                             team_starts, rng)
+        order = rank_seasons(pts, gf, ga)
+        if chunk_callback is not None:
+            chunk_callback(order, home_goals, away_goals)
+        position_counts += count_positions(order)
+        total_points += pts.sum(axis=0, dtype=np.int64)
+        total_goal_difference += (gf - ga).sum(axis=0, dtype=np.int64)
+        if keep_seasons:
+            points[start:stop] = pts
+            goal_difference[start:stop] = gf - ga
+            finishing_order[start:stop] = order
+
+    return MonteCarloResult(names, position_counts, points, goal_difference, finishing_order, total_points,
+                            total_goal_difference)
+
+
+def count_positions(finishing_order):
+    """
+    CALLED BY: simulate_seasons, Scenario.get_result
+
+    :param: finishing_order - seasons x positions array of team indices
+
+    :return: teams x positions matrix counting how often each team finished in each position
+    """
+    num_of_teams = finishing_order.shape[1]
+    # order[s, p] is the team that finished in position p, so team/position pairs are tallied directly
+    return np.bincount((finishing_order * num_of_teams + np.arange(num_of_teams)).ravel(),
+                       minlength=num_of_teams * num_of_teams).reshape(num_of_teams, num_of_teams)
+
+
+def simulate_chunk(num_of_seasons, match_model, home, away, game_order, team_starts, rng):
+    """
+    Plays every fixture for num_of_seasons seasons and totals up each team's points and goals.
+
+    CALLS: MatchModel.sample_scores, team_totals
+    CALLED BY: simulate_seasons
+
+    :return: pts/gf/ga - seasons x teams arrays
+             home_goals/away_goals - seasons x games arrays
+    """
+    home_goals, away_goals = match_model.sample_scores(home, away, num_of_seasons, rng)
+    home_pts = np.where(home_goals > away_goals, 3, home_goals == away_goals).astype(np.int16)
+    away_pts = np.where(away_goals > home_goals, 3, home_goals == away_goals).astype(np.int16)
+
+    pts = team_totals(home_pts, away_pts, game_order, team_starts)
+    gf = team_totals(home_goals, away_goals, game_order, team_starts)
+    ga = team_totals(away_goals, home_goals, game_order, team_starts)
+    return pts, gf, ga, home_goals, away_goals
+
+
+def draw_scores(shape, rng):
+    """
+    Draws goals from the same distribution get_score uses (see score_sampler).
+
+    CALLS: score_sampler.sample_win_scores_batch, score_sampler.sample_draw_goals_batch
+    CALLED BY: MatchModel.scores_from_results
+
+    :return: winner_goals, loser_goals, draw_goals - arrays of the given shape
+    """
+    winner_goals, loser_goals = sample_win_scores_batch(shape, rng)
+    return winner_goals, loser_goals, sample_draw_goals_batch(shape, rng)
+
+
+def team_totals(home_values, away_values, game_order, team_starts):
+    """
+    Adds up per-game values into per-team totals for every season. Each game is counted once for the home team and
+    once for the away team, with game_order grouping those entries by team and team_starts marking where each
+    team's group begins.
+
+    CALLED BY: simulate_chunk
+
+    :return: seasons x teams array of totals
+    """
+    values = np.concatenate((home_values, away_values), axis=1)[:, game_order]
+    return np.add.reduceat(values, team_starts, axis=1, dtype=np.int32)
+
+
+def simulate_playoffs(finishing_order, bracket_size, level_of_randomness, seed=None):
+    """
+    Simulates an end-of-season tournament for every season at once. game_simulator's chances only depend on the
+    playoff seeds of the two teams, so whole rounds of every season's bracket are played with one array of random
+    numbers and the champion's seed is mapped back to that season's team at the end.
+
+    CALLS: bracket_slots, bracket_layout, knockout_chances
+    CALLED BY: parallel.simulate_blocks
+
+    :param: finishing_order - seasons x positions array of team indices (from MonteCarloResult)
+    :param: bracket_size - number of teams in the bracket (top seeds get byes when it isn't a power of 2)
+    :param: level_of_randomness - int suggesting how random the tournament is to be
+    :param: seed - seed for numpy's random generator (an int, SeedSequence, Generator, or None for a random seed)
+
+    :return: array with the team index of each season's champion
+    """
+    rng = np.random.default_rng(seed)
+    num_of_seasons = finishing_order.shape[0]
+    better_seed_chance = np.array(knockout_chances(bracket_size, level_of_randomness), dtype=np.int16)
+    # Playoff seeds still alive in every season's bracket, in bracket order
+    # (seeds above bracket_size are empty slots, so whoever is drawn against one always goes through)
+    slots = bracket_slots(bracket_size)
+    bracket = np.broadcast_to(np.array(bracket_layout(slots)), (num_of_seasons, slots))
+    while bracket.shape[1] > 1:
+        team1 = bracket[:, 0::2]
+        team2 = bracket[:, 1::2]
+        better = np.minimum(team1, team2)
+        worse = np.maximum(team1, team2)
+        rand_num = rng.integers(1, 101, size=better.shape, dtype=np.int16)
+        chance = np.where(worse > bracket_size, 100, better_seed_chance[np.minimum(worse - better, bracket_size - 1)])
+        bracket = np.where(rand_num <= chance, better, worse)
+    return finishing_order[np.arange(num_of_seasons), bracket[:, 0] - 1]
+
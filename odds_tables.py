@@ -0,0 +1,173 @@
+from functools import lru_cache
+
+
+def get_result(weighted_seed_diff, level_of_randomness):
+    """
+    Determines the win, draw, and loss probabilities based on the level of randomness.
+
+    win_probability = [(chance for better seed to win), (stacked chance for draw)] - anything beyond [1] means loss
+
+    CALLED BY: league_thresholds
+
+    :param weighted_seed_diff - the weighted difference in seeds between two teams.
+    :param level_of_randomness - an integer representing the level of randomness in the game (1 to 4).
+
+    :return: a list of two numbers (see win_probability above)
+    """
+    if level_of_randomness == 1:
+        if weighted_seed_diff >= 0.6:
+            win_probability = [80, 90]
+        elif weighted_seed_diff >= 0.2:
+            win_probability = [70, 85]
+        else:
+            win_probability = [60, 75]
+    elif level_of_randomness == 2:
+        if weighted_seed_diff >= 0.6:
+            win_probability = [70, 85]
+        elif weighted_seed_diff >= 0.2:
+            win_probability = [55, 75]
+        else:
+            win_probability = [45, 75]
+    elif level_of_randomness == 3:
+        if weighted_seed_diff >= 0.6:
+            win_probability = [60, 75]
+        elif weighted_seed_diff >= 0.2:
+            win_probability = [45, 70]
+        else:
+            win_probability = [38, 70]
+    else:
+        win_probability = [33, 67]
+    return win_probability
+
+
+def scale_factor(difference, option, lowest_seed):
+    """
+    Determines a scale factor used for deciding which team will win the game being simulated. If the randomly
+    generated number (1-100) in game_simulator is below sf, the favorite (better seed) will win but if it is above sf,
+    the underdog (lower seed) will win.
+
+    CALLS: none
+    CALLED BY: knockout_chances
+
+    :param: difference: The percent difference in seeds of the two teams playing.
+            - Equation = (worse seed - better seed) / lowest seed
+    :param: option: The option the user picked in the previous menu.
+    :param: lowest_seed: The seed of the worst team(s) in the bracket.
+
+    :return: sf: Scale factor used for deciding who will win the game in game_simulator.
+    :rtype: int
+    """
+    # Determines scale factor based on option and weighted difference. This can be thought of as assigning the
+    # better seed a [sf] % chance of winning the individual match-up.
+    if option == 1:
+        if difference >= .75:
+            sf = 99
+        elif 0.5 <= difference < 0.75:
+            sf = 90
+        elif 0.25 <= difference < 0.5:
+            sf = 82
+        else:
+            sf = 75
+    elif option == 2:
+        if difference >= .75:
+            sf = 88
+        elif 0.5 <= difference < 0.75:
+            sf = 80
+        elif 0.25 <= difference < 0.5:
+            sf = 72
+        else:
+            sf = 68
+    else:
+        if difference >= .75:
+            sf = 80
+        elif 0.5 <= difference < 0.75:
+            sf = 70
+        elif 0.25 <= difference < 0.5:
+            sf = 55
+        else:
+            sf = 50
+    # Adds 10 to the scale factor if the lowest seed is a 32 or higher. This is to ensure that with a higher variability
+    # of teams, the top teams still have a distinct advantage.
+    if lowest_seed >= 32:
+        sf += 10
+    # Subtracts 5 from the scale factor if the option is 1 or 2 and the lowest seed is 8 or smaller. This is to
+    # ensure that top teams aren't given a vastly disproportionate advantage.
+    elif lowest_seed <= 8:
+        if option in [1, 2]:
+            sf -= 5
+    return sf
+
+
+@lru_cache(maxsize=None)
+def league_thresholds(num_of_teams, level_of_randomness):
+    """
+    Computes the get_result thresholds for every possible seed difference in a league once, so play_game only has
+    to look them up. get_result only depends on the seed difference, the number of teams, and the level of
+    randomness, so a table indexed by seed difference holds every entry of the full seed x seed matrix.
+
+    CALLS: get_result
+    CALLED BY: play_game, monte_carlo.simulate_seasons, league_probability_matrix
+
+    :param num_of_teams - the total number of teams in the league.
+    :param level_of_randomness - an integer representing the level of randomness in the game (1 to 4).
+
+    :return: tuple where [seed difference] = (win ceiling, draw ceiling) for the better seed (see get_result)
+    """
+    return tuple(tuple(get_result(float(diff / num_of_teams), level_of_randomness)) for diff in range(num_of_teams))
+
+
+@lru_cache(maxsize=None)
+def knockout_chances(bracket_size, level_of_randomness):
+    """
+    Computes the chance (out of 100) of the better seed winning a tournament game for every possible seed
+    difference in a bracket once, so game_simulator only has to look it up.
+
+    CALLS: scale_factor
+    CALLED BY: game_simulator, monte_carlo.simulate_playoffs, knockout_probability_matrix
+
+    :param bracket_size - the number of teams in the bracket.
+    :param level_of_randomness - an integer representing the level of randomness in the game (1 to 4).
+
+    :return: tuple where [seed difference] = chance for the better seed to win
+    """
+    # Every game is a 50/50 shot with option 4
+    if level_of_randomness == 4:
+        return (50,) * bracket_size
+    return tuple(scale_factor(diff / bracket_size, level_of_randomness, bracket_size) for diff in range(bracket_size))
+
+
+def league_probability_matrix(num_of_teams, level_of_randomness):
+    """
+    Builds the full seed x seed matrices of league game probabilities for analysis. Requires NumPy.
+
+    CALLS: league_thresholds
+
+    :return: win, draw, loss - num_of_teams x num_of_teams arrays where [i, j] is the chance that seed i + 1
+             wins/draws/loses against seed j + 1 (the diagonal is meaningless)
+    """
+    import numpy as np
+
+    thresholds = np.array(league_thresholds(num_of_teams, level_of_randomness)) / 100
+    seeds = np.arange(num_of_teams)
+    diffs = np.abs(seeds[:, None] - seeds[None, :])
+    better_wins = thresholds[diffs, 0]
+    draw = thresholds[diffs, 1] - better_wins
+    worse_wins = 1 - thresholds[diffs, 1]
+    row_is_better = seeds[:, None] < seeds[None, :]
+    return np.where(row_is_better, better_wins, worse_wins), draw, np.where(row_is_better, worse_wins, better_wins)
+
+
+def knockout_probability_matrix(bracket_size, level_of_randomness):
+    """
+    Builds the full playoff seed x playoff seed matrix of tournament win probabilities for analysis. Requires NumPy.
+
+    CALLS: knockout_chances
+
+    :return: bracket_size x bracket_size array where [i, j] is the chance that seed i + 1 beats seed j + 1
+    """
+    import numpy as np
+
+    chances = np.array(knockout_chances(bracket_size, level_of_randomness)) / 100
+    seeds = np.arange(bracket_size)
+    diffs = np.abs(seeds[:, None] - seeds[None, :])
+    return np.where(seeds[:, None] < seeds[None, :], chances[diffs], 1 - chances[diffs])
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from monte_carlo import simulate_seasons, simulate_playoffs
+from SimulationTotals import SimulationTotals
+
+# Seasons per block. Each block always gets the same random stream, which is what keeps results identical no matter
+# how many workers the blocks are spread across.
+BLOCK_SIZE = 2000
+
+
+def run_parallel(teams_dictionary, rounds, level_of_randomness, num_of_seasons, seed=None, bracket_size=0,
+                 bracket_randomness=None, workers=None, match_model=None):
+    """
+    Shards num_of_seasons independent season (+ tournament) simulations across a process pool. Seasons are split
+    into fixed-size blocks and block k always draws from the stream SeedSequence(seed, spawn_key=(k,)), so a given
+    master seed gives bit-identical totals for any number of workers. Workers only send back counts and sums, never
+    Team or Game objects.
+
+    CALLS: simulate_blocks
+    CALLED BY: none
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins are to be played
+    :param: level_of_randomness - int suggesting how random the season is to be
+    :param: num_of_seasons - int representing how many seasons are simulated
+    :param: seed - master seed (None picks one, which can be read back from the result)
+    :param: bracket_size - number of teams in the end-of-season tournament (0 for no tournament)
+    :param: bracket_randomness - level of randomness for the tournament (defaults to level_of_randomness)
+    :param: workers - number of worker processes (defaults to the number of cores)
+    :param: match_model - MatchModel deciding every league game (None for SeedModel at level_of_randomness)
+
+    :return: SimulationTotals holding the combined counts of every block
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    if bracket_randomness is None:
+        bracket_randomness = level_of_randomness
+    if workers is None:
+        workers = os.cpu_count() or 1
+    names = sorted(teams_dictionary, key=teams_dictionary.get)
+    num_of_blocks = -(-num_of_seasons // BLOCK_SIZE)
+    workers = max(1, min(workers, num_of_blocks))
+
+    # Every worker gets one contiguous shard of blocks
+    shards = [range(num_of_blocks * i // workers, num_of_blocks * (i + 1) // workers) for i in range(workers)]
+    args = [(teams_dictionary, rounds, level_of_randomness, num_of_seasons, seed, shard, bracket_size,
+             bracket_randomness, match_model) for shard in shards]
+    if workers == 1:
+        partials = [simulate_blocks(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(simulate_blocks, *zip(*args)))
+
+    totals = SimulationTotals(names, seed, 0, np.zeros((len(names), len(names)), dtype=np.int64),
+                              np.zeros(len(names), dtype=np.int64), np.zeros(len(names), dtype=np.int64))
+    for partial in partials:
+        totals += partial
+    return totals
+
+
+def simulate_blocks(teams_dictionary, rounds, level_of_randomness, num_of_seasons, seed, blocks, bracket_size,
+                    bracket_randomness, match_model=None):
+    """
+    Simulates one worker's shard of blocks and reduces them to counts and sums.
+
+    CALLS: monte_carlo.simulate_seasons, monte_carlo.simulate_playoffs
+    CALLED BY: run_parallel
+
+    :param: num_of_seasons - total number of seasons in the whole run (the last block may be cut short)
+    :param: blocks - range of block numbers this worker simulates
+
+    :return: SimulationTotals for this shard
+    """
+    names = sorted(teams_dictionary, key=teams_dictionary.get)
+    num_of_teams = len(names)
+    totals = SimulationTotals(names, seed, 0, np.zeros((num_of_teams, num_of_teams), dtype=np.int64),
+                              np.zeros(num_of_teams, dtype=np.int64), np.zeros(num_of_teams, dtype=np.int64))
+    for block in blocks:
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+        block_seasons = min(BLOCK_SIZE, num_of_seasons - block * BLOCK_SIZE)
+        season = simulate_seasons(teams_dictionary, rounds, level_of_randomness, block_seasons, rng,
+                                  match_model=match_model)
+        champion_counts = np.zeros(num_of_teams, dtype=np.int64)
+        if bracket_size != 0:
+            champions = simulate_playoffs(season.get_finishing_order(), bracket_size, bracket_randomness, rng)
+            champion_counts = np.bincount(champions, minlength=num_of_teams)
+        totals += SimulationTotals(names, seed, block_seasons, season.get_position_counts(),
+                                   season.get_points().sum(axis=0, dtype=np.int64), champion_counts)
+    return totals
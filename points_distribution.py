@@ -0,0 +1,95 @@
+import numpy as np
+from odds_tables import league_thresholds
+
+
+def points_distributions(teams_dictionary, rounds, level_of_randomness, chunk_size=256):
+    """
+    Computes every team's exact distribution of final points (no sampling). Each game is worth 0, 1, or 3 points
+    with fixed chances from league_thresholds, so a team's final points are the convolution of all of its games'
+    distributions. The convolutions are done as products in the Fourier domain: there are only a few distinct kinds
+    of game (one per get_result bucket and side of the seeding), so each team's spectrum is
+    exp(sum over kinds of games_of_kind * log(spectrum of kind)) and one inverse FFT gives its whole distribution.
+
+    CALLS: league_thresholds, game_kinds
+    CALLED BY: none
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins are to be played
+    :param: level_of_randomness - int suggesting how random the simulation is to be
+    :param: chunk_size - max number of teams whose spectra are held in memory at the same time
+
+    :return: names - team names in seed order
+             pmfs - teams x (max points + 1) array where pmfs[i, k] is the chance team i finishes with k points
+    """
+    names = sorted(teams_dictionary, key=teams_dictionary.get)
+    num_of_teams = len(names)
+    thresholds = np.array(league_thresholds(num_of_teams, level_of_randomness)) / 100
+    kind_chances, kind_counts = game_kinds(thresholds)
+
+    # No team can finish with more than max_points, so a circular convolution of this length never wraps around
+    size = 3 * (num_of_teams - 1) * rounds + 1
+    # z ** k is the spectrum of a game worth exactly k points
+    z = np.exp(-2j * np.pi * np.arange(size // 2 + 1) / size)
+    win, draw, loss = kind_chances.T
+    log_spectra = np.log(loss[:, None] + draw[:, None] * z + win[:, None] * z ** 3)
+    # A spectrum value of exactly 0 stays (practically) 0 for teams with games of that kind and doesn't turn into
+    # 0 * -inf for teams without any
+    log_spectra.real = np.maximum(log_spectra.real, -745)
+
+    pmfs = np.empty((num_of_teams, size))
+    for start in range(0, num_of_teams, chunk_size):
+        counts = kind_counts[start:start + chunk_size] * rounds
+        pmf = np.clip(np.fft.irfft(np.exp(counts @ log_spectra), n=size, axis=1), 0, None)
+        pmfs[start:start + chunk_size] = pmf / pmf.sum(axis=1, keepdims=True)
+    return names, pmfs
+
+
+def game_kinds(thresholds):
+    """
+    Sorts every game of a single round-robin into kinds with the same win/draw/loss chances.
+
+    CALLED BY: points_distributions
+
+    :param: thresholds - array where [seed difference] = (win ceiling, draw ceiling) as probabilities
+
+    :return: kind_chances - kinds x 3 array of (win, draw, loss) chances from the point of view of one team
+             kind_counts - teams x kinds array counting each team's games of each kind
+    """
+    num_of_teams = thresholds.shape[0]
+    # Seed differences with the same thresholds are the same get_result bucket
+    buckets, bucket_of_diff = np.unique(thresholds, axis=0, return_inverse=True)
+    bucket_of_diff = bucket_of_diff.ravel()
+    win_ceiling, draw_ceiling = buckets.T
+    # Kind 2 * b is being the better seed in bucket b, kind 2 * b + 1 is being the worse seed
+    kind_chances = np.empty((2 * len(buckets), 3))
+    kind_chances[0::2] = np.column_stack((win_ceiling, draw_ceiling - win_ceiling, 1 - draw_ceiling))
+    kind_chances[1::2] = np.column_stack((1 - draw_ceiling, draw_ceiling - win_ceiling, win_ceiling))
+
+    kind_counts = np.zeros((num_of_teams, len(kind_chances)))
+    seeds = np.arange(num_of_teams)
+    for team in range(num_of_teams):
+        opponents = np.delete(seeds, team)
+        kinds = 2 * bucket_of_diff[np.abs(opponents - team)] + (opponents < team)
+        kind_counts[team] = np.bincount(kinds, minlength=len(kind_chances))
+    return kind_chances, kind_counts
+
+
+def expected_points(pmfs):
+    """
+    :return: array of each team's expected final points
+    """
+    return pmfs @ np.arange(pmfs.shape[1])
+
+
+def points_at_least(pmfs, points):
+    """
+    :return: array of each team's chance of finishing with at least [points] points
+    """
+    return pmfs[:, points:].sum(axis=1)
+
+
+def points_survival(pmfs):
+    """
+    :return: teams x (max points + 1) array where [i, k] is team i's chance of finishing with at least k points
+    """
+    return np.cumsum(pmfs[:, ::-1], axis=1)[:, ::-1]
@@ -0,0 +1,104 @@
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# Returned by phase() while profiling is off, so an unprofiled run only pays for one attribute check
+NO_PHASE = nullcontext()
+
+
+class Profiler:
+
+    def __init__(self):
+        """
+        Collects per-phase timings, hot-path counters, and memory peaks for one run. Everything is a no-op until
+        enable() is called.
+
+        enabled = True while profiling
+        phases = dictionary in the format phase name : [calls, wall seconds, cpu seconds, peak traced bytes]
+        counters = dictionary in the format counter name : count
+        """
+        self.enabled = False
+        self.trace_memory = False
+        self.phases = {}
+        self.counters = {}
+
+    def enable(self, trace_memory=False):
+        """
+        :param trace_memory: True to also record each phase's peak Python allocations with tracemalloc (slower)
+        """
+        self.enabled = True
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reset(self):
+        self.phases = {}
+        self.counters = {}
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def phase(self, name):
+        """
+        :return: context manager timing the code inside it as the named phase
+        """
+        if not self.enabled:
+            return NO_PHASE
+        return Phase(self, name)
+
+    def record_phase(self, name, wall, cpu, peak):
+        stats = self.phases.setdefault(name, [0, 0.0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += wall
+        stats[2] += cpu
+        stats[3] = max(stats[3], peak)
+
+    def report(self):
+        """
+        :return: dictionary of every phase, counter, and memory peak (JSON serializable)
+        """
+        phases = {}
+        for name, (calls, wall, cpu, peak) in self.phases.items():
+            phases[name] = {"calls": calls, "wall_seconds": wall, "cpu_seconds": cpu}
+            if self.trace_memory:
+                phases[name]["peak_traced_bytes"] = peak
+        memory = {}
+        try:
+            # Only on POSIX systems (not Windows)
+            import resource
+        except ImportError:
+            pass
+        else:
+            memory["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if self.trace_memory and tracemalloc.is_tracing():
+            memory["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        return {"phases": phases, "counters": dict(self.counters), "memory": memory}
+
+
+class Phase:
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        if self.profiler.trace_memory:
+            tracemalloc.reset_peak()
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        peak = tracemalloc.get_traced_memory()[1] if self.profiler.trace_memory else 0
+        self.profiler.record_phase(self.name, wall, cpu, peak)
+
+
+# Shared profiler used by the simulation code
+PROFILER = Profiler()
@@ -0,0 +1,92 @@
+from profiler import PROFILER
+
+
+def rank_table(final_obj_list, head_to_head=False):
+    """
+    Sorts the league table in place on points, goal difference (gd), most goals scored (gf), and least goals against
+    (ga) (in that order). Python's sort is stable and runs in O(n log n), so teams that are level on every criterion
+    keep the order they came in (seed order for a new season).
+
+    With head_to_head, teams still level on all four are then split by a mini-table of only the games they played
+    against each other (points, then gd, then gf).
+
+    CALLS: head_to_head_key
+    CALLED BY: simulate_season
+
+    :param: final_obj_list - list of all Team objects
+    :param: head_to_head - True to break remaining ties with the head-to-head mini-table
+
+    :return: final_obj_list (sorted)
+    """
+    final_obj_list.sort(key=table_key)
+    if head_to_head:
+        start = 0
+        # Each group of teams level on table_key is sorted on its own mini-table
+        while start < len(final_obj_list):
+            stop = start + 1
+            while stop < len(final_obj_list) and table_key(final_obj_list[stop]) == table_key(final_obj_list[start]):
+                stop += 1
+            if stop - start > 1:
+                if PROFILER.enabled:
+                    PROFILER.count("head_to_head_groups")
+                final_obj_list[start:stop] = sorted(final_obj_list[start:stop],
+                                                    key=head_to_head_key(final_obj_list[start:stop]))
+            start = stop
+    return final_obj_list
+
+
+def table_key(team):
+    """
+    CALLED BY: rank_table
+
+    :return: sort key for a Team (better teams sort first)
+    """
+    return -team.get_points(), -team.get_gd(), -team.get_gf(), team.get_ga()
+
+
+def head_to_head_key(tied_teams):
+    """
+    Builds the mini-table for a group of tied teams from the games they played against each other.
+
+    CALLED BY: rank_table
+
+    :param: tied_teams - list of Team objects level on table_key
+
+    :return: function giving each tied team's sort key in the mini-table
+    """
+    names = {team.get_team() for team in tied_teams}
+    mini_table = {}
+    for team in tied_teams:
+        points = gf = ga = 0
+        for game in team.get_game_list():
+            if game.get_team1() == team.get_team():
+                opponent, scored, conceded = game.get_team2(), game.get_team1_goals(), game.get_team2_goals()
+            else:
+                opponent, scored, conceded = game.get_team1(), game.get_team2_goals(), game.get_team1_goals()
+            if opponent in names:
+                gf += scored
+                ga += conceded
+                if scored > conceded:
+                    points += 3
+                elif scored == conceded:
+                    points += 1
+        mini_table[team.get_team()] = (-points, ga - gf, -gf)
+    return lambda team: mini_table[team.get_team()]
+
+
+def rank_seasons(pts, gf, ga):
+    """
+    Ranks many seasons at once on points, GD, GF, and GA with numpy.lexsort. Any teams still tied stay in seed
+    order. Requires NumPy.
+
+    CALLED BY: monte_carlo.simulate_seasons
+
+    :param: pts/gf/ga - seasons x teams arrays (columns in seed order)
+
+    :return: seasons x positions array of team indices (order[s, 0] won season s)
+    """
+    import numpy as np
+
+    seed_order = np.broadcast_to(np.arange(pts.shape[1]), pts.shape)
+    # np.lexsort uses the last key as the primary key
+    return np.lexsort((seed_order, ga, -gf, -(gf - ga), -pts), axis=-1)
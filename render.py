@@ -0,0 +1,161 @@
+import sys
+
+# Number of lines collected before they are written out in one call
+CHUNK_LINES = 4096
+
+
+def table_lines(final_obj_list, rounds, first=1, last=None):
+    """
+    Builds the league table one line at a time (header first). Only positions first through last are formatted,
+    so showing the top 20 of a 10,000-team table only formats 20 rows.
+
+    CALLED BY: format_table, write_table
+
+    :param: final_obj_list - final list of all Team objects in descending order of points
+    :param: rounds - int representing how many round-robins have been played
+    :param: first/last - first and last positions to include (starting at 1, last=None for the bottom of the table)
+
+    :return: generator of lines (without line breaks)
+    """
+    yield ""
+    yield ("       TEAM                                                     "
+           "GP       W         D        L       GF       GA       GD      PTS")
+    yield ("---------------------------------------------------------------------------"
+           "--------------------------------------------------------")
+    games_played = str((len(final_obj_list) - 1) * rounds)
+    row = "{:>3}. {:<50} {:>10} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8} {:>8}".format
+    if last is None or last > len(final_obj_list):
+        last = len(final_obj_list)
+    for position in range(max(first, 1), last + 1):
+        team = final_obj_list[position - 1]
+        yield row(position, team.get_team(), games_played, str(team.get_wins()), str(team.get_draws()),
+                  str(team.get_losses()), str(team.get_gf()), str(team.get_ga()), str(team.get_gd()),
+                  str(team.get_points()))
+
+
+def page_range(page, page_size):
+    """
+    :param: page - page number (starting at 1)
+    :param: page_size - number of teams on each page
+
+    :return: first and last position on the page (for table_lines)
+    """
+    return (page - 1) * page_size + 1, page * page_size
+
+
+def round_name(teams_left):
+    """
+    :return: name of a tournament round by how many teams are still in it
+    """
+    if teams_left >= 16:
+        return f"ROUND OF {teams_left}"
+    if teams_left == 8:
+        return "QUARTERFINALS"
+    if teams_left == 4:
+        return "SEMIFINALS"
+    return "CHAMPIONSHIP"
+
+
+def bracket_lines(bracket_result, compact=False):
+    """
+    Builds every round of a simulated tournament one line at a time. The full view puts each game in a bracket
+    shell with the winner to the right of it; the compact view is one line per game. Both list the first round byes
+    before the first round's games.
+
+    CALLED BY: format_bracket, write_bracket
+
+    :param: bracket_result - BracketResult returned by simulate_bracket
+    :param: compact - True for one line per game
+
+    :return: generator of lines (without line breaks)
+    """
+    for round_index, games in enumerate(bracket_result.get_rounds()):
+        teams_left = bracket_result.get_teams_left(round_index)
+        if compact:
+            yield f"{round_name(teams_left)}:"
+            if round_index == 0:
+                for team in bracket_result.get_byes():
+                    yield f"  {team.get_playoff_seed():>4}: {team.get_team():<30} (bye)"
+            for team1, team2, winner in games:
+                yield (f"  {team1.get_playoff_seed():>4}: {team1.get_team():<30} v {team2.get_playoff_seed():>4}: "
+                       f"{team2.get_team():<30} -> {winner.get_playoff_seed()}: {winner.get_team()}")
+            continue
+        yield ""
+        yield ""
+        yield f"{round_name(teams_left)}: "
+        if round_index == 0 and bracket_result.get_byes():
+            yield ""
+            for team in bracket_result.get_byes():
+                yield f"{team.get_playoff_seed()}: {team.get_team()} (bye)"
+        for team1, team2, winner in games:
+            yield ""
+            yield ""
+            yield f"{team1.get_playoff_seed()}: {team1.get_team()}"
+            yield "--------------------|"
+            yield "\t\t\t\t\t|"
+            yield f"\t\t\t\t\t|\t{winner.get_playoff_seed()}: {winner.get_team()}"
+            yield "\t\t\t\t\t|--------------------"
+            yield "\t\t\t\t\t|"
+            yield "--------------------|"
+            yield f"{team2.get_playoff_seed()}: {team2.get_team()}"
+    champion = bracket_result.get_champion()
+    runner_up = bracket_result.get_runner_up()
+    if not compact:
+        yield ""
+        yield ""
+    yield f"CHAMPION: {champion.get_playoff_seed()}: {champion.get_team()}"
+    yield f"RUNNER-UP: {runner_up.get_playoff_seed()}: {runner_up.get_team()}"
+
+
+def write_lines(lines, file=None, chunk_lines=CHUNK_LINES):
+    """
+    Writes lines to a file in large chunks instead of one write per line.
+
+    CALLED BY: write_table, write_bracket
+
+    :param: lines - iterable of lines (without line breaks)
+    :param: file - open text file to write to (None for the terminal)
+    :param: chunk_lines - number of lines joined into each write
+    """
+    if file is None:
+        file = sys.stdout
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_lines:
+            chunk.append("")
+            file.write("\n".join(chunk))
+            chunk = []
+    if chunk:
+        chunk.append("")
+        file.write("\n".join(chunk))
+
+
+def write_table(final_obj_list, rounds, file=None, first=1, last=None):
+    """
+    CALLS: table_lines, write_lines
+    CALLED BY: main.print_table
+    """
+    write_lines(table_lines(final_obj_list, rounds, first, last), file)
+
+
+def write_bracket(bracket_result, file=None, compact=False):
+    """
+    CALLS: bracket_lines, write_lines
+    CALLED BY: main.print_bracket
+    """
+    write_lines(bracket_lines(bracket_result, compact), file)
+
+
+def format_table(final_obj_list, rounds, first=1, last=None):
+    """
+    :return: the league table (see table_lines) as one string
+    """
+    return "\n".join(table_lines(final_obj_list, rounds, first, last)) + "\n"
+
+
+def format_bracket(bracket_result, compact=False):
+    """
+    :return: the tournament (see bracket_lines) as one string
+    """
+    return "\n".join(bracket_lines(bracket_result, compact)) + "\n"
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from Team import Team
+from main import simulate_season, simulate_bracket, season_summary
+from SimulationRNG import SimulationRNG
+
+# Part of every key, so results cached by an older version of the simulator are never reused
+KEY_VERSION = 1
+# Fraction of max_bytes the disk tier is trimmed down to once it goes over, so it isn't trimmed on every write
+DISK_LOW_WATER = 0.9
+
+
+class ResultCache:
+
+    def __init__(self, max_entries=1024, directory=None, max_bytes=64 * 1024 * 1024):
+        """
+        Two-tier cache of simulation results (JSON-ready dictionaries) by key (see simulation_keys). Lookups try the
+        in-memory tier first, then the disk tier; disk hits are moved back into memory. Both tiers drop their least
+        recently used results first. Cached dictionaries are shared, so callers must not change them.
+
+        max_entries = most results kept in memory
+        directory = folder for the disk tier (None for memory only); one JSON file per result, so it can be shared
+                    between processes and survives restarts
+        max_bytes = most bytes of results kept on disk
+        memory = OrderedDict of key : result, least recently used first
+        disk = OrderedDict of key : file size of every result on disk, least recently used first (file modification
+               times keep the order across restarts)
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.disk = OrderedDict()
+        self.disk_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            files = []
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+            for mtime, key, size in sorted(files):
+                self.disk[key] = size
+                self.disk_bytes += size
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        """
+        :return: cached result for key (None on a miss)
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.memory_hits += 1
+            return self.memory[key]
+        if key in self.disk:
+            try:
+                with open(self.path(key), "r", encoding="utf-8") as file:
+                    value = json.load(file)
+                os.utime(self.path(key))
+            except (OSError, ValueError):
+                # Removed (ex: by another process sharing the folder) or cut short
+                self.disk_bytes -= self.disk.pop(key)
+            else:
+                self.disk.move_to_end(key)
+                self.disk_hits += 1
+                self.remember(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """
+        Caches a result in both tiers.
+
+        CALLS: remember, evict_disk
+        """
+        self.remember(key, value)
+        if self.directory is None:
+            return
+        data = json.dumps(value).encode()
+        temporary = self.path(key) + f".{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(data)
+        # Readers only ever see a whole file
+        os.replace(temporary, self.path(key))
+        self.disk_bytes += len(data) - self.disk.pop(key, 0)
+        self.disk[key] = len(data)
+        if self.disk_bytes > self.max_bytes:
+            self.evict_disk()
+
+    def remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def evict_disk(self):
+        """
+        Deletes the least recently used results on disk until they take up at most DISK_LOW_WATER of max_bytes.
+        """
+        while self.disk and self.disk_bytes > self.max_bytes * DISK_LOW_WATER:
+            key, size = self.disk.popitem(last=False)
+            self.disk_bytes -= size
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        self.memory.clear()
+        for key in list(self.disk):
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+        self.disk.clear()
+        self.disk_bytes = 0
+
+    def get_stats(self):
+        return {"memory_entries": len(self.memory), "disk_entries": len(self.disk), "disk_bytes": self.disk_bytes,
+                "memory_hits": self.memory_hits, "disk_hits": self.disk_hits, "misses": self.misses}
+
+
+def hash_key(fields):
+    return hashlib.sha256(json.dumps(fields, separators=(",", ":")).encode()).hexdigest()
+
+
+def simulation_keys(teams_dictionary, rounds, level_of_randomness, seed, bracket_size=0, bracket_randomness=None,
+                    head_to_head=False):
+    """
+    Builds the cache keys of a simulation: a hash of the team table (team names in seed order), every simulation
+    parameter, and the seed. The season key leaves out the tournament, so the same league with a different (or
+    no) tournament reuses the cached season.
+
+    CALLED BY: cached_simulation, service.SimulationService.submit
+
+    :return: season key and simulation key (hex strings)
+    """
+    teams = sorted(teams_dictionary, key=teams_dictionary.get)
+    season_key = hash_key([KEY_VERSION, teams, rounds, level_of_randomness, bool(head_to_head), seed])
+    if bracket_size == 0:
+        return season_key, season_key
+    if bracket_randomness is None:
+        bracket_randomness = level_of_randomness
+    return season_key, hash_key([season_key, bracket_size, bracket_randomness])
+
+
+def season_part(summary):
+    """
+    :return: the regular season part of a simulation summary (without the tournament results)
+    """
+    return {name: value for name, value in summary.items() if name not in ("champion", "runner_up")}
+
+
+def bracket_from_season(cached_season, bracket_size, bracket_randomness, seed):
+    """
+    Simulates only the tournament of a simulation whose season was cached. The tournament only depends on the
+    final table and its own random stream (rng.spawn(1) of the seed), so it comes out the same as running the whole
+    simulation again.
+
+    CALLS: main.simulate_bracket
+    CALLED BY: cached_simulation, service.simulate_batch
+
+    :param: cached_season - season summary (see main.season_summary) of the same league and seed
+
+    :return: summary of the season and tournament
+    """
+    standings = [Team(team["team"], team["seed"]) for team in cached_season["standings"]]
+    bracket = simulate_bracket(standings, bracket_size, bracket_randomness, SimulationRNG(seed).spawn(1))
+    summary = dict(cached_season)
+    summary["champion"] = bracket.get_champion().get_team()
+    summary["runner_up"] = bracket.get_runner_up().get_team()
+    return summary
+
+
+def cached_simulation(cache, teams_dictionary, rounds, level_of_randomness, seed, bracket_size=0,
+                      bracket_randomness=None, head_to_head=False):
+    """
+    Returns the summary of a seeded simulation (the same as `python main.py --seed [seed] --output json`) from the
+    cache if it is there. If only the season is cached, only the tournament is simulated.
+
+    CALLS: simulation_keys, bracket_from_season, main.simulate_season, main.simulate_bracket, main.season_summary
+
+    :param: cache - ResultCache
+    :param: seed - master seed (results are only worth caching when they can be asked for again)
+
+    :return: dictionary of the results (see main.season_summary)
+    """
+    if bracket_randomness is None:
+        bracket_randomness = level_of_randomness
+    season_key, key = simulation_keys(teams_dictionary, rounds, level_of_randomness, seed, bracket_size,
+                                      bracket_randomness, head_to_head)
+    summary = cache.get(key)
+    if summary is not None:
+        return summary
+    cached_season = cache.get(season_key) if key != season_key else None
+    if cached_season is not None:
+        summary = bracket_from_season(cached_season, bracket_size, bracket_randomness, seed)
+    else:
+        rng = SimulationRNG(seed)
+        season = simulate_season(teams_dictionary, rounds, level_of_randomness, rng.spawn(0), head_to_head)
+        bracket = None
+        if bracket_size != 0:
+            bracket = simulate_bracket(season.get_standings(), bracket_size, bracket_randomness, rng.spawn(1))
+        summary = season_summary(season, bracket, seed=seed)
+        if key != season_key:
+            cache.put(season_key, season_part(summary))
+    cache.put(key, summary)
+    return summary
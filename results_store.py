@@ -0,0 +1,202 @@
+import os
+import struct
+import numpy as np
+
+MAGIC = b"LTSR"
+VERSION = 1
+STANDINGS = 1
+SCORES = 2
+# magic, version, kind, num_of_teams, num_of_games, rounds, level_of_randomness, seed, names length, header size
+HEADER = struct.Struct("<4sHHIIHHQII")
+# Record dtype of each kind of file (all little-endian)
+RECORD_DTYPES = {STANDINGS: np.dtype("<u2"), SCORES: np.dtype("u1")}
+# Appended to a results file's path for its list of shards
+SHARDS_SUFFIX = ".shards"
+
+
+class ResultsFile:
+
+    def __init__(self, path):
+        """
+        Opens an existing results file. Results files are a small header followed by fixed-width little-endian
+        records, one per season, so they can be appended to and read back with numpy.memmap without loading them.
+
+        Header (see HEADER): magic, version, kind, num_of_teams, num_of_games, rounds, level_of_randomness, seed of
+        the first run written, length of the team names, and the header size (records start there). The team names
+        (in seed order, UTF-8, one per line) follow the fixed part and are padded to a multiple of 8 bytes.
+
+        Every run appended to the file is a shard. [path].shards lists them, one per line, as "first season, number
+        of seasons, seed", so every shard can be reproduced (the header only has room for the first run's seed, and
+        only its low 64 bits).
+
+        Records:
+            STANDINGS - num_of_teams x uint16 per season: the finishing position (1 = champion) of each team,
+                        in seed order, so one team's finishes are one column
+            SCORES - num_of_games x 2 x uint8 per season: (home goals, away goals) of every game in the order
+                     monte_carlo.simulate_seasons plays them
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            fields = HEADER.unpack(file.read(HEADER.size))
+            magic, version, self.kind, self.num_of_teams, self.num_of_games, self.rounds, \
+                self.level_of_randomness, self.seed, names_length, self.header_size = fields
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} results file")
+            self.names = file.read(names_length).decode("utf-8").split("\n")
+        if self.kind == STANDINGS:
+            self.record_shape = (self.num_of_teams,)
+        else:
+            self.record_shape = (self.num_of_games, 2)
+        self.record_dtype = RECORD_DTYPES[self.kind]
+        self.record_size = int(np.prod(self.record_shape)) * self.record_dtype.itemsize
+
+    @staticmethod
+    def create(path, kind, names, rounds, level_of_randomness, seed=None):
+        """
+        Creates an empty results file and shard list (overwriting any at path).
+
+        :param kind: STANDINGS or SCORES
+        :param names: team names in seed order
+        :param seed: seed of the first run being written (None if unknown, stored as 0)
+        :return: ResultsFile
+        """
+        if seed is None:
+            seed = 0
+        num_of_games = len(names) * (len(names) - 1) // 2 * rounds
+        names_blob = "\n".join(names).encode("utf-8")
+        header_size = HEADER.size + len(names_blob)
+        header_size += -header_size % 8
+        header = HEADER.pack(MAGIC, VERSION, kind, len(names), num_of_games, rounds, level_of_randomness,
+                             seed % 2 ** 64, len(names_blob), header_size)
+        with open(path, "wb") as file:
+            file.write((header + names_blob).ljust(header_size, b"\0"))
+        open(path + SHARDS_SUFFIX, "w").close()
+        return ResultsFile(path)
+
+    def get_names(self):
+        return self.names
+
+    def get_num_of_seasons(self):
+        return (os.path.getsize(self.path) - self.header_size) // self.record_size
+
+    def check_compatible(self, names, rounds, level_of_randomness):
+        """
+        Raises ValueError unless a run with these settings can be appended to this file.
+        """
+        if list(names) != self.names or rounds != self.rounds or level_of_randomness != self.level_of_randomness:
+            raise ValueError(f"{self.path} holds a different league, number of rounds, or level of randomness")
+
+    def append(self, records):
+        """
+        Appends a seasons x record_shape array of records to the end of the file.
+        """
+        records = np.ascontiguousarray(records, dtype=self.record_dtype)
+        if records.shape[1:] != self.record_shape:
+            raise ValueError(f"records must have shape (seasons, {', '.join(map(str, self.record_shape))})")
+        with open(self.path, "ab") as file:
+            file.write(records.tobytes())
+
+    def add_shard(self, first_season, num_of_seasons, seed):
+        """
+        Records the seed of a run of num_of_seasons seasons appended starting at season first_season (from 0).
+        """
+        with open(self.path + SHARDS_SUFFIX, "a") as file:
+            file.write(f"{first_season} {num_of_seasons} {seed}\n")
+
+    def get_shards(self):
+        """
+        :return: list of (first season, number of seasons, seed) of every run appended to the file
+        """
+        try:
+            with open(self.path + SHARDS_SUFFIX, "r") as file:
+                return [tuple(int(field) for field in line.split()) for line in file if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def open_memmap(self):
+        """
+        :return: read-only seasons x record_shape numpy.memmap of every record (nothing is read until used)
+        """
+        return np.memmap(self.path, dtype=self.record_dtype, mode="r", offset=self.header_size,
+                         shape=(self.get_num_of_seasons(),) + self.record_shape)
+
+
+def open_or_create(path, kind, names, rounds, level_of_randomness, seed):
+    """
+    Opens the results file at path for appending another run, creating it first if it doesn't exist.
+
+    CALLED BY: save_monte_carlo
+    """
+    if os.path.exists(path):
+        results_file = ResultsFile(path)
+        if results_file.kind != kind:
+            raise ValueError(f"{path} holds a different kind of results")
+        results_file.check_compatible(names, rounds, level_of_randomness)
+        return results_file
+    return ResultsFile.create(path, kind, names, rounds, level_of_randomness, seed)
+
+
+def finishing_positions(finishing_order):
+    """
+    Converts seasons x positions arrays of team indices into seasons x teams arrays of finishing positions
+    (1 = champion).
+    """
+    positions = np.empty_like(finishing_order, dtype=np.uint16)
+    np.put_along_axis(positions, finishing_order, np.arange(1, finishing_order.shape[1] + 1, dtype=np.uint16),
+                      axis=1)
+    return positions
+
+
+def save_monte_carlo(teams_dictionary, rounds, level_of_randomness, num_of_seasons, standings_path,
+                     scores_path=None, seed=None):
+    """
+    Runs monte_carlo.simulate_seasons and appends every season's standings (and optionally every scoreline) to
+    results files chunk by chunk. Files that already exist must hold the same league, rounds, and level of
+    randomness, so shards from many runs can be collected in one file. Each run's seed is added to the files'
+    shard lists.
+
+    CALLS: open_or_create, finishing_positions, monte_carlo.simulate_seasons
+    CALLED BY: none
+
+    :param: standings_path - STANDINGS results file
+    :param: scores_path - SCORES results file (None to skip saving scorelines)
+    :param: seed - int seed of this run (None for fresh entropy; reusing a seed appends an exact copy of its shard)
+
+    :return: MonteCarloResult of this run (only its position counts and totals; every season is in the files)
+    """
+    from monte_carlo import simulate_seasons
+
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    names = sorted(teams_dictionary, key=teams_dictionary.get)
+    standings_file = open_or_create(standings_path, STANDINGS, names, rounds, level_of_randomness, seed)
+    scores_file = None
+    if scores_path is not None:
+        scores_file = open_or_create(scores_path, SCORES, names, rounds, level_of_randomness, seed)
+    first_season = standings_file.get_num_of_seasons()
+
+    def write_chunk(finishing_order, home_goals, away_goals):
+        standings_file.append(finishing_positions(finishing_order))
+        if scores_file is not None:
+            scores_file.append(np.stack((home_goals, away_goals), axis=-1))
+
+    result = simulate_seasons(teams_dictionary, rounds, level_of_randomness, num_of_seasons, seed,
+                              chunk_callback=write_chunk, keep_seasons=False)
+    standings_file.add_shard(first_season, num_of_seasons, seed)
+    if scores_file is not None:
+        scores_file.add_shard(first_season, num_of_seasons, seed)
+    return result
+
+
+def position_distribution(standings_path, team):
+    """
+    Scans one team's column of a STANDINGS file.
+
+    :param: team - name of the team
+
+    :return: array where [p - 1] is the chance the team finished in position p
+    """
+    results_file = ResultsFile(standings_path)
+    column = results_file.open_memmap()[:, results_file.get_names().index(team)]
+    counts = np.bincount(column, minlength=results_file.num_of_teams + 1)[1:]
+    return counts / max(len(column), 1)
@@ -0,0 +1,85 @@
+def num_of_matchdays(num_of_teams):
+    """
+    :return: number of matchdays in one round-robin (an odd number of teams adds a bye, so one extra matchday)
+    """
+    return num_of_teams - 1 if num_of_teams % 2 == 0 else num_of_teams
+
+
+def matchday_pairings(num_of_teams, matchday):
+    """
+    Builds one matchday of a single round-robin with the circle (Berger) method. One slot stays fixed while every
+    other team rotates one place per matchday, so across all matchdays each pair of teams meets exactly once. With
+    an odd number of teams the fixed slot is empty and whoever would play it has a bye.
+
+    Home and away are picked so every team alternates between them as much as possible (the fewest possible
+    back-to-back home or away games).
+
+    CALLED BY: round_fixtures
+
+    :param: num_of_teams - int
+    :param: matchday - which matchday of the round-robin (starting at 0)
+
+    :return: list of (home team index, away team index) for the matchday
+    """
+    slots = num_of_teams if num_of_teams % 2 == 0 else num_of_teams + 1
+    rotating = slots - 1
+    pairings = []
+    # The fixed slot (slots - 1) alternates home and away every matchday
+    if slots - 1 < num_of_teams:
+        if matchday % 2 == 0:
+            pairings.append((slots - 1, matchday))
+        else:
+            pairings.append((matchday, slots - 1))
+    for k in range(1, slots // 2):
+        team1 = (matchday + k) % rotating
+        team2 = (matchday - k) % rotating
+        if k % 2 == 1:
+            pairings.append((team1, team2))
+        else:
+            pairings.append((team2, team1))
+    return pairings
+
+
+def bye_team(num_of_teams, matchday):
+    """
+    :return: index of the team without a game on the matchday (None when every team plays)
+    """
+    if num_of_teams % 2 == 0:
+        return None
+    return matchday
+
+
+def round_fixtures(num_of_teams, round_num):
+    """
+    Yields the matchdays of one round-robin one at a time. Even numbered round-robins swap every home and away
+    team of the one before them.
+
+    CALLS: matchday_pairings
+    CALLED BY: season_fixtures, main.round_steps
+
+    :param: num_of_teams - int
+    :param: round_num - which round-robin (starting at 1)
+
+    :return: generator of (matchday, fixtures) with matchdays starting at 1 and fixtures a list of
+             (home team index, away team index)
+    """
+    for matchday in range(num_of_matchdays(num_of_teams)):
+        fixtures = matchday_pairings(num_of_teams, matchday)
+        if round_num % 2 == 0:
+            fixtures = [(away, home) for home, away in fixtures]
+        yield matchday + 1, fixtures
+
+
+def season_fixtures(num_of_teams, rounds):
+    """
+    Yields every matchday of a season of [rounds] round-robins. Only one matchday exists at a time, so memory is
+    O(num_of_teams) no matter how many teams or round-robins there are.
+
+    CALLS: round_fixtures
+    CALLED BY: what_if.remaining_fixtures
+
+    :return: generator of (round_num, matchday, fixtures) (see round_fixtures)
+    """
+    for round_num in range(1, rounds + 1):
+        for matchday, fixtures in round_fixtures(num_of_teams, round_num):
+            yield round_num, matchday, fixtures
@@ -0,0 +1,130 @@
+from functools import lru_cache
+from math import gcd
+
+# Values get_score has always picked goals from
+SCORE_TUPLE = (0,) * 19 + (1,) * 22 + (2,) * 11 + (3,) * 7 + (4,) * 2 + (5,)
+# Drawn games pick any value, losing teams can't score 5
+DRAW_GOALS = SCORE_TUPLE
+LOSER_GOALS = SCORE_TUPLE[:-1]
+
+
+def build_winner_tables():
+    """
+    Builds one lookup tuple per possible losing score so a winning score can be picked with a single random index.
+
+    Winning scores used to be picked from SCORE_TUPLE[19:] and, if they didn't beat the loser, re-picked from
+    SCORE_TUPLE[20:] until they did. For a losing score l that gives every k > l the exact probability
+        c1(k) / 43 + (c1(<= l) / 43) * c2(k) / c2(> l)
+    where c1/c2 count the k's in SCORE_TUPLE[19:]/SCORE_TUPLE[20:]. Multiplying through by 43 * c2(> l) turns these
+    into whole-number weights, so each tuple repeats k exactly weight(k) times.
+
+    CALLED BY: score_sampler (on import)
+
+    :return: tuple where [losing score] = tuple of winning scores to pick from uniformly
+    """
+    first_pick = SCORE_TUPLE[19:]
+    re_pick = SCORE_TUPLE[20:]
+    tables = []
+    for losing_goals in range(max(LOSER_GOALS) + 1):
+        still_losing = sum(1 for goals in first_pick if goals <= losing_goals)
+        winning_re_picks = sum(1 for goals in re_pick if goals > losing_goals)
+        weights = {}
+        for goals in sorted(set(first_pick)):
+            if goals > losing_goals:
+                weights[goals] = first_pick.count(goals) * winning_re_picks + still_losing * re_pick.count(goals)
+        # Shrinks the tuple as much as possible without changing any probability
+        divisor = 0
+        for weight in weights.values():
+            divisor = gcd(divisor, weight)
+        table = ()
+        for goals, weight in weights.items():
+            table += (goals,) * (weight // divisor)
+        tables.append(table)
+    return tuple(tables)
+
+
+WINNER_GOALS = build_winner_tables()
+
+
+def sample_draw_goals(rng):
+    """
+    Picks the goals each team scores in a drawn game.
+
+    CALLED BY: get_score
+
+    :param rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
+
+    :return: int
+    """
+    return DRAW_GOALS[rng.randint(0, len(DRAW_GOALS) - 1)]
+
+
+def sample_win_score(rng):
+    """
+    Picks the score of a game with a winner using exactly two random numbers (no re-picking).
+
+    CALLED BY: get_score
+
+    :param rng - source of random numbers (anything with randint, ex: SimulationRNG(seed))
+
+    :return: (winning team goals, losing team goals)
+    """
+    losing_goals = LOSER_GOALS[rng.randint(0, len(LOSER_GOALS) - 1)]
+    winner_table = WINNER_GOALS[losing_goals]
+    return winner_table[rng.randint(0, len(winner_table) - 1)], losing_goals
+
+
+@lru_cache(maxsize=None)
+def score_arrays():
+    """
+    Flattens the lookup tuples into NumPy arrays for the batch samplers. Requires NumPy.
+
+    CALLED BY: sample_draw_goals_batch, sample_win_scores_batch
+
+    :return: draw_goals, loser_goals, winner_goals, winner_starts, winner_lengths (arrays)
+    """
+    import numpy as np
+
+    winner_lengths = np.array([len(table) for table in WINNER_GOALS])
+    winner_starts = np.concatenate(([0], np.cumsum(winner_lengths)[:-1]))
+    return (np.array(DRAW_GOALS, dtype=np.int16), np.array(LOSER_GOALS, dtype=np.int16),
+            np.array(sum(WINNER_GOALS, ()), dtype=np.int16), winner_starts, winner_lengths)
+
+
+def sample_draw_goals_batch(shape, rng):
+    """
+    Vectorized sample_draw_goals. Requires NumPy.
+
+    CALLS: score_arrays
+    CALLED BY: monte_carlo.draw_scores
+
+    :param shape - shape (tuple) of the array of games
+    :param rng - numpy random Generator
+
+    :return: array of goals for each drawn game
+    """
+    draw_goals = score_arrays()[0]
+    return draw_goals[rng.integers(0, draw_goals.size, size=shape, dtype=draw_goals.dtype)]
+
+
+def sample_win_scores_batch(shape, rng):
+    """
+    Vectorized sample_win_score. One batch of uniform numbers picks every losing score and a second batch picks
+    every winning score from the table for that losing score. Requires NumPy.
+
+    CALLS: score_arrays
+    CALLED BY: monte_carlo.draw_scores
+
+    :param shape - shape (tuple) of the array of games
+    :param rng - numpy random Generator
+
+    :return: winning_goals, losing_goals - arrays for each game
+    """
+    import numpy as np
+
+    draw_goals, loser_goals, winner_goals, winner_starts, winner_lengths = score_arrays()
+    picks = rng.random((2,) + tuple(shape))
+    losing_goals = loser_goals[(picks[0] * loser_goals.size).astype(np.intp)]
+    winner_picks = (picks[1] * winner_lengths[losing_goals]).astype(np.intp)
+    winning_goals = winner_goals[winner_starts[losing_goals] + winner_picks]
+    return winning_goals, losing_goals
@@ -0,0 +1,532 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from main import simulate_season, simulate_bracket, season_summary
+from SimulationRNG import SimulationRNG
+from team_file import load_teams, TeamFileError
+from result_cache import ResultCache, simulation_keys, season_part, bracket_from_season
+
+# Longest a request waits for others to join its batch (seconds)
+BATCH_WINDOW = 0.005
+# Most requests in one batch
+MAX_BATCH = 256
+# Number of recent request latencies the percentiles are taken over
+LATENCY_WINDOW = 10000
+# Largest request body accepted (bytes)
+MAX_BODY = 1 << 20
+# Largest simulation accepted: teams, round-robins, and league games in one season
+MAX_TEAMS = 10000
+MAX_ROUNDS = 1000
+MAX_GAMES = 5_000_000
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+
+class RequestError(ValueError):
+
+    def __init__(self, status, reason):
+        """
+        status = HTTP status code to answer with
+        reason = what is wrong with the request
+        """
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+    def get_status(self):
+        return self.status
+
+    def get_reason(self):
+        return self.reason
+
+
+class SimulationService:
+
+    def __init__(self, workers=None, batch_window=BATCH_WINDOW, max_batch=MAX_BATCH, cache=None, teams_dir=None):
+        """
+        Queues simulation requests and runs them on a process pool. Requests waiting at the same time that share a
+        league (same teams, rounds, randomness, and head-to-head setting) are sent to a worker together as one
+        batch, so the teams are only sent once and requests with the same seed share one simulated season.
+
+        workers = number of worker processes (defaults to the number of cores)
+        batch_window = longest a request waits for others to join its batch (seconds)
+        max_batch = most requests in one batch
+        cache = ResultCache answering repeated requests without simulating them again (None for no cache); a
+                request whose season is cached but whose tournament isn't only has its tournament simulated
+        teams_dir = folder "teams_file" requests are read from (None to only accept inline "teams")
+        queue = requests waiting for the dispatcher as (league key, job, future, time queued)
+        slots = limits the batches running at once to the number of workers, so waiting requests stay in the queue
+                (and can still be batched) instead of piling up inside the pool
+        latencies = seconds from queued to answered of the most recent requests that were simulated
+        cache_latencies = seconds to answer the most recent requests answered from the cache (kept apart, since
+                          they take microseconds and would hide how long simulations take)
+        pool_restarts = number of times a broken process pool (ex: a worker killed for running out of memory) was
+                        replaced
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.cache = cache
+        self.teams_dir = teams_dir
+        self.cache_hits = 0
+        self.executor = None
+        self.queue = None
+        self.slots = None
+        self.dispatcher = None
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.cache_latencies = deque(maxlen=LATENCY_WINDOW)
+        self.pool_restarts = 0
+
+    async def start(self):
+        self.executor = self.new_executor()
+        self.queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(self.workers)
+        self.dispatcher = asyncio.get_running_loop().create_task(self.dispatch())
+
+    def new_executor(self):
+        # Forked workers would inherit (and hold open) whatever connections the server had open when they started
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def replace_executor(self, broken):
+        """
+        Swaps a broken process pool for a new one, so one crashed worker doesn't fail every later request. Batches
+        that were running on the broken pool all see it break, so only the first one to get here replaces it.
+        """
+        if self.executor is broken:
+            self.pool_restarts += 1
+            self.executor = self.new_executor()
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    async def stop(self):
+        self.dispatcher.cancel()
+        try:
+            await self.dispatcher
+        except asyncio.CancelledError:
+            pass
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def submit(self, request):
+        """
+        Queues one simulation and waits for its result.
+
+        CALLS: load_request_teams, parse_simulation, result_cache.simulation_keys
+        CALLED BY: handle_connection
+
+        :param: request - dictionary read from the request's JSON body (see parse_simulation)
+
+        :return: dictionary of the results (see main.season_summary)
+        """
+        teams_dictionary = None
+        if isinstance(request, dict) and "teams_file" in request:
+            # Reading the file would block every other request, so it is read on a thread
+            teams_dictionary = await asyncio.get_running_loop().run_in_executor(None, load_request_teams,
+                                                                                self.teams_dir, request["teams_file"])
+        key, job = parse_simulation(request, teams_dictionary)
+        queued = time.perf_counter()
+        cached_season = None
+        # Requests without a seed get a random one, so their results will never be asked for again
+        use_cache = self.cache is not None and request.get("seed") is not None
+        if use_cache:
+            teams, rounds, level_of_randomness, head_to_head = key
+            seed, bracket_size, bracket_randomness = job
+            season_key, simulation_key = simulation_keys(dict(teams), rounds, level_of_randomness, seed,
+                                                         bracket_size, bracket_randomness, head_to_head)
+            result = self.cache.get(simulation_key)
+            if result is not None:
+                self.cache_hits += 1
+                self.cache_latencies.append(time.perf_counter() - queued)
+                return result
+            if season_key != simulation_key:
+                cached_season = self.cache.get(season_key)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting += 1
+        self.queue.put_nowait((key, job + (cached_season,), future, queued))
+        try:
+            result = await future
+        finally:
+            self.latencies.append(time.perf_counter() - queued)
+        if use_cache:
+            if season_key != simulation_key:
+                self.cache.put(season_key, season_part(result))
+            self.cache.put(simulation_key, result)
+        return result
+
+    async def dispatch(self):
+        """
+        Takes requests off the queue, gathers every request that arrives within batch_window of the first one, and
+        starts one batch per league.
+
+        CALLS: run_batch
+        CALLED BY: start
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            # Requests arriving during the window (and while every worker is busy) join this batch
+            await asyncio.sleep(self.batch_window)
+            await self.slots.acquire()
+            while not self.queue.empty() and len(pending) < self.max_batch:
+                pending.append(self.queue.get_nowait())
+            leagues = {}
+            for key, job, future, queued in pending:
+                leagues.setdefault(key, []).append((job, future))
+            self.waiting -= len(pending)
+            for i, (key, requests) in enumerate(leagues.items()):
+                if i > 0:
+                    await self.slots.acquire()
+                loop.create_task(self.run_batch(key, requests))
+
+    async def run_batch(self, key, requests):
+        """
+        Runs one league's batch on the process pool and answers every request in it. If the pool breaks, it is
+        replaced and the batch is tried once more on the new pool.
+
+        CALLS: simulate_batch, replace_executor
+        CALLED BY: dispatch
+        """
+        teams, rounds, level_of_randomness, head_to_head = key
+        jobs = [job for job, future in requests]
+        self.running += len(requests)
+        self.batches += 1
+        self.batched_requests += len(requests)
+        loop = asyncio.get_running_loop()
+        try:
+            for attempt in range(2):
+                executor = self.executor
+                try:
+                    results = await loop.run_in_executor(executor, simulate_batch, dict(teams), rounds,
+                                                         level_of_randomness, head_to_head, jobs)
+                    break
+                except BrokenProcessPool:
+                    self.replace_executor(executor)
+                    if attempt == 1:
+                        raise
+        except Exception as error:
+            self.failed += len(requests)
+            for job, future in requests:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            self.completed += len(requests)
+            for (job, future), result in zip(requests, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.running -= len(requests)
+            self.slots.release()
+
+    def get_stats(self):
+        """
+        :return: dictionary of queue depth, requests running, totals, and latency percentiles (milliseconds) over
+                 the most recent simulated requests and, separately, the most recent cache hits
+        """
+        return {"queue_depth": self.waiting, "running": self.running, "completed": self.completed,
+                "failed": self.failed, "batches": self.batches,
+                "mean_batch_size": self.batched_requests / self.batches if self.batches else 0,
+                "workers": self.workers, "pool_restarts": self.pool_restarts,
+                "latency_ms": latency_summary(self.latencies), "cache_hits": self.cache_hits,
+                "cache_latency_ms": latency_summary(self.cache_latencies),
+                "cache": None if self.cache is None else self.cache.get_stats()}
+
+
+def latency_summary(latencies):
+    """
+    :param: latencies - latencies in seconds
+
+    :return: dictionary of the p50/p90/p99/max latency in milliseconds
+    """
+    latencies = sorted(latencies)
+    summary = {f"p{p}": round(percentile(latencies, p) * 1000, 3) for p in (50, 90, 99)}
+    summary["max"] = round(latencies[-1] * 1000, 3) if latencies else 0
+    return summary
+
+
+def percentile(sorted_values, p):
+    """
+    :return: the p-th percentile of an ascending list by nearest rank (0 for an empty list)
+    """
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-p * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def integer_parameter(request, name, default):
+    """
+    :return: request[name] (or default if it isn't given), which must be a JSON integer (not a float or string)
+    """
+    value = request.get(name)
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RequestError(400, f"{name} must be an integer")
+    return value
+
+
+def load_request_teams(teams_dir, name):
+    """
+    Loads the teams file a request names. Only plain relative paths inside teams_dir are accepted, and errors don't
+    say anything about the file's contents, since the name comes from whoever sent the request.
+
+    CALLS: team_file.load_teams
+    CALLED BY: SimulationService.submit
+
+    :param: teams_dir - folder teams files are read from (None if the server doesn't read teams files)
+    :param: name - "teams_file" from the request
+
+    :return: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    """
+    if teams_dir is None:
+        raise RequestError(400, "this server doesn't read teams files (start it with --teams-dir), give 'teams'")
+    if not isinstance(name, str) or not name or os.path.isabs(name) or os.path.splitdrive(name)[0]:
+        raise RequestError(400, "teams_file must be a path relative to the server's teams folder")
+    if ".." in name.replace("\\", "/").split("/"):
+        raise RequestError(400, "teams_file must not contain '..'")
+    folder = os.path.realpath(teams_dir)
+    path = os.path.realpath(os.path.join(folder, name))
+    # A symbolic link inside the folder could still point outside it
+    if os.path.commonpath((folder, path)) != folder:
+        raise RequestError(400, "teams_file must be a path relative to the server's teams folder")
+    try:
+        return load_teams(path)
+    except TeamFileError:
+        raise RequestError(400, f"'{name}' is not a valid teams file") from None
+
+
+def parse_simulation(request, teams_dictionary=None):
+    """
+    Checks a simulation request, ex:
+        {"teams_file": "teams", "rounds": 2, "randomness": 2, "bracket_size": 8, "seed": 42}
+    "teams" (a dictionary of team name : seed) can be given instead of "teams_file". Only "teams"/"teams_file" is
+    required; the others default to 1 round, randomness 2, no tournament, and a random seed. "bracket_randomness"
+    and "head_to_head" work like the command line flags of the same names. Numbers must be integers, and leagues
+    are limited to MAX_TEAMS teams, MAX_ROUNDS round-robins, and MAX_GAMES games.
+
+    CALLS: integer_parameter
+    CALLED BY: SimulationService.submit
+
+    :param: teams_dictionary - teams loaded from the request's "teams_file" (see load_request_teams), None if it
+            gives "teams"
+
+    :return: league key (requests with the same key can share a batch) and job (seed, bracket size, bracket
+             randomness)
+    """
+    if not isinstance(request, dict):
+        raise RequestError(400, "request body must be a JSON object")
+    if teams_dictionary is None:
+        if not isinstance(request.get("teams"), dict) or len(request["teams"]) < 2:
+            raise RequestError(400, "give 'teams_file' or 'teams' (a dictionary of at least 2 team name : seed)")
+        teams_dictionary = {str(name): seed for name, seed in request["teams"].items()}
+        if any(isinstance(seed, bool) or not isinstance(seed, int) for seed in teams_dictionary.values()):
+            raise RequestError(400, "team seeds must be integers")
+        if sorted(teams_dictionary.values()) != list(range(1, len(teams_dictionary) + 1)):
+            raise RequestError(400, "team seeds must be 1, 2, 3... with none missing or repeated")
+    rounds = integer_parameter(request, "rounds", 1)
+    level_of_randomness = integer_parameter(request, "randomness", 2)
+    bracket_size = integer_parameter(request, "bracket_size", 0)
+    bracket_randomness = integer_parameter(request, "bracket_randomness", level_of_randomness)
+    seed = integer_parameter(request, "seed", None)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    head_to_head = bool(request.get("head_to_head", False))
+    num_of_teams = len(teams_dictionary)
+    if num_of_teams > MAX_TEAMS:
+        raise RequestError(400, f"at most {MAX_TEAMS} teams")
+    if not 1 <= rounds <= MAX_ROUNDS:
+        raise RequestError(400, f"rounds must be between 1 and {MAX_ROUNDS}")
+    if num_of_teams * (num_of_teams - 1) // 2 * rounds > MAX_GAMES:
+        raise RequestError(400, f"at most {MAX_GAMES} league games (teams x (teams - 1) / 2 x rounds)")
+    if level_of_randomness not in (1, 2, 3, 4) or bracket_randomness not in (1, 2, 3, 4):
+        raise RequestError(400, "randomness must be 1, 2, 3, or 4")
+    if bracket_size != 0 and not 2 <= bracket_size <= len(teams_dictionary):
+        raise RequestError(400, "bracket_size must be 0 or between 2 and the number of teams")
+    if seed < 0:
+        raise RequestError(400, "seed must not be negative")
+    teams = tuple(sorted(teams_dictionary.items(), key=lambda team: team[1]))
+    return (teams, rounds, level_of_randomness, head_to_head), (seed, bracket_size, bracket_randomness)
+
+
+def simulate_batch(teams_dictionary, rounds, level_of_randomness, head_to_head, jobs):
+    """
+    Runs in a worker process. Simulates a batch of requests for one league, giving the same results as
+    `python main.py --seed [seed] --output json` for each one. Requests with the same seed share one season, and
+    requests whose season was cached only simulate their tournament.
+
+    CALLS: main.simulate_season, main.simulate_bracket, main.season_summary, result_cache.bracket_from_season
+    CALLED BY: SimulationService.run_batch
+
+    :param: jobs - list of (seed, bracket size, bracket randomness, cached season summary or None)
+
+    :return: list of result dictionaries in the order of jobs
+    """
+    seasons = {}
+    results = []
+    for seed, bracket_size, bracket_randomness, cached_season in jobs:
+        if cached_season is not None and seed not in seasons:
+            results.append(bracket_from_season(cached_season, bracket_size, bracket_randomness, seed))
+            continue
+        rng = SimulationRNG(seed)
+        if seed not in seasons:
+            seasons[seed] = simulate_season(teams_dictionary, rounds, level_of_randomness, rng.spawn(0),
+                                            head_to_head)
+        season = seasons[seed]
+        bracket = None
+        if bracket_size != 0:
+            bracket = simulate_bracket(season.get_standings(), bracket_size, bracket_randomness, rng.spawn(1))
+        results.append(season_summary(season, bracket, seed=seed))
+    return results
+
+
+async def read_request(reader):
+    """
+    Reads one HTTP/1.1 request.
+
+    CALLED BY: handle_connection
+
+    :return: method, path, and body (bytes)
+    """
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise RequestError(400, "malformed request line")
+    method, path, version = request_line
+    length = 0
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, separator, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                length = int(value)
+            except ValueError:
+                raise RequestError(400, "bad Content-Length") from None
+    if length > MAX_BODY:
+        raise RequestError(413, "request body too large")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method, path.split("?")[0], body
+
+
+def write_response(writer, status, payload):
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+
+
+async def handle_connection(service, reader, writer):
+    """
+    Answers one request:
+        POST /simulate - runs a simulation (see parse_simulation) and returns its results
+        GET /stats - queue depth, batches, and latency percentiles
+        GET /health - {"status": "ok"}
+
+    CALLS: read_request, SimulationService.submit, write_response
+    CALLED BY: serve
+    """
+    try:
+        method, path, body = await read_request(reader)
+        if path == "/simulate":
+            if method != "POST":
+                raise RequestError(405, "use POST for /simulate")
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                raise RequestError(400, "request body is not valid JSON") from None
+            write_response(writer, 200, await service.submit(request))
+        elif path == "/stats" and method == "GET":
+            write_response(writer, 200, service.get_stats())
+        elif path == "/health" and method == "GET":
+            write_response(writer, 200, {"status": "ok"})
+        else:
+            raise RequestError(404, f"no endpoint {method} {path}")
+    except RequestError as error:
+        write_response(writer, error.get_status(), {"error": error.get_reason()})
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    except Exception as error:
+        write_response(writer, 500, {"error": str(error)})
+    try:
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+async def serve(host="127.0.0.1", port=8765, workers=None, batch_window=BATCH_WINDOW, cache=None, ready=None,
+                teams_dir=None):
+    """
+    Runs the simulation service until cancelled.
+
+    CALLS: SimulationService.start, handle_connection
+    CALLED BY: run_service
+
+    :param: cache - ResultCache for repeated requests (None for no cache)
+    :param: ready - asyncio.Event set once the service is accepting connections (None to skip)
+    :param: teams_dir - folder "teams_file" requests are read from (None to only accept inline "teams")
+    """
+    service = SimulationService(workers, batch_window, cache=cache, teams_dir=teams_dir)
+    await service.start()
+    server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer),
+                                        host, port)
+    try:
+        async with server:
+            if ready is not None:
+                ready.set()
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def run_service(args):
+    """
+    Starts the service from command line flags, ex:
+        python service.py --port 8765 --workers 4 --teams-dir .
+        curl -d '{"teams_file": "teams", "rounds": 2, "bracket_size": 8, "seed": 42}' localhost:8765/simulate
+
+    CALLS: serve, result_cache.ResultCache
+    CALLED BY: __main__
+    """
+    parser = argparse.ArgumentParser(description="Serve season and bracket simulations over local HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (localhost by default)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--workers", type=int, help="number of worker processes (defaults to the number of cores)")
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW * 1000,
+                        help="milliseconds a request waits for others to share its batch")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="seeded results kept in memory for repeated requests (0 for no cache)")
+    parser.add_argument("--cache-dir", help="folder to also cache results in on disk")
+    parser.add_argument("--cache-mb", type=float, default=64, help="most megabytes of results cached on disk")
+    parser.add_argument("--teams-dir", help="folder requests can name teams files in with \"teams_file\" "
+                                            "(without it, requests must give their teams inline)")
+    options = parser.parse_args(args)
+    if options.workers is not None and options.workers < 1:
+        parser.error("--workers must be at least 1")
+    if options.teams_dir is not None and not os.path.isdir(options.teams_dir):
+        parser.error(f"--teams-dir {options.teams_dir} is not a folder")
+    cache = None
+    if options.cache_size > 0:
+        cache = ResultCache(options.cache_size, options.cache_dir, int(options.cache_mb * 1024 * 1024))
+    try:
+        asyncio.run(serve(options.host, options.port, options.workers, options.batch_window / 1000, cache,
+                          teams_dir=options.teams_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    run_service(sys.argv[1:])
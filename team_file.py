@@ -0,0 +1,79 @@
+class TeamFileError(ValueError):
+
+    def __init__(self, file_path, line_number, reason):
+        """
+        file_path = path of the teams file that failed to load
+        line_number = line the problem was found on (None if it isn't tied to one line, ex: missing file)
+        reason = what is wrong with the file
+        """
+        self.file_path = file_path
+        self.line_number = line_number
+        self.reason = reason
+        if line_number is None:
+            super().__init__(f"{file_path}: {reason}")
+        else:
+            super().__init__(f"{file_path}, line {line_number}: {reason}")
+
+    def get_line_number(self):
+        return self.line_number
+
+    def get_reason(self):
+        return self.reason
+
+
+def load_teams(file_path, num_of_teams=None):
+    """
+    Reads and validates a file of seeded teams in one pass, in the format:
+        1: Team 1
+        2: Team 2
+    Seeds must run 1, 2, 3... in order and every team name must be unique (ignoring case, since team searches
+    ignore case). A UTF-8 byte order mark, Windows (CRLF) line endings, and blank lines at the end of the file are
+    all accepted. Team names may contain ":" (only the first one splits the seed from the name).
+
+    CALLED BY: main, run_headless
+
+    :param: file_path - path to the list of seeded teams
+    :param: num_of_teams - number of teams the file must hold (None to accept any number above 1)
+
+    :return: teams_dictionary - contains all teams in format [str(team name) : int(seed)] in seed order
+    """
+    teams_dictionary = {}
+    # Lowercase team name : line it was first seen on
+    seen = {}
+    blank_line = None
+    try:
+        # utf-8-sig drops a byte order mark if there is one and text mode turns CRLF into \n
+        with open(file_path, "r", encoding="utf-8-sig") as file:
+            for line_number, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line:
+                    if blank_line is None:
+                        blank_line = line_number
+                    continue
+                if blank_line is not None:
+                    raise TeamFileError(file_path, blank_line, "blank line between teams")
+                seed, separator, name = line.partition(":")
+                seed = seed.strip()
+                name = name.strip()
+                expected_seed = len(teams_dictionary) + 1
+                if not separator:
+                    raise TeamFileError(file_path, line_number, "expected 'seed: team name'")
+                if seed != str(expected_seed):
+                    raise TeamFileError(file_path, line_number, f"expected seed {expected_seed}, found '{seed}'")
+                if not name:
+                    raise TeamFileError(file_path, line_number, "missing team name")
+                key = name.casefold()
+                if key in seen:
+                    raise TeamFileError(file_path, line_number, f"'{name}' is already on line {seen[key]}")
+                seen[key] = line_number
+                teams_dictionary[name] = expected_seed
+    except OSError as error:
+        raise TeamFileError(file_path, None, error.strerror or str(error)) from error
+    except UnicodeDecodeError as error:
+        raise TeamFileError(file_path, None, "file is not UTF-8 text") from error
+
+    if num_of_teams is not None and len(teams_dictionary) != num_of_teams:
+        raise TeamFileError(file_path, None, f"expected {num_of_teams} teams, found {len(teams_dictionary)}")
+    if len(teams_dictionary) < 2:
+        raise TeamFileError(file_path, None, "a league needs at least 2 teams")
+    return teams_dictionary
@@ -0,0 +1,20 @@
+import pytest
+from bracket_odds import exact_bracket_odds
+from main import bracket_slots
+
+
+@pytest.mark.parametrize("bracket_size", [2, 3, 5, 6, 8, 12, 16, 20])
+@pytest.mark.parametrize("level_of_randomness", [1, 2, 3, 4])
+def test_every_round_sums_to_the_teams_in_it(bracket_size, level_of_randomness):
+    odds = exact_bracket_odds(bracket_size, level_of_randomness)
+    assert len(odds) == bracket_size
+    slots = bracket_slots(bracket_size)
+    rounds = len(odds[0])
+    assert all(len(row) == rounds and row[0] == 1 for row in odds)
+    # Exactly one team wins the tournament, and every later round holds half as many teams as the one before it
+    assert sum(row[-1] for row in odds) == pytest.approx(1)
+    for r in range(1, rounds):
+        assert sum(row[r] for row in odds) == pytest.approx(slots >> r)
+    for row in odds:
+        assert all(0 <= chance <= 1 for chance in row)
+        assert all(row[r] >= row[r + 1] for r in range(rounds - 1))
@@ -0,0 +1,32 @@
+import pytest
+from events import season_events
+from main import simulate_season, simulate_bracket
+from SimulationRNG import SimulationRNG
+
+TEAMS = {f"Team {seed}": seed for seed in range(1, 8)}
+
+
+@pytest.mark.parametrize("head_to_head", [False, True])
+def test_stream_holds_the_same_games_as_simulate_season(head_to_head):
+    rng = SimulationRNG(5)
+    season = simulate_season(TEAMS, 2, 2, rng, head_to_head)
+    bracket = simulate_bracket(season.get_standings(), 5, 3, rng)
+    log = season.get_standings()[0].get_game_log()
+    games = [(log.names[log.team1[row]], log.team1_goals[row], log.names[log.team2[row]], log.team2_goals[row],
+              bool(log.playoff[row])) for row in range(len(log))]
+
+    events = list(season_events(TEAMS, 2, 2, SimulationRNG(5), 5, 3, head_to_head))
+    assert [(event["team1"], event["team1_goals"], event["team2"], event["team2_goals"], event["playoff"])
+            for event in events if event["event"] == "game"] == games
+    standings = next(event for event in events if event["event"] == "season_completed")["standings"]
+    assert [team["team"] for team in standings] == [team.get_team() for team in season.get_standings()]
+    assert events[-1] == {"event": "tournament_completed", "champion": bracket.get_champion().get_team(),
+                          "runner_up": bracket.get_runner_up().get_team()}
+
+
+def test_every_matchday_and_round_is_reported():
+    events = list(season_events(TEAMS, 2, 2, SimulationRNG(1)))
+    matchdays = [event for event in events if event["event"] == "matchday_completed"]
+    # 7 teams: 7 matchdays per round-robin, each with one team on a bye
+    assert len(matchdays) == 14 and all(event["bye"] is not None for event in matchdays)
+    assert [event["round"] for event in events if event["event"] == "round_completed"] == [1, 2]
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from monte_carlo import simulate_seasons
+
+TEAMS = {f"Team {seed}": seed for seed in range(1, 9)}
+
+
+def test_totals_without_keeping_seasons_match():
+    kept = simulate_seasons(TEAMS, 2, 2, 5000, seed=7, chunk_size=700)
+    streamed = simulate_seasons(TEAMS, 2, 2, 5000, seed=7, chunk_size=700, keep_seasons=False)
+    assert streamed.get_num_of_seasons() == 5000
+    assert np.array_equal(kept.get_position_counts(), streamed.get_position_counts())
+    assert np.array_equal(kept.get_expected_points(), streamed.get_expected_points())
+    assert np.array_equal(kept.get_expected_gd(), streamed.get_expected_gd())
+    assert kept.get_expected_points() == pytest.approx(kept.get_points().mean(axis=0))
+    assert streamed.get_points() is None
+    with pytest.raises(ValueError):
+        streamed.get_gd_percentiles()
+
+
+def test_every_team_finishes_once_per_season():
+    result = simulate_seasons(TEAMS, 1, 3, 1000, seed=2)
+    assert (result.get_position_counts().sum(axis=0) == 1000).all()
+    assert (result.get_position_counts().sum(axis=1) == 1000).all()
+    assert all(sorted(order) == list(range(8)) for order in result.get_finishing_order().tolist())
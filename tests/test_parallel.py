@@ -0,0 +1,15 @@
+import numpy as np
+from parallel import run_parallel, BLOCK_SIZE
+
+TEAMS = {f"Team {seed}": seed for seed in range(1, 7)}
+
+
+def test_totals_do_not_depend_on_workers():
+    num_of_seasons = 2 * BLOCK_SIZE + 500
+    one = run_parallel(TEAMS, 2, 2, num_of_seasons, seed=11, bracket_size=4, workers=1)
+    many = run_parallel(TEAMS, 2, 2, num_of_seasons, seed=11, bracket_size=4, workers=3)
+    assert one.get_num_of_seasons() == many.get_num_of_seasons() == num_of_seasons
+    assert np.array_equal(one.get_position_counts(), many.get_position_counts())
+    assert np.array_equal(one.get_points_sum(), many.get_points_sum())
+    assert np.array_equal(one.get_champion_counts(), many.get_champion_counts())
+    assert one.get_champion_counts().sum() == num_of_seasons
@@ -0,0 +1,45 @@
+import numpy as np
+from Scenario import Scenario
+
+TEAMS = {"Arsenal": 1, "Chelsea": 2, "Everton": 3, "Fulham": 4}
+PLAYED = [("Arsenal", "Chelsea", 2, 1), ("Everton", "Fulham", 0, 0)]
+REMAINING = [("Arsenal", "Everton"), ("Chelsea", "Fulham"), ("Arsenal", "Fulham"), ("Chelsea", "Everton")]
+
+
+def table(result):
+    return (result.get_points().copy(), result.get_goal_difference().copy(), result.get_finishing_order().copy(),
+            result.get_position_counts().copy())
+
+
+def assert_same_table(first, second):
+    for before, after in zip(first, second):
+        assert np.array_equal(before, after)
+
+
+def test_set_then_clear_restores_the_table():
+    scenario = Scenario(TEAMS, 2, PLAYED, REMAINING, num_of_seasons=2000, seed=3)
+    before = table(scenario.get_result())
+    scenario.set_result("Chelsea", "Fulham", 3, 0)
+    changed = scenario.get_result()
+    assert (changed.get_points()[:, 1] >= before[0][:, 1] - 3).all()
+    assert ("Chelsea", "Fulham") not in scenario.get_remaining()
+    scenario.clear_result("Chelsea", "Fulham")
+    assert_same_table(before, table(scenario.get_result()))
+    assert ("Chelsea", "Fulham") in scenario.get_remaining()
+
+
+def test_result_set_before_simulating_matches_one_set_after():
+    early = Scenario(TEAMS, 2, PLAYED, REMAINING, num_of_seasons=2000, seed=3)
+    early.set_result("Arsenal", "Everton", 1, 1)
+    late = Scenario(TEAMS, 2, PLAYED, REMAINING, num_of_seasons=2000, seed=3)
+    late.get_result()
+    late.set_result("Arsenal", "Everton", 1, 1)
+    assert_same_table(table(early.get_result()), table(late.get_result()))
+
+
+def test_changing_a_played_game_can_be_undone():
+    scenario = Scenario(TEAMS, 2, PLAYED, REMAINING, num_of_seasons=2000, seed=3)
+    before = table(scenario.get_result())
+    scenario.set_result("Arsenal", "Chelsea", 0, 4)
+    scenario.set_result("Arsenal", "Chelsea", 2, 1)
+    assert_same_table(before, table(scenario.get_result()))
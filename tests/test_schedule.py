@@ -0,0 +1,37 @@
+import pytest
+from schedule import round_fixtures, bye_team, num_of_matchdays
+
+
+@pytest.mark.parametrize("num_of_teams", range(2, 17))
+def test_every_pair_meets_once_per_round_robin(num_of_teams):
+    for round_num in (1, 2):
+        pairs = []
+        matchdays = list(round_fixtures(num_of_teams, round_num))
+        assert [matchday for matchday, fixtures in matchdays] == list(range(1, num_of_matchdays(num_of_teams) + 1))
+        for matchday, fixtures in matchdays:
+            playing = [team for fixture in fixtures for team in fixture]
+            # Nobody plays twice on a matchday, and only the bye team sits out
+            assert len(playing) == len(set(playing))
+            sitting_out = set(range(num_of_teams)) - set(playing)
+            bye = bye_team(num_of_teams, matchday - 1)
+            assert sitting_out == (set() if bye is None else {bye})
+            pairs.extend(frozenset(fixture) for fixture in fixtures)
+        assert len(pairs) == num_of_teams * (num_of_teams - 1) // 2
+        assert len(set(pairs)) == len(pairs)
+
+
+@pytest.mark.parametrize("num_of_teams", range(2, 17))
+def test_home_and_away_are_balanced(num_of_teams):
+    home_games = [0] * num_of_teams
+    away_games = [0] * num_of_teams
+    for matchday, fixtures in round_fixtures(num_of_teams, 1):
+        for home, away in fixtures:
+            home_games[home] += 1
+            away_games[away] += 1
+    assert all(abs(home_games[team] - away_games[team]) <= 1 for team in range(num_of_teams))
+
+    # The second round-robin swaps every fixture, so each team hosts every other team exactly once
+    fixtures = [fixture for round_num in (1, 2) for matchday, matchday_fixtures in
+                round_fixtures(num_of_teams, round_num) for fixture in matchday_fixtures]
+    assert sorted(fixtures) == [(home, away) for home in range(num_of_teams) for away in range(num_of_teams)
+                                if home != away]
@@ -0,0 +1,86 @@
+from fractions import Fraction
+import numpy as np
+from score_sampler import (SCORE_TUPLE, DRAW_GOALS, LOSER_GOALS, WINNER_GOALS, sample_draw_goals, sample_win_score,
+                           score_arrays, sample_win_scores_batch, sample_draw_goals_batch)
+
+# The list get_score picked goals from before the lookup tables
+OLD_SCORES = [0] * 19 + [1] * 22 + [2] * 11 + [3] * 7 + [4] * 2 + [5]
+
+
+class ScriptedRNG:
+
+    def __init__(self, values):
+        """
+        Hands out the given values from randint, so every outcome of a sampler can be enumerated.
+        """
+        self.values = list(values)
+
+    def randint(self, low, high):
+        value = self.values.pop(0)
+        assert low <= value <= high
+        return value
+
+
+def old_win_score_distribution():
+    """
+    :return: exact dictionary of (winner goals, loser goals) : probability of the old rejection loop, where the loser
+             scores OLD_SCORES[randint(0, 60)], the winner OLD_SCORES[randint(19, 61)], and the winner is re-picked
+             from OLD_SCORES[randint(20, 61)] until it beats the loser
+    """
+    loser_picks = OLD_SCORES[:-1]
+    first_picks = OLD_SCORES[19:]
+    re_picks = OLD_SCORES[20:]
+    distribution = {}
+    for losing in set(loser_picks):
+        loser_chance = Fraction(loser_picks.count(losing), len(loser_picks))
+        rejected = Fraction(sum(1 for goals in first_picks if goals <= losing), len(first_picks))
+        winning_re_picks = [goals for goals in re_picks if goals > losing]
+        for winning in set(first_picks):
+            if winning > losing:
+                chance = (Fraction(first_picks.count(winning), len(first_picks))
+                          + rejected * Fraction(winning_re_picks.count(winning), len(winning_re_picks)))
+                distribution[winning, losing] = loser_chance * chance
+    return distribution
+
+
+def test_score_tuple_is_the_old_list():
+    assert list(SCORE_TUPLE) == OLD_SCORES
+
+
+def test_win_score_matches_old_rejection_loop_exactly():
+    distribution = {}
+    for i in range(len(LOSER_GOALS)):
+        losing = LOSER_GOALS[i]
+        for j in range(len(WINNER_GOALS[losing])):
+            score = sample_win_score(ScriptedRNG([i, j]))
+            chance = Fraction(1, len(LOSER_GOALS)) * Fraction(1, len(WINNER_GOALS[losing]))
+            distribution[score] = distribution.get(score, 0) + chance
+    assert distribution == old_win_score_distribution()
+    assert sum(distribution.values()) == 1
+
+
+def test_draw_goals_match_old_pick():
+    distribution = {}
+    for i in range(len(DRAW_GOALS)):
+        goals = sample_draw_goals(ScriptedRNG([i]))
+        distribution[goals] = distribution.get(goals, 0) + Fraction(1, len(DRAW_GOALS))
+    assert distribution == {goals: Fraction(OLD_SCORES.count(goals), len(OLD_SCORES)) for goals in set(OLD_SCORES)}
+
+
+def test_batch_arrays_match_lookup_tables():
+    draw_goals, loser_goals, winner_goals, winner_starts, winner_lengths = score_arrays()
+    assert draw_goals.tolist() == list(DRAW_GOALS)
+    assert loser_goals.tolist() == list(LOSER_GOALS)
+    for losing, table in enumerate(WINNER_GOALS):
+        start = winner_starts[losing]
+        assert winner_goals[start:start + winner_lengths[losing]].tolist() == list(table)
+
+
+def test_batch_samplers_stay_in_range():
+    rng = np.random.default_rng(0)
+    winning, losing = sample_win_scores_batch((1000, 50), rng)
+    assert winning.shape == losing.shape == (1000, 50)
+    assert (winning > losing).all()
+    assert losing.max() <= 4
+    draws = sample_draw_goals_batch((1000, 50), rng)
+    assert draws.min() >= 0 and draws.max() <= 5
@@ -0,0 +1,60 @@
+import pytest
+from service import RequestError, parse_simulation, load_request_teams, MAX_TEAMS, MAX_ROUNDS
+
+TEAMS = {"Arsenal": 1, "Chelsea": 2, "Everton": 3, "Fulham": 4}
+
+
+def status_of(request):
+    with pytest.raises(RequestError) as error:
+        parse_simulation(request)
+    return error.value.get_status()
+
+
+def test_valid_request_is_accepted():
+    key, job = parse_simulation({"teams": TEAMS, "rounds": 2, "bracket_size": 4, "seed": 42})
+    teams, rounds, level_of_randomness, head_to_head = key
+    assert dict(teams) == TEAMS and rounds == 2 and level_of_randomness == 2 and head_to_head is False
+    assert job == (42, 4, 2)
+
+
+@pytest.mark.parametrize("name, value", [("rounds", 1.5), ("rounds", "2"), ("rounds", True), ("seed", 1.7),
+                                         ("seed", "42"), ("randomness", 2.0), ("bracket_size", [4])])
+def test_non_integer_parameters_are_rejected(name, value):
+    assert status_of({"teams": TEAMS, name: value}) == 400
+
+
+@pytest.mark.parametrize("request_body", [
+    {"teams": TEAMS, "rounds": MAX_ROUNDS + 1},
+    {"teams": TEAMS, "rounds": 0},
+    {"teams": {f"Team {seed}": seed for seed in range(1, MAX_TEAMS + 2)}},
+    {"teams": {f"Team {seed}": seed for seed in range(1, 2001)}, "rounds": 3},
+    {"teams": TEAMS, "randomness": 5},
+    {"teams": TEAMS, "bracket_size": 5},
+    {"teams": TEAMS, "seed": -1},
+])
+def test_out_of_range_parameters_are_rejected(request_body):
+    assert status_of(request_body) == 400
+
+
+@pytest.mark.parametrize("request_body", [[], {"teams": {"Arsenal": 1}}, {"teams": {"Arsenal": 1, "Chelsea": 3}},
+                                          {"teams": {"Arsenal": 1, "Chelsea": 2.0}}, {"teams_file": "teams"}])
+def test_bad_teams_are_rejected(request_body):
+    assert status_of(request_body) == 400
+
+
+@pytest.mark.parametrize("name", ["/etc/passwd", "../teams", "countries/../../teams", "", 5, None])
+def test_teams_file_outside_the_folder_is_rejected(tmp_path, name):
+    with pytest.raises(RequestError) as error:
+        load_request_teams(str(tmp_path), name)
+    assert error.value.get_status() == 400
+
+
+def test_teams_file_errors_do_not_show_the_file(tmp_path):
+    (tmp_path / "secret").write_text("root:x:0:0\n")
+    with pytest.raises(RequestError) as error:
+        load_request_teams(str(tmp_path), "secret")
+    assert "root" not in error.value.get_reason()
+    (tmp_path / "league").write_text("1: Arsenal\n2: Chelsea\n")
+    assert load_request_teams(str(tmp_path), "league") == {"Arsenal": 1, "Chelsea": 2}
+    with pytest.raises(RequestError):
+        load_request_teams(None, "league")
@@ -0,0 +1,72 @@
+import json
+from collections import Counter
+from schedule import season_fixtures
+from team_file import load_teams
+from Scenario import Scenario
+
+
+def remaining_fixtures(teams_dictionary, rounds, played):
+    """
+    Works out which games of a season are still to be played. Every fixture of the full schedule is matched with a
+    played game between the same two teams (home and away included); fixtures without a match are remaining. In a
+    single round-robin each pair only meets once, so a played game with home and away the other way round from the
+    schedule still counts as that pair's fixture.
+
+    CALLS: schedule.season_fixtures
+    CALLED BY: load_scenario
+
+    :param: teams_dictionary - contains all teams in format [str(team name) : int(seed)]
+    :param: rounds - int representing how many round-robins the full season has
+    :param: played - list of (home team, away team, home goals, away goals) of every completed game
+
+    :return: list of (home team, away team) in schedule order
+
+    Raises ValueError if a played game doesn't match any fixture of the schedule (ex: a pair played too often)
+    """
+    names = list(teams_dictionary)
+    unmatched = Counter((home, away) for home, away, home_goals, away_goals in played)
+    remaining = []
+    for round_num, matchday, fixtures in season_fixtures(len(names), rounds):
+        for home, away in fixtures:
+            fixture = (names[home], names[away])
+            reverse = (names[away], names[home])
+            if unmatched[fixture] > 0:
+                unmatched[fixture] -= 1
+            elif rounds == 1 and unmatched[reverse] > 0:
+                unmatched[reverse] -= 1
+            else:
+                remaining.append(fixture)
+    for (home, away), count in unmatched.items():
+        if count > 0:
+            raise ValueError(f"played game {home} v {away} doesn't match any fixture left in the schedule")
+    return remaining
+
+
+def load_scenario(file_path, num_of_seasons=10000, seed=None):
+    """
+    Reads a season in progress from a JSON file, ex:
+        {"teams_file": "teams", "rounds": 2, "level_of_randomness": 2,
+         "played": [["Liverpool", "Arsenal", 2, 1], ...]}
+    "teams" (a dictionary of team name : seed) can be given instead of "teams_file", and "remaining" (a list of
+    [home team, away team]) instead of "rounds" when the remaining fixtures aren't the simulator's own schedule.
+
+    CALLS: team_file.load_teams, remaining_fixtures
+    CALLED BY: none
+
+    :return: Scenario ready to simulate the remaining fixtures
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        state = json.load(file)
+    if "teams_file" in state:
+        teams_dictionary = load_teams(state["teams_file"])
+    else:
+        teams_dictionary = state["teams"]
+    played = [tuple(game) for game in state.get("played", [])]
+    for home, away, home_goals, away_goals in played:
+        if home not in teams_dictionary or away not in teams_dictionary:
+            raise ValueError(f"{file_path}: unknown team in played game {home} v {away}")
+    if "remaining" in state:
+        remaining = [tuple(fixture) for fixture in state["remaining"]]
+    else:
+        remaining = remaining_fixtures(teams_dictionary, state["rounds"], played)
+    return Scenario(teams_dictionary, state.get("level_of_randomness", 2), played, remaining, num_of_seasons, seed)